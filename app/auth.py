@@ -1,15 +1,52 @@
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from fastapi import HTTPException, status
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from sqlalchemy import event, select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models import Admin, TokenBlacklist
+from app.revocation import revocation_cache
+from app.cache import TTLCache
+import asyncio
+import hashlib
 import os
+import threading
+import uuid
 
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# Resolved admins keyed by token digest, so repeat requests skip jwt.decode and the admin query.
+# Admin changes clear it only in the worker that made them; other workers see
+# them once the TTL runs out, so keep it as short as the revocation sync window.
+PRINCIPAL_CACHE_TTL_SECONDS = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "5"))
+PRINCIPAL_CACHE_MAXSIZE = int(os.getenv("PRINCIPAL_CACHE_MAXSIZE", "1024"))
+principal_cache = TTLCache(maxsize=PRINCIPAL_CACHE_MAXSIZE, ttl=PRINCIPAL_CACHE_TTL_SECONDS)
+
+# bcrypt runs on a dedicated bounded pool so it never blocks the event loop. Half the
+# cores at most, at a lower priority, so a login storm leaves CPU for other requests.
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(max(1, (os.cpu_count() or 2) // 2))))
+PASSWORD_HASH_NICE = int(os.getenv("PASSWORD_HASH_NICE", "10"))
+# One login hashing and one waiting per worker; more only queue up behind bcrypt
+LOGIN_CONCURRENCY_LIMIT = int(os.getenv("LOGIN_CONCURRENCY_LIMIT", str(PASSWORD_HASH_WORKERS * 2)))
+LOGIN_QUEUE_TIMEOUT_SECONDS = float(os.getenv("LOGIN_QUEUE_TIMEOUT_SECONDS", "2"))
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+def lower_thread_priority():
+    """Let request handling win the CPU over bcrypt (Linux nice applies per thread)"""
+    if hasattr(os, "setpriority"):
+        try:
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), PASSWORD_HASH_NICE)
+        except OSError:
+            pass
+
+password_executor = ThreadPoolExecutor(
+    max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash", initializer=lower_thread_priority
+)
+login_slots = asyncio.Semaphore(LOGIN_CONCURRENCY_LIMIT)
 
 def verify_password(plain_password, hashed_password):
     return pwd_context.verify(plain_password, hashed_password)
@@ -17,32 +54,107 @@ def verify_password(plain_password, hashed_password):
 def get_password_hash(password):
     return pwd_context.hash(password)
 
+async def verify_password_async(plain_password, hashed_password):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_executor, verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_executor, get_password_hash, password)
+
+@asynccontextmanager
+async def login_slot():
+    """Limit concurrent logins so a login flood cannot starve other requests"""
+    try:
+        await asyncio.wait_for(login_slots.acquire(), timeout=LOGIN_QUEUE_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many login attempts in progress, please retry",
+            headers={"Retry-After": "1"}
+        )
+    try:
+        yield
+    finally:
+        login_slots.release()
+
 def create_access_token(data: dict):
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
-def verify_token(token: str):
+def decode_token(token: str):
+    """Return the verified JWT payload, or None if the token is invalid or expired"""
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            return None
-        return email
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except JWTError:
         return None
 
-def authenticate_admin(db: Session, email: str, password: str):
-    admin = db.query(Admin).filter(Admin.email == email).first()
-    if not admin or not verify_password(password, admin.hashed_password):
+def get_token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+def get_token_jti(payload: dict, token: str) -> str:
+    # Tokens issued before jti was added are keyed by a digest of the token
+    return payload.get("jti") or get_token_digest(token)
+
+def verify_token(token: str):
+    payload = decode_token(token)
+    if payload is None:
+        return None
+    email: str = payload.get("sub")
+    if email is None:
+        return None
+    return email
+
+async def authenticate_admin(db: AsyncSession, email: str, password: str):
+    admin = await db.scalar(select(Admin).where(Admin.email == email))
+    if not admin:
         return None
+    async with login_slot():
+        if not await verify_password_async(password, admin.hashed_password):
+            return None
     return admin
 
-def is_token_blacklisted(db: Session, token: str):
-    return db.query(TokenBlacklist).filter(TokenBlacklist.token == token).first() is not None
+async def is_token_blacklisted(db: AsyncSession, jti: str):
+    if revocation_cache.enabled:
+        return await revocation_cache.contains(db, jti)
+    return await db.scalar(select(TokenBlacklist.id).where(TokenBlacklist.jti == jti)) is not None
+
+async def blacklist_token(db: AsyncSession, token: str):
+    payload = decode_token(token)
+    if payload is None:
+        # Invalid or already expired tokens are rejected anyway
+        return
+    
+    principal_cache.delete(get_token_digest(token))
+    jti = get_token_jti(payload, token)
+    expires_at = datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
+    if await db.scalar(select(TokenBlacklist.id).where(TokenBlacklist.jti == jti)) is None:
+        db.add(TokenBlacklist(jti=jti, expires_at=expires_at))
+        await db.commit()
+    revocation_cache.add(jti, expires_at)
+
+async def purge_expired_tokens(db: AsyncSession) -> int:
+    """Delete blacklist rows for tokens that have expired"""
+    result = await db.execute(
+        delete(TokenBlacklist).where(TokenBlacklist.expires_at <= datetime.now(timezone.utc))
+    )
+    await db.commit()
+    revocation_cache.purge()
+    return result.rowcount
+
+def cache_principal(token: str, admin: Admin, jti: str, exp: int):
+    """Cache a resolved admin for this token, never beyond the token's expiry"""
+    ttl = min(principal_cache.ttl, exp - datetime.now(timezone.utc).timestamp())
+    principal_cache.set(get_token_digest(token), (admin, jti), ttl=ttl)
+
+def get_cached_principal(token: str):
+    """Return (admin, jti) for a previously resolved token, or None"""
+    return principal_cache.get(get_token_digest(token))
 
-def blacklist_token(db: Session, token: str):
-    blacklisted_token = TokenBlacklist(token=token)
-    db.add(blacklisted_token)
-    db.commit()
\ No newline at end of file
+@event.listens_for(Admin, "after_update")
+@event.listens_for(Admin, "after_delete")
+def invalidate_principal_cache(mapper, connection, target):
+    """Drop cached principals after an admin changes in this process (others expire by TTL)"""
+    principal_cache.clear()
@@ -1,19 +1,30 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, or_
 from app.models import Complaint, ComplaintStatus
 from app.schemas import ComplaintsSummary, ComplaintsList, ComplaintResponse, ComplaintFilters, ComplaintStatusUpdate
+from app.rollups import change_status
+from app.dashboard_cache import dashboard_cache
+from app.search import plan_complaint_search
+from app.pagination import paginate
+from app.counts import count_rows
+from app.exports import ExportSpec, format_timestamp
 from typing import Optional
-import csv
-import io
-from fastapi.responses import StreamingResponse
 
-def get_complaints_summary(db: Session) -> ComplaintsSummary:
+async def get_complaints_summary(db: AsyncSession) -> ComplaintsSummary:
     """Get complaints summary for dashboard cards"""
-    total_complaints = db.query(Complaint).count()
-    pending_complaints = db.query(Complaint).filter(Complaint.status == "pending").count()
-    in_progress_complaints = db.query(Complaint).filter(Complaint.status == "in_progress").count()
-    resolved_complaints = db.query(Complaint).filter(Complaint.status == "resolved").count()
-    closed_complaints = db.query(Complaint).filter(Complaint.status == "closed").count()
+    total_complaints = await db.scalar(select(func.count()).select_from(Complaint))
+    pending_complaints = await db.scalar(
+        select(func.count()).select_from(Complaint).where(Complaint.status == "pending")
+    )
+    in_progress_complaints = await db.scalar(
+        select(func.count()).select_from(Complaint).where(Complaint.status == "in_progress")
+    )
+    resolved_complaints = await db.scalar(
+        select(func.count()).select_from(Complaint).where(Complaint.status == "resolved")
+    )
+    closed_complaints = await db.scalar(
+        select(func.count()).select_from(Complaint).where(Complaint.status == "closed")
+    )
     
     return ComplaintsSummary(
         total_complaints=total_complaints,
@@ -23,116 +34,78 @@ def get_complaints_summary(db: Session) -> ComplaintsSummary:
         closed_complaints=closed_complaints
     )
 
-def get_complaints_list(db: Session, filters: ComplaintFilters) -> ComplaintsList:
-    """Get paginated complaints list with search and filters"""
-    query = db.query(Complaint)
+def get_complaint_conditions(filters: ComplaintFilters) -> list:
+    """Build WHERE conditions shared by the complaints list and export"""
+    conditions = []
     
     # Apply search filter
     if filters.search:
-        search_term = f"%{filters.search}%"
-        query = query.filter(
-            or_(
-                Complaint.complainant_name.ilike(search_term),
-                Complaint.email.ilike(search_term),
-                Complaint.reference_id.ilike(search_term),
-                Complaint.subject.ilike(search_term)
-            )
-        )
+        conditions.append(plan_complaint_search(filters.search).condition)
     
     # Apply status filter
     if filters.status:
-        query = query.filter(Complaint.status == filters.status)
+        conditions.append(Complaint.status == filters.status)
     
     # Apply type filter
     if filters.type:
-        query = query.filter(Complaint.type == filters.type)
+        conditions.append(Complaint.type == filters.type)
     
-    # Get total count before pagination
-    total = query.count()
+    return conditions
+
+async def get_complaints_list(db: AsyncSession, filters: ComplaintFilters) -> ComplaintsList:
+    """Get paginated complaints list with search and filters"""
+    conditions = get_complaint_conditions(filters)
+    
+    # Get total count before pagination, in the list's count mode
+    count = await count_rows(db, "complaints", Complaint, conditions, filters.model_dump(), filters.count_mode)
     
     # Apply pagination
-    offset = (filters.page - 1) * filters.limit
-    complaints = query.order_by(Complaint.created_at.desc()).offset(offset).limit(filters.limit).all()
+    page = await paginate(db, Complaint, conditions, filters.page, filters.limit, filters.cursor)
     
     # Calculate total pages
-    total_pages = (total + filters.limit - 1) // filters.limit
+    total_pages = (count.total + filters.limit - 1) // filters.limit
     
     return ComplaintsList(
-        complaints=[ComplaintResponse.from_orm(complaint) for complaint in complaints],
-        total=total,
-        page=filters.page,
+        complaints=[ComplaintResponse.from_orm(complaint) for complaint in page.items],
+        total=count.total,
+        total_is_exact=count.exact,
+        page=page.page,
         limit=filters.limit,
-        total_pages=total_pages
+        total_pages=total_pages,
+        next_cursor=page.next_cursor,
+        prev_cursor=page.prev_cursor
     )
 
-def get_complaint_by_id(db: Session, complaint_id: int) -> Optional[Complaint]:
+async def get_complaint_by_id(db: AsyncSession, complaint_id: int) -> Optional[Complaint]:
     """Get complaint details by ID"""
-    return db.query(Complaint).filter(Complaint.id == complaint_id).first()
+    return await db.get(Complaint, complaint_id)
 
-def update_complaint_status(db: Session, complaint_id: int, status_update: ComplaintStatusUpdate) -> Optional[Complaint]:
+async def update_complaint_status(db: AsyncSession, complaint_id: int, status_update: ComplaintStatusUpdate) -> Optional[Complaint]:
     """Update complaint status and admin notes"""
-    complaint = db.query(Complaint).filter(Complaint.id == complaint_id).first()
+    complaint = await db.get(Complaint, complaint_id)
     if complaint:
-        complaint.status = status_update.status.value
         if status_update.admin_notes:
             complaint.admin_notes = status_update.admin_notes
-        db.commit()
-        db.refresh(complaint)
+        await change_status(db, complaint, status_update.status.value)
+        await db.commit()
+        dashboard_cache.invalidate("complaints")
+        await db.refresh(complaint)
     return complaint
 
-def export_complaints_csv(db: Session, filters: ComplaintFilters) -> StreamingResponse:
-    """Export filtered complaints as CSV"""
-    # Get all complaints matching filters (no pagination for export)
-    query = db.query(Complaint)
-    
-    # Apply same filters as get_complaints_list
-    if filters.search:
-        search_term = f"%{filters.search}%"
-        query = query.filter(
-            or_(
-                Complaint.complainant_name.ilike(search_term),
-                Complaint.email.ilike(search_term),
-                Complaint.reference_id.ilike(search_term),
-                Complaint.subject.ilike(search_term)
-            )
-        )
-    
-    if filters.status:
-        query = query.filter(Complaint.status == filters.status)
-    
-    if filters.type:
-        query = query.filter(Complaint.type == filters.type)
-    
-    complaints = query.order_by(Complaint.created_at.desc()).all()
-    
-    # Create CSV content
-    output = io.StringIO()
-    writer = csv.writer(output)
-    
-    # Write header
-    writer.writerow([
+def get_complaints_export(filters: ComplaintFilters) -> ExportSpec:
+    """Query and CSV columns of the complaints export"""
+    def build_statement(dialect: str):
+        return select(
+            Complaint.reference_id, Complaint.complainant_name, Complaint.email, Complaint.phone,
+            Complaint.type, Complaint.subject, Complaint.status, Complaint.created_at, Complaint.admin_notes
+        ).where(*get_complaint_conditions(filters)).order_by(Complaint.created_at.desc())
+    
+    header = [
         'Reference ID', 'Complainant Name', 'Email', 'Phone', 'Type',
         'Subject', 'Status', 'Created Date', 'Admin Notes'
-    ])
-    
-    # Write data
-    for complaint in complaints:
-        writer.writerow([
-            complaint.reference_id,
-            complaint.complainant_name,
-            complaint.email,
-            complaint.phone,
-            complaint.type,
-            complaint.subject,
-            complaint.status,
-            complaint.created_at.strftime('%Y-%m-%d %H:%M:%S'),
-            complaint.admin_notes or ''
-        ])
+    ]
     
-    output.seek(0)
+    def format_row(row) -> list:
+        return [*row[:-2], format_timestamp(row.created_at), row.admin_notes or '']
     
-    return StreamingResponse(
-        io.BytesIO(output.getvalue().encode('utf-8')),
-        media_type='text/csv',
-        headers={'Content-Disposition': 'attachment; filename=complaints_export.csv'}
-    )
\ No newline at end of file
+    return ExportSpec('complaints_export', header, build_statement, format_row)
@@ -0,0 +1,126 @@
+"""
+Total counts for the paginated admin lists
+
+Counting every match of a filtered search can cost more than fetching the
+page, so each list picks a count mode:
+
+- exact: COUNT(*) on every request
+- cached: exact when computed, kept in the dashboard cache under the
+  normalized filter set and invalidated by this process's write paths; it
+  can lag writes made elsewhere, so it is not reported as exact
+- estimated: planner statistics (pg_class.reltuples unfiltered, EXPLAIN row
+  estimate filtered); SQLite only keeps table sizes, from ANALYZE
+  (sqlite_stat1), and falls back to capped otherwise
+- capped: count at most LIST_COUNT_CAP rows; more shows as "10000+"
+
+The mode comes from LIST_COUNT_MODES for the list, else LIST_COUNT_MODE, and
+a request may override it with ?count=.
+"""
+from collections import namedtuple
+from sqlalchemy import select, func, text
+from app.dashboard_cache import dashboard_cache
+import json
+import os
+
+COUNT_MODES = ("exact", "cached", "estimated", "capped")
+
+def parse_count_modes(value: str) -> dict:
+    """"members=capped,donations=exact" to a dict"""
+    modes = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        name, _, mode = item.partition("=")
+        if mode.strip() not in COUNT_MODES:
+            raise ValueError(f"LIST_COUNT_MODES: {item.strip()!r} must be list=mode, mode one of {', '.join(COUNT_MODES)}")
+        modes[name.strip()] = mode.strip()
+    return modes
+
+# Paginated list totals
+LIST_COUNT_MODE = os.getenv("LIST_COUNT_MODE", "exact")
+LIST_COUNT_MODES = parse_count_modes(os.getenv("LIST_COUNT_MODES", ""))
+LIST_COUNT_CAP = int(os.getenv("LIST_COUNT_CAP", "10000"))
+
+if LIST_COUNT_MODE not in COUNT_MODES:
+    raise ValueError(f"LIST_COUNT_MODE must be one of {', '.join(COUNT_MODES)}")
+
+Count = namedtuple("Count", ["total", "exact"])
+
+def get_count_mode(list_name: str, requested: str = None) -> str:
+    return requested or LIST_COUNT_MODES.get(list_name, LIST_COUNT_MODE)
+
+def get_filter_key(filters: dict) -> tuple:
+    """Filters that decide the matching rows, without paging, in a stable order"""
+    key = []
+    for name, value in sorted(filters.items()):
+        if name in ("page", "limit", "cursor", "count_mode"):
+            continue
+        if isinstance(value, str):
+            value = value.strip() or None
+        if value is not None:
+            key.append((name, getattr(value, "value", value)))
+    return tuple(key)
+
+async def count_exact(db, model, conditions: list) -> int:
+    return await db.scalar(select(func.count()).select_from(model).where(*conditions))
+
+async def count_capped(db, model, conditions: list, cap: int = LIST_COUNT_CAP) -> Count:
+    # Stops reading after cap + 1 matches
+    matches = select(model.id).where(*conditions).limit(cap + 1).subquery()
+    total = await db.scalar(select(func.count()).select_from(matches))
+    return Count(cap, False) if total > cap else Count(total, True)
+
+async def estimate_count(db, model, conditions: list):
+    """Planner row estimate, or None when the database has no statistics to give"""
+    bind = db.get_bind()
+    table_name = model.__tablename__
+    if bind.dialect.name == "postgresql":
+        if not conditions:
+            # -1 (or 0 before PostgreSQL 14) until the table is first analyzed
+            reltuples = await db.scalar(
+                text("SELECT reltuples FROM pg_class WHERE oid = CAST(:table_name AS regclass)"),
+                {"table_name": table_name}
+            )
+            return int(reltuples) if reltuples and reltuples > 0 else None
+        statement = select(model.id).where(*conditions).compile(
+            dialect=bind.dialect, compile_kwargs={"literal_binds": True}
+        )
+        connection = await db.connection()
+        result = await connection.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {statement}", execution_options={"no_parameters": True}
+        )
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    
+    if bind.dialect.name == "sqlite" and not conditions:
+        has_stats = await db.scalar(text("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"))
+        if has_stats:
+            # First number of an index's stat is the number of rows it covers
+            stat = await db.scalar(
+                text("SELECT stat FROM sqlite_stat1 WHERE tbl = :table_name LIMIT 1"), {"table_name": table_name}
+            )
+            if stat:
+                return int(stat.split()[0])
+    return None
+
+async def count_rows(db, list_name: str, model, conditions: list, filters: dict, mode: str = None) -> Count:
+    """Total for a list page. list_name is also the dashboard cache tag its writes invalidate."""
+    mode = get_count_mode(list_name, mode)
+    if mode == "cached":
+        total = await dashboard_cache.get(
+            ("list-count", list_name) + get_filter_key(filters),
+            (list_name,),
+            lambda cache_db: count_exact(cache_db, model, conditions)
+        )
+        # May predate writes by other workers, or be served stale while it refreshes
+        return Count(total, False)
+    if mode == "estimated":
+        estimate = await estimate_count(db, model, conditions)
+        if estimate is not None:
+            return Count(estimate, False)
+        return await count_capped(db, model, conditions)
+    if mode == "capped":
+        return await count_capped(db, model, conditions)
+    return Count(await count_exact(db, model, conditions), True)
@@ -4,14 +4,16 @@ Sample data generator for complaints module testing
 """
 from sqlalchemy.orm import Session
 from app.database import SessionLocal, engine
-from app.models import Base, Complaint, ComplaintStatus, ComplaintType, Admin
+from app.migrations import upgrade
+from app.rollups import rebuild_rollups
+from app.models import Complaint, ComplaintStatus, ComplaintType, Admin
 from app.auth import get_password_hash
 from datetime import datetime, timedelta
 import random
 
 def create_complaints_sample_data():
     # Create tables
-    Base.metadata.create_all(bind=engine)
+    upgrade(engine)
     
     db = SessionLocal()
     
@@ -64,6 +66,10 @@ def create_complaints_sample_data():
     
     db.commit()
     db.close()
+    
+    # Sample rows bypass the API write paths, so recompute the dashboard rollups
+    with engine.begin() as conn:
+        rebuild_rollups(conn)
     print("Sample complaints data created successfully!")
     print("- 100 complaints with random data")
     print("- Mixed statuses: pending, in_progress, resolved, closed")
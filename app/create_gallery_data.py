@@ -4,7 +4,8 @@ Sample data generator for gallery module testing
 """
 from sqlalchemy.orm import Session
 from app.database import SessionLocal, engine
-from app.models import Base, Gallery, MediaType, Admin
+from app.migrations import upgrade
+from app.models import Gallery, MediaType, Admin
 from app.auth import get_password_hash
 from datetime import datetime, timedelta
 import random
@@ -13,7 +14,7 @@ from pathlib import Path
 
 def create_gallery_sample_data():
     # Create tables
-    Base.metadata.create_all(bind=engine)
+    upgrade(engine)
     
     db = SessionLocal()
     
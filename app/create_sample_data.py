@@ -4,7 +4,9 @@ Sample data generator for dashboard testing
 """
 from sqlalchemy.orm import Session
 from app.database import SessionLocal, engine
-from app.models import Base, Member, Donation, Complaint, DonationStatus, ComplaintStatus
+from app.migrations import upgrade
+from app.rollups import rebuild_rollups
+from app.models import Member, Donation, Complaint, DonationStatus, ComplaintStatus
 from app.auth import get_password_hash
 from app.models import Admin
 from datetime import datetime, timedelta
@@ -12,7 +14,7 @@ import random
 
 def create_sample_data():
     # Create tables
-    Base.metadata.create_all(bind=engine)
+    upgrade(engine)
     
     db = SessionLocal()
     
@@ -59,6 +61,10 @@ def create_sample_data():
     
     db.commit()
     db.close()
+    
+    # Sample rows bypass the API write paths, so recompute the dashboard rollups
+    with engine.begin() as conn:
+        rebuild_rollups(conn)
     print("Sample data created successfully!")
 
 if __name__ == "__main__":
@@ -1,161 +1,169 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func, extract, and_
-from datetime import datetime, timedelta
-from app.models import Member, Donation, Complaint, DonationStatus, ComplaintStatus
-from app.schemas import DashboardSummary, MonthlyTrend, DistrictDistribution
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, case, true, literal, union_all
+from datetime import date, timedelta
+from app.models import MemberDailyStats, DonationDailyStats, ComplaintDailyStats
+from app.schemas import DashboardSummary, MonthlyTrend, DistrictDistribution, DashboardOverview
+from app.dashboard_cache import dashboard_cache
+from app.members import get_members_summary
+from app.donations import get_donations_summary
+from app.complaints import get_complaints_summary
+from app.gallery import get_gallery_summary
+from app.rollups import get_current_month_start
 from typing import List
+import asyncio
 
-def get_dashboard_summary(db: Session) -> DashboardSummary:
-    # Current month start for growth calculation
-    current_month_start = datetime.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    
-    # Total members
-    total_members = db.query(Member).count()
-    
-    # Monthly growth (members joined this month)
-    members_growth = db.query(Member).filter(
-        Member.created_at >= current_month_start
-    ).count()
+async def get_dashboard_summary(db: AsyncSession) -> DashboardSummary:
+    # Current month start for growth calculation (rollup days are UTC)
+    current_month_start = get_current_month_start()
+    
+    # One pass over each daily rollup with conditional sums; SUM of nothing is
+    # NULL, hence the COALESCEs
+    member_stats = select(
+        func.coalesce(func.sum(MemberDailyStats.member_count), 0).label('total_members'),
+        func.coalesce(func.sum(case(
+            (MemberDailyStats.day >= current_month_start, MemberDailyStats.member_count), else_=0
+        )), 0).label('members_growth'),
+        func.coalesce(func.sum(MemberDailyStats.active_count), 0).label('active_members')
+    ).subquery('member_stats')
     
     # Total verified donations (updated for new donation status)
-    donation_stats = db.query(
-        func.sum(Donation.amount).label('total'),
-        func.count(Donation.id).label('count')
-    ).filter(Donation.status == "verified").first()
-    
-    total_donations = float(donation_stats.total or 0)
-    donation_count = donation_stats.count or 0
+    donation_stats = select(
+        func.sum(DonationDailyStats.amount_total).label('total_donations'),
+        func.sum(DonationDailyStats.donation_count).label('donation_count')
+    ).where(DonationDailyStats.status == "verified").subquery('donation_stats')
     
     # Complaint stats
-    total_complaints = db.query(Complaint).count()
-    pending_complaints = db.query(Complaint).filter(
-        Complaint.status == "pending"
-    ).count()
-    
-    # Active members (ID card generated)
-    active_members = db.query(Member).filter(
-        Member.id_card_generated == True
-    ).count()
+    complaint_stats = select(
+        func.coalesce(func.sum(ComplaintDailyStats.complaint_count), 0).label('total_complaints'),
+        func.coalesce(func.sum(case(
+            (ComplaintDailyStats.status == "pending", ComplaintDailyStats.complaint_count), else_=0
+        )), 0).label('pending_complaints')
+    ).subquery('complaint_stats')
+    
+    # Each subquery returns exactly one row, so joining them is a single round trip
+    # and every figure comes from the same snapshot
+    result = await db.execute(
+        select(member_stats, donation_stats, complaint_stats).select_from(
+            member_stats.join(donation_stats, true()).join(complaint_stats, true())
+        )
+    )
+    stats = result.one()
     
     return DashboardSummary(
-        total_members=total_members,
-        members_growth=members_growth,
-        total_donations=total_donations,
-        donation_count=donation_count,
-        total_complaints=total_complaints,
-        pending_complaints=pending_complaints,
-        active_members=active_members
+        total_members=stats.total_members,
+        members_growth=stats.members_growth,
+        total_donations=float(stats.total_donations or 0),
+        donation_count=stats.donation_count or 0,
+        total_complaints=stats.total_complaints,
+        pending_complaints=stats.pending_complaints,
+        active_members=stats.active_members
     )
 
-def get_monthly_trends(db: Session, months: int = 6) -> List[MonthlyTrend]:
-    # Calculate date range
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=months * 30)
-    
-    # Get monthly data for members
-    member_trends = db.query(
-        extract('year', Member.created_at).label('year'),
-        extract('month', Member.created_at).label('month'),
-        func.count(Member.id).label('members_joined')
-    ).filter(
-        Member.created_at >= start_date
-    ).group_by(
-        extract('year', Member.created_at),
-        extract('month', Member.created_at)
-    ).all()
-    
-    # Get monthly data for donations
-    donation_trends = db.query(
-        extract('year', Donation.created_at).label('year'),
-        extract('month', Donation.created_at).label('month'),
-        func.sum(Donation.amount).label('donations_received')
-    ).filter(
-        and_(
-            Donation.created_at >= start_date,
-            Donation.status == "verified"
-        )
-    ).group_by(
-        extract('year', Donation.created_at),
-        extract('month', Donation.created_at)
-    ).all()
-    
-    # Get monthly data for complaints
-    complaint_trends = db.query(
-        extract('year', Complaint.created_at).label('year'),
-        extract('month', Complaint.created_at).label('month'),
-        func.count(Complaint.id).label('complaints_raised')
-    ).filter(
-        Complaint.created_at >= start_date
-    ).group_by(
-        extract('year', Complaint.created_at),
-        extract('month', Complaint.created_at)
-    ).all()
-    
-    # Combine data by month/year
-    trends_dict = {}
-    
-    # Process member trends
-    for trend in member_trends:
-        key = (int(trend.year), int(trend.month))
-        trends_dict[key] = trends_dict.get(key, {
-            'year': int(trend.year),
-            'month': int(trend.month),
-            'members_joined': 0,
-            'donations_received': 0.0,
-            'complaints_raised': 0
-        })
-        trends_dict[key]['members_joined'] = trend.members_joined
+TREND_GRANULARITIES = ("day", "week", "month")
+
+MONTH_NAMES = [
+    'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+    'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'
+]
+
+def add_months(day: date, months: int) -> date:
+    """First day of the calendar month `months` away from day's month"""
+    month_index = day.year * 12 + day.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+def get_bucket_start(day: date, granularity: str) -> date:
+    if granularity == "month":
+        return day.replace(day=1)
+    if granularity == "week":
+        # ISO weeks start on Monday
+        return day - timedelta(days=day.weekday())
+    return day
+
+def get_next_bucket(bucket_start: date, granularity: str) -> date:
+    if granularity == "month":
+        return add_months(bucket_start, 1)
+    if granularity == "week":
+        return bucket_start + timedelta(days=7)
+    return bucket_start + timedelta(days=1)
+
+async def get_trends(db: AsyncSession, start: date, end: date, granularity: str = "month") -> List[MonthlyTrend]:
+    """Members joined, verified donations and complaints raised per bucket in [start, end)"""
+    start = get_bucket_start(start, granularity)
+    
+    # All three series in one round trip. Range predicates on the leading `day`
+    # column of each rollup primary key; bucketing happens below so the query
+    # is the same on PostgreSQL and SQLite
+    series = union_all(
+        select(
+            literal('members').label('series'),
+            MemberDailyStats.day.label('day'),
+            func.sum(MemberDailyStats.member_count).label('value')
+        ).where(
+            MemberDailyStats.day >= start, MemberDailyStats.day < end
+        ).group_by(MemberDailyStats.day),
+        select(
+            literal('donations'),
+            DonationDailyStats.day,
+            func.sum(DonationDailyStats.amount_total)
+        ).where(
+            DonationDailyStats.day >= start, DonationDailyStats.day < end,
+            DonationDailyStats.status == "verified"
+        ).group_by(DonationDailyStats.day),
+        select(
+            literal('complaints'),
+            ComplaintDailyStats.day,
+            func.sum(ComplaintDailyStats.complaint_count)
+        ).where(
+            ComplaintDailyStats.day >= start, ComplaintDailyStats.day < end
+        ).group_by(ComplaintDailyStats.day)
+    )
+    result = await db.execute(series)
     
-    # Process donation trends
-    for trend in donation_trends:
-        key = (int(trend.year), int(trend.month))
-        trends_dict[key] = trends_dict.get(key, {
-            'year': int(trend.year),
-            'month': int(trend.month),
-            'members_joined': 0,
-            'donations_received': 0.0,
-            'complaints_raised': 0
-        })
-        trends_dict[key]['donations_received'] = float(trend.donations_received or 0)
+    # Zero-filled buckets covering the whole range
+    buckets = {}
+    bucket_start = start
+    while bucket_start < end:
+        buckets[bucket_start] = {'members': 0, 'donations': 0.0, 'complaints': 0}
+        bucket_start = get_next_bucket(bucket_start, granularity)
     
-    # Process complaint trends
-    for trend in complaint_trends:
-        key = (int(trend.year), int(trend.month))
-        trends_dict[key] = trends_dict.get(key, {
-            'year': int(trend.year),
-            'month': int(trend.month),
-            'members_joined': 0,
-            'donations_received': 0.0,
-            'complaints_raised': 0
-        })
-        trends_dict[key]['complaints_raised'] = trend.complaints_raised
+    for series_name, day, value in result.all():
+        if isinstance(day, str):
+            # SQLite hands back the DATE column of a compound select as text
+            day = date.fromisoformat(day)
+        buckets[get_bucket_start(day, granularity)][series_name] += value or 0
     
-    # Convert to list and add month names
-    month_names = [
-        'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-        'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'
+    return [
+        MonthlyTrend(
+            month=MONTH_NAMES[bucket_start.month - 1],
+            year=bucket_start.year,
+            period_start=bucket_start,
+            period_end=get_next_bucket(bucket_start, granularity),
+            members_joined=data['members'],
+            donations_received=float(data['donations']),
+            complaints_raised=data['complaints']
+        )
+        for bucket_start, data in buckets.items()
     ]
-    
-    trends = []
-    for (year, month), data in sorted(trends_dict.items()):
-        trends.append(MonthlyTrend(
-            month=month_names[month - 1],
-            year=year,
-            members_joined=data['members_joined'],
-            donations_received=data['donations_received'],
-            complaints_raised=data['complaints_raised']
-        ))
-    
-    return trends
 
-def get_district_distribution(db: Session) -> List[DistrictDistribution]:
-    # Group members by district
-    district_data = db.query(
-        Member.district,
-        func.count(Member.id).label('member_count')
-    ).group_by(Member.district).order_by(
-        func.count(Member.id).desc()
-    ).all()
+async def get_monthly_trends(db: AsyncSession, months: int = 6, granularity: str = "month") -> List[MonthlyTrend]:
+    """Trends over the last N calendar months, including the current one"""
+    current_month_start = get_current_month_start()
+    return await get_trends(
+        db, add_months(current_month_start, 1 - months), add_months(current_month_start, 1), granularity
+    )
+
+async def get_district_distribution(db: AsyncSession) -> List[DistrictDistribution]:
+    # Group members by district (from the daily rollups)
+    member_count = func.sum(MemberDailyStats.member_count)
+    result = await db.execute(
+        select(
+            MemberDailyStats.district,
+            member_count.label('member_count')
+        ).group_by(MemberDailyStats.district).having(member_count > 0).order_by(
+            member_count.desc()
+        )
+    )
+    district_data = result.all()
     
     return [
         DistrictDistribution(
@@ -163,4 +171,35 @@ def get_district_distribution(db: Session) -> List[DistrictDistribution]:
             member_count=count
         )
         for district, count in district_data
-    ]
\ No newline at end of file
+    ]
+
+# Cache key, tables read and aggregate function of each overview section
+# (monthly_trends is keyed by its parameters, see get_dashboard_section)
+DASHBOARD_SECTIONS = {
+    "summary": (("dashboard-summary",), ("members", "donations", "complaints"), get_dashboard_summary),
+    "monthly_trends": None,
+    "district_distribution": (("district-distribution",), ("members",), get_district_distribution),
+    "members": (("members-summary",), ("members",), get_members_summary),
+    "donations": (("donations-summary",), ("donations",), get_donations_summary),
+    "complaints": (("complaints-summary",), ("complaints",), get_complaints_summary),
+    "gallery": (("gallery-summary",), ("gallery",), get_gallery_summary)
+}
+
+async def get_dashboard_section(section: str, months: int = 6, granularity: str = "month"):
+    """One dashboard section, served through the aggregate cache"""
+    if section == "monthly_trends":
+        return await dashboard_cache.get(
+            ("monthly-trends", months, granularity), ("members", "donations", "complaints"),
+            lambda db: get_monthly_trends(db, months, granularity)
+        )
+    key, tags, compute = DASHBOARD_SECTIONS[section]
+    return await dashboard_cache.get(key, tags, compute)
+
+async def get_dashboard_overview(sections: List[str], months: int = 6, granularity: str = "month") -> DashboardOverview:
+    """Requested sections computed concurrently.
+    
+    Every cache miss is recomputed on a session (and pool connection) of its
+    own, so the slowest section bounds the response time instead of the sum.
+    """
+    results = await asyncio.gather(*(get_dashboard_section(section, months, granularity) for section in sections))
+    return DashboardOverview(**dict(zip(sections, results)))
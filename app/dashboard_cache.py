@@ -0,0 +1,139 @@
+from app.database import AsyncSessionLocal
+from collections import Counter
+import asyncio
+import contextvars
+import os
+import time
+
+# Dashboard aggregate cache (summary cards, trends, district distribution)
+DASHBOARD_CACHE_ENABLED = os.getenv("DASHBOARD_CACHE_ENABLED", "true").lower() == "true"
+# Serve from memory for this long after a recompute
+DASHBOARD_CACHE_TTL_SECONDS = float(os.getenv("DASHBOARD_CACHE_TTL_SECONDS", "30"))
+# Then keep serving the old value for this long while one refresh runs in the background
+DASHBOARD_CACHE_STALE_SECONDS = float(os.getenv("DASHBOARD_CACHE_STALE_SECONDS", "300"))
+# List totals are cached per filter set, so bound the entry count (oldest computed go first)
+DASHBOARD_CACHE_MAX_ENTRIES = int(os.getenv("DASHBOARD_CACHE_MAX_ENTRIES", "5000"))
+
+class CacheEntry:
+    def __init__(self, value, fresh_until: float, stale_until: float, generations: dict):
+        self.value = value
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+        self.generations = generations
+
+class AggregateCache:
+    """Per-process cache of dashboard aggregates with stale-while-revalidate.
+    
+    Entries are tagged with the tables they are computed from ("members",
+    "donations", ...). The write paths call invalidate() after they commit,
+    which bumps the tag's generation so every entry computed before the write
+    is recomputed on its next read. At most one recomputation per key runs at
+    a time; concurrent readers await the same task.
+    
+    Only touched from the event loop, so it needs no lock. Other workers see
+    a write only when they recompute their own entry, so what they return can
+    be up to ttl + stale_ttl old: fresh for ttl, then served once more while
+    the refresh runs.
+    """
+    
+    def __init__(self, ttl: float = DASHBOARD_CACHE_TTL_SECONDS, stale_ttl: float = DASHBOARD_CACHE_STALE_SECONDS,
+                 enabled: bool = DASHBOARD_CACHE_ENABLED, max_entries: int = DASHBOARD_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self._entries = {}
+        self._refreshing = {}
+        self._generations = Counter()
+    
+    def _is_current(self, generations: dict) -> bool:
+        return all(self._generations[tag] == generation for tag, generation in generations.items())
+    
+    async def get(self, key: tuple, tags: tuple, compute):
+        """Cached result of `await compute(db)`, recomputed on a session of its own"""
+        if not self.enabled:
+            return await self._compute(compute)
+        
+        entry = self._entries.get(key)
+        if entry is not None and self._is_current(entry.generations):
+            now = time.monotonic()
+            if now < entry.fresh_until:
+                self.hits += 1
+                return entry.value
+            if now < entry.stale_until:
+                self.stale_hits += 1
+                self._start_refresh(key, tags, compute)
+                return entry.value
+        
+        self.misses += 1
+        # Shielded so a disconnecting client does not cancel a refresh others are waiting on
+        return await asyncio.shield(self._start_refresh(key, tags, compute))
+    
+    def _start_refresh(self, key: tuple, tags: tuple, compute) -> asyncio.Task:
+        refreshing = self._refreshing.get(key)
+        # A refresh that started before the latest write would return pre-write numbers
+        if refreshing is not None and self._is_current(refreshing[1]):
+            return refreshing[0]
+        
+        generations = {tag: self._generations[tag] for tag in tags}
+        # A fresh context: the refresh's queries are not part of the request that
+        # happened to trigger it, so they stay out of its query stats and Server-Timing
+        task = asyncio.create_task(self._refresh(key, generations, compute), context=contextvars.Context())
+        # Stale-hit refreshes have no awaiter; their errors are printed in _refresh
+        task.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self._refreshing[key] = (task, generations)
+        return task
+    
+    async def _refresh(self, key: tuple, generations: dict, compute):
+        try:
+            value = await self._compute(compute)
+            self.refreshes += 1
+            now = time.monotonic()
+            # Stored even if a write landed meanwhile; the generation check then treats it as a miss
+            self._entries.pop(key, None)
+            self._entries[key] = CacheEntry(value, now + self.ttl, now + self.ttl + self.stale_ttl, generations)
+            while len(self._entries) > self.max_entries:
+                del self._entries[next(iter(self._entries))]
+            return value
+        except Exception as e:
+            print(f"Failed to refresh dashboard cache {key}: {str(e)}")
+            raise
+        finally:
+            if self._refreshing.get(key, (None,))[0] is asyncio.current_task():
+                del self._refreshing[key]
+    
+    async def _compute(self, compute):
+        # Always the primary: a recompute triggered by a write must not read a lagging replica
+        async with AsyncSessionLocal() as db:
+            return await compute(db)
+    
+    def invalidate(self, *tags: str):
+        """Mark every entry computed from these tables as outdated (call after commit)"""
+        for tag in tags:
+            self._generations[tag] += 1
+    
+    def clear(self):
+        self._entries.clear()
+    
+    def stats(self) -> dict:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "ttl_seconds": self.ttl,
+            "stale_seconds": self.stale_ttl,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "refreshing": len(self._refreshing),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "hit_ratio": round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0
+        }
+
+# Singleton instance
+dashboard_cache = AggregateCache()
@@ -1,6 +1,13 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from fastapi import Request
+from app.cache import TTLCache
+from app.pool_metrics import InstrumentedAsyncQueuePool, instrument_engine
+from app.query_stats import instrument_queries, QUERY_STATS_ENABLED
+from app.slow_queries import instrument_slow_queries, SLOW_QUERY_LOG_ENABLED
+import hashlib
 import os
 from dotenv import load_dotenv
 
@@ -10,14 +17,81 @@ load_dotenv()
 # Get database URL from environment
 DATABASE_URL = os.getenv("DATABASE_URL")
 
+def get_async_database_url(url: str) -> str:
+    """Map a sync database URL onto its asyncio driver (asyncpg / aiosqlite)"""
+    if url.startswith("postgres://"):
+        url = "postgresql://" + url[len("postgres://"):]
+    for prefix in ("postgresql+psycopg2://", "postgresql://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    for prefix in ("sqlite+pysqlite://", "sqlite://"):
+        if url.startswith(prefix):
+            return "sqlite+aiosqlite://" + url[len(prefix):]
+    return url
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or get_async_database_url(DATABASE_URL)
+
+# Optional read replica for GET handlers and exports
+READ_REPLICA_URL = os.getenv("READ_REPLICA_URL")
+ASYNC_READ_REPLICA_URL = os.getenv("ASYNC_READ_REPLICA_URL") or (
+    get_async_database_url(READ_REPLICA_URL) if READ_REPLICA_URL else None
+)
+# After a write, the same client reads from the primary for this long (read-your-writes)
+REPLICA_STICKY_SECONDS = float(os.getenv("REPLICA_STICKY_SECONDS", "5"))
+READ_CONSISTENCY_HEADER = "X-Read-Consistency"
+
+# Connection pool sizing, shared by the sync and async engines
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "300"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+
+# Sync engine for scripts (init_admin.py, create_*_data.py) and schema management
 engine = create_engine(
     DATABASE_URL,
-    pool_pre_ping=True,
-    pool_recycle=300,
-    pool_size=10,
-    max_overflow=20
+    pool_pre_ping=DB_POOL_PRE_PING,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def create_api_engine(url: str, name: str, sync_url: str = None):
+    """Async engine used by the API so database round trips never block the event loop.
+    
+    sync_url points at the same database for the slow-query log's EXPLAIN runs.
+    """
+    api_engine = create_async_engine(
+        url,
+        # Explicit queue pool: aiosqlite would otherwise default to NullPool for file
+        # databases. The subclass records checkout waits for /admin/system/pool.
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_logging_name=name,
+        pool_pre_ping=DB_POOL_PRE_PING,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT
+    )
+    instrument_engine(api_engine)
+    if QUERY_STATS_ENABLED:
+        instrument_queries(api_engine)
+    if SLOW_QUERY_LOG_ENABLED:
+        instrument_slow_queries(api_engine, name, sync_url)
+    return api_engine
+
+async_engine = create_api_engine(ASYNC_DATABASE_URL, "primary", DATABASE_URL)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+# Without a replica configured, reads simply go to the primary
+replica_engine = create_api_engine(ASYNC_READ_REPLICA_URL, "replica", READ_REPLICA_URL) if ASYNC_READ_REPLICA_URL else async_engine
+AsyncReplicaSessionLocal = async_sessionmaker(replica_engine, autoflush=False, expire_on_commit=False)
+
+# Clients that wrote recently, keyed by a digest of their credentials
+recent_writers = TTLCache(maxsize=10000, ttl=REPLICA_STICKY_SECONDS)
+
 Base = declarative_base()
 
 def get_db():
@@ -25,4 +99,36 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+def get_client_key(request: Request) -> str:
+    credentials = request.headers.get("Authorization") or (request.client.host if request.client else "")
+    return hashlib.sha256(credentials.encode("utf-8")).hexdigest()
+
+def reads_from_primary(request: Request) -> bool:
+    """Whether this request must see the primary's latest writes"""
+    if replica_engine is async_engine:
+        return True
+    if request.headers.get(READ_CONSISTENCY_HEADER, "").lower() == "primary":
+        return True
+    return recent_writers.get(get_client_key(request)) is not None
+
+async def get_async_db(request: Request):
+    """Session on the primary, used for writes and authentication"""
+    if request.method not in ("GET", "HEAD", "OPTIONS"):
+        # Pin this client's reads to the primary until the replica catches up
+        recent_writers.set(get_client_key(request), True)
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def get_read_session_factory(request: Request):
+    """Replica session factory, unless the client needs read-your-writes.
+    
+    For responses that open their own session, e.g. streaming exports.
+    """
+    return AsyncSessionLocal if reads_from_primary(request) else AsyncReplicaSessionLocal
+
+async def get_read_db(request: Request):
+    """Session on the read replica, unless the client needs read-your-writes"""
+    async with get_read_session_factory(request)() as db:
+        yield db
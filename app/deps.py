@@ -1,39 +1,81 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from app.database import get_db
-from app.auth import verify_token, is_token_blacklisted
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db, AsyncSessionLocal
+from app.auth import (
+    decode_token, get_token_jti, is_token_blacklisted, cache_principal, get_cached_principal
+)
 from app.models import Admin
+from typing import Optional
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
-def get_current_admin(
+async def get_current_admin(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    token = credentials.credentials
+    return await authenticate_token(credentials.credentials, db)
+
+async def get_stream_token(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+    access_token: Optional[str] = Query(None, description="Bearer token, for EventSource clients that cannot send headers")
+) -> str:
+    """Authenticate a long-lived stream and return its token.
     
-    # Check if token is blacklisted
-    if is_token_blacklisted(db, token):
+    Uses a short session of its own: a yield dependency would hold a pooled
+    connection until the stream ends.
+    """
+    token = credentials.credentials if credentials else access_token
+    if not token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token has been revoked"
+            detail="Not authenticated"
         )
+    async with AsyncSessionLocal() as db:
+        await authenticate_token(token, db)
+    return token
+
+async def authenticate_token(token: str, db: AsyncSession) -> Admin:
+    # Serve repeat requests from the principal cache
+    cached = get_cached_principal(token)
+    if cached is not None:
+        admin, jti = cached
+        if await is_token_blacklisted(db, jti):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token has been revoked"
+            )
+        return admin
     
     # Verify token
-    email = verify_token(token)
+    payload = decode_token(token)
+    email = payload.get("sub") if payload else None
     if email is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token"
         )
     
+    # Check if token is blacklisted
+    jti = get_token_jti(payload, token)
+    if await is_token_blacklisted(db, jti):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked"
+        )
+    
     # Get admin from database
-    admin = db.query(Admin).filter(Admin.email == email).first()
+    admin = await db.scalar(select(Admin).where(Admin.email == email))
     if admin is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Admin not found"
         )
     
-    return admin
\ No newline at end of file
+    # Detach so the cached instance is not expired by later commits on this session
+    db.expunge(admin)
+    cache_principal(token, admin, jti, payload["exp"])
+    
+    return admin
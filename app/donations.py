@@ -1,23 +1,34 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, or_
 from app.models import Donation, DonationStatus
 from app.schemas import DonationsSummary, DonationsList, DonationResponse, DonationFilters
+from app.rollups import change_status
+from app.dashboard_cache import dashboard_cache
+from app.search import plan_donation_search
+from app.pagination import paginate
+from app.counts import count_rows
+from app.exports import ExportSpec, format_timestamp
 from typing import Optional
-import csv
-import io
-from fastapi.responses import StreamingResponse
 
-def get_donations_summary(db: Session) -> DonationsSummary:
+async def get_donations_summary(db: AsyncSession) -> DonationsSummary:
     """Get donations summary for dashboard cards"""
-    total_donations = db.query(Donation).count()
-    pending_donations = db.query(Donation).filter(Donation.status == "pending").count()
-    verified_donations = db.query(Donation).filter(Donation.status == "verified").count()
-    acknowledged_donations = db.query(Donation).filter(Donation.status == "acknowledged").count()
+    total_donations = await db.scalar(select(func.count()).select_from(Donation))
+    pending_donations = await db.scalar(
+        select(func.count()).select_from(Donation).where(Donation.status == "pending")
+    )
+    verified_donations = await db.scalar(
+        select(func.count()).select_from(Donation).where(Donation.status == "verified")
+    )
+    acknowledged_donations = await db.scalar(
+        select(func.count()).select_from(Donation).where(Donation.status == "acknowledged")
+    )
     
     # Total raised amount from verified AND acknowledged donations
-    total_raised = db.query(func.sum(Donation.amount)).filter(
-        or_(Donation.status == "verified", Donation.status == "acknowledged")
-    ).scalar() or 0.0
+    total_raised = await db.scalar(
+        select(func.sum(Donation.amount)).where(
+            or_(Donation.status == "verified", Donation.status == "acknowledged")
+        )
+    ) or 0.0
     
     return DonationsSummary(
         total_donations=total_donations,
@@ -27,114 +38,83 @@ def get_donations_summary(db: Session) -> DonationsSummary:
         total_raised_amount=float(total_raised)
     )
 
-def get_donations_list(db: Session, filters: DonationFilters) -> DonationsList:
-    """Get paginated donations list with search and filters"""
-    query = db.query(Donation)
+def get_donation_conditions(filters: DonationFilters) -> list:
+    """Build WHERE conditions shared by the donations list and export"""
+    conditions = []
     
     # Apply search filter
     if filters.search:
-        search_term = f"%{filters.search}%"
-        query = query.filter(
-            or_(
-                Donation.donor_name.ilike(search_term),
-                Donation.donor_email.ilike(search_term),
-                Donation.transaction_id.ilike(search_term)
-            )
-        )
+        conditions.append(plan_donation_search(filters.search).condition)
     
     # Apply status filter
     if filters.status:
-        query = query.filter(Donation.status == filters.status)
+        conditions.append(Donation.status == filters.status)
+    
+    return conditions
+
+async def get_donations_list(db: AsyncSession, filters: DonationFilters) -> DonationsList:
+    """Get paginated donations list with search and filters"""
+    conditions = get_donation_conditions(filters)
     
-    # Get total count before pagination
-    total = query.count()
+    # Get total count before pagination, in the list's count mode
+    count = await count_rows(db, "donations", Donation, conditions, filters.model_dump(), filters.count_mode)
     
     # Apply pagination
-    offset = (filters.page - 1) * filters.limit
-    donations = query.order_by(Donation.created_at.desc()).offset(offset).limit(filters.limit).all()
+    page = await paginate(db, Donation, conditions, filters.page, filters.limit, filters.cursor)
     
     # Calculate total pages
-    total_pages = (total + filters.limit - 1) // filters.limit
+    total_pages = (count.total + filters.limit - 1) // filters.limit
     
     return DonationsList(
-        donations=[DonationResponse.from_orm(donation) for donation in donations],
-        total=total,
-        page=filters.page,
+        donations=[DonationResponse.from_orm(donation) for donation in page.items],
+        total=count.total,
+        total_is_exact=count.exact,
+        page=page.page,
         limit=filters.limit,
-        total_pages=total_pages
+        total_pages=total_pages,
+        next_cursor=page.next_cursor,
+        prev_cursor=page.prev_cursor
     )
 
-def verify_donation(db: Session, donation_id: int) -> Optional[Donation]:
+async def verify_donation(db: AsyncSession, donation_id: int) -> Optional[Donation]:
     """Verify a donation"""
-    donation = db.query(Donation).filter(Donation.id == donation_id).first()
+    donation = await db.get(Donation, donation_id)
     if donation:
-        donation.status = "verified"
-        db.commit()
-        db.refresh(donation)
+        await change_status(db, donation, "verified")
+        await db.commit()
+        dashboard_cache.invalidate("donations")
+        await db.refresh(donation)
     return donation
 
-def acknowledge_donation(db: Session, donation_id: int) -> Optional[Donation]:
+async def acknowledge_donation(db: AsyncSession, donation_id: int) -> Optional[Donation]:
     """Acknowledge a donation"""
-    donation = db.query(Donation).filter(Donation.id == donation_id).first()
+    donation = await db.get(Donation, donation_id)
     if donation:
-        if donation.status != "verified":
+        if not await change_status(db, donation, "acknowledged", only_from="verified"):
             return None  # Only verified donations can be acknowledged
-        donation.status = "acknowledged"
-        db.commit()
-        db.refresh(donation)
+        await db.commit()
+        dashboard_cache.invalidate("donations")
+        await db.refresh(donation)
     return donation
 
-def get_donation_by_id(db: Session, donation_id: int) -> Optional[Donation]:
+async def get_donation_by_id(db: AsyncSession, donation_id: int) -> Optional[Donation]:
     """Get donation details by ID"""
-    return db.query(Donation).filter(Donation.id == donation_id).first()
+    return await db.get(Donation, donation_id)
 
-def export_donations_csv(db: Session, filters: DonationFilters) -> StreamingResponse:
-    """Export filtered donations as CSV"""
-    # Get all donations matching filters (no pagination for export)
-    query = db.query(Donation)
-    
-    # Apply same filters as get_donations_list
-    if filters.search:
-        search_term = f"%{filters.search}%"
-        query = query.filter(
-            or_(
-                Donation.donor_name.ilike(search_term),
-                Donation.donor_email.ilike(search_term),
-                Donation.transaction_id.ilike(search_term)
-            )
-        )
-    
-    if filters.status:
-        query = query.filter(Donation.status == filters.status)
-    
-    donations = query.order_by(Donation.created_at.desc()).all()
-    
-    # Create CSV content
-    output = io.StringIO()
-    writer = csv.writer(output)
-    
-    # Write header
-    writer.writerow([
+def get_donations_export(filters: DonationFilters) -> ExportSpec:
+    """Query and CSV columns of the donations export"""
+    def build_statement(dialect: str):
+        return select(
+            Donation.donor_name, Donation.donor_email, Donation.amount, Donation.payment_method,
+            Donation.transaction_id, Donation.status, Donation.created_at
+        ).where(*get_donation_conditions(filters)).order_by(Donation.created_at.desc())
+    
+    header = [
         'Donor Name', 'Donor Email', 'Amount', 'Payment Method',
         'Transaction ID', 'Status', 'Date'
-    ])
-    
-    # Write data
-    for donation in donations:
-        writer.writerow([
-            donation.donor_name,
-            donation.donor_email,
-            donation.amount,
-            donation.payment_method,
-            donation.transaction_id,
-            donation.status,
-            donation.created_at.strftime('%Y-%m-%d %H:%M:%S')
-        ])
+    ]
     
-    output.seek(0)
+    def format_row(row) -> list:
+        return [*row[:-1], format_timestamp(row.created_at)]
     
-    return StreamingResponse(
-        io.BytesIO(output.getvalue().encode('utf-8')),
-        media_type='text/csv',
-        headers={'Content-Disposition': 'attachment; filename=donations_export.csv'}
-    )
\ No newline at end of file
+    return ExportSpec('donations_export', header, build_statement, format_row)
@@ -0,0 +1,172 @@
+from sqlalchemy import event, select, func
+from sqlalchemy.orm import Session
+from collections import deque
+import asyncio
+import json
+import os
+import uuid
+
+# Live dashboard events (GET /admin/events, Server-Sent Events)
+EVENT_QUEUE_SIZE = int(os.getenv("EVENT_QUEUE_SIZE", "256"))
+EVENT_REPLAY_SIZE = int(os.getenv("EVENT_REPLAY_SIZE", "1000"))
+EVENT_HEARTBEAT_SECONDS = float(os.getenv("EVENT_HEARTBEAT_SECONDS", "15"))
+
+# PostgreSQL NOTIFY channel every worker listens on
+EVENT_CHANNEL = "dashboard_events"
+EVENT_LISTEN_RETRY_SECONDS = 5
+
+def format_event(event_id: str, name: str, data: dict) -> str:
+    return f"id: {event_id}\nevent: {name}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+class EventBroker:
+    """Fan-out of dashboard changes to SSE subscribers.
+    
+    On PostgreSQL, a write sends its events with NOTIFY inside its own
+    transaction, and every worker LISTENs (listen()) and publishes what it
+    receives, so subscribers on any worker see every worker's writes, in
+    commit order. While a worker's listener is reconnecting it may miss
+    events, so its subscribers get a `resync` once it is back. On SQLite
+    there is no shared channel and events only reach subscribers of the
+    worker that made the write.
+    
+    Each event is serialized once and appended to every subscriber's bounded
+    queue, so publishing never queries the database or waits on a slow client.
+    A subscriber that falls EVENT_QUEUE_SIZE events behind gets its backlog
+    replaced by a `resync` event telling it to refetch the summaries. The last
+    EVENT_REPLAY_SIZE events are kept for clients reconnecting with
+    Last-Event-ID.
+    
+    Event IDs are prefixed with a per-process epoch, so an ID from before a
+    restart also leads to a resync.
+    """
+    
+    def __init__(self, queue_size: int = EVENT_QUEUE_SIZE, replay_size: int = EVENT_REPLAY_SIZE):
+        self.queue_size = queue_size
+        self.epoch = uuid.uuid4().hex[:8]
+        self.published = 0
+        self.resyncs = 0
+        self._sequence = 0
+        self._recent = deque(maxlen=replay_size)
+        self._subscribers = set()
+    
+    def _resync_message(self) -> str:
+        self.resyncs += 1
+        return format_event(f"{self.epoch}:{self._sequence}", "resync", {"type": "resync"})
+    
+    def publish(self, name: str, data: dict):
+        self._sequence += 1
+        message = format_event(f"{self.epoch}:{self._sequence}", name, {"type": name, **data})
+        self._recent.append((self._sequence, message))
+        self.published += 1
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # Slow consumer: increments it missed cannot be replayed, start it over
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(self._resync_message())
+    
+    def resync_all(self):
+        """Tell every subscriber to refetch the summaries"""
+        if not self._subscribers:
+            return
+        message = self._resync_message()
+        for queue in self._subscribers:
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(message)
+    
+    def _receive(self, connection, pid, channel, payload):
+        data = json.loads(payload)
+        self.publish(data.pop("type"), data)
+    
+    async def listen(self, url):
+        """Publish the events every worker NOTIFYs (PostgreSQL); runs until cancelled"""
+        # asyncpg only comes with the PostgreSQL driver
+        import asyncpg
+        
+        dsn = url.set(drivername="postgresql").render_as_string(hide_password=False)
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(dsn)
+                await connection.add_listener(EVENT_CHANNEL, self._receive)
+                # Events sent while this worker was not listening are lost
+                self.resync_all()
+                while not connection.is_closed():
+                    await asyncio.sleep(EVENT_HEARTBEAT_SECONDS)
+                    # Fails if the connection dropped without a notification
+                    await connection.execute("SELECT 1")
+            except Exception as e:
+                print(f"Failed to listen for dashboard events: {str(e)}")
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+            await asyncio.sleep(EVENT_LISTEN_RETRY_SECONDS)
+    
+    def subscribe(self, last_event_id: str = None) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        if last_event_id:
+            epoch, _, sequence = last_event_id.partition(":")
+            missed = []
+            if epoch == self.epoch and sequence.isdigit():
+                missed = [message for event_sequence, message in self._recent if event_sequence > int(sequence)]
+                oldest = self._recent[0][0] if self._recent else self._sequence + 1
+                replayable = int(sequence) >= oldest - 1
+            else:
+                replayable = False
+            if replayable and len(missed) < self.queue_size:
+                for message in missed:
+                    queue.put_nowait(message)
+            else:
+                queue.put_nowait(self._resync_message())
+        self._subscribers.add(queue)
+        return queue
+    
+    def unsubscribe(self, queue: asyncio.Queue):
+        self._subscribers.discard(queue)
+    
+    def stats(self) -> dict:
+        return {
+            "subscribers": len(self._subscribers),
+            "published": self.published,
+            "resyncs": self.resyncs,
+            "last_event_id": f"{self.epoch}:{self._sequence}"
+        }
+
+def run_after_commit(db, callback):
+    """Call callback() once the session's transaction commits; dropped on rollback"""
+    session = getattr(db, "sync_session", db)
+    session.info.setdefault("after_commit", []).append(callback)
+
+def queue_event(db, name: str, data: dict):
+    """Publish an event once the session's transaction commits"""
+    session = getattr(db, "sync_session", db)
+    if session.get_bind().dialect.name == "postgresql":
+        # NOTIFYed by the commit itself, to every worker's listener
+        session.info.setdefault("notify_events", []).append({"type": name, **data})
+    else:
+        run_after_commit(db, lambda: event_broker.publish(name, data))
+
+@event.listens_for(Session, "before_commit")
+def notify_events(session):
+    for data in session.info.pop("notify_events", []):
+        session.execute(select(func.pg_notify(EVENT_CHANNEL, json.dumps(data, separators=(',', ':')))))
+
+@event.listens_for(Session, "after_commit")
+def run_commit_callbacks(session):
+    for callback in session.info.pop("after_commit", []):
+        try:
+            callback()
+        except Exception as e:
+            # The transaction is already committed; never fail the request over a side effect
+            print(f"Failed to run after-commit callback: {str(e)}")
+
+@event.listens_for(Session, "after_soft_rollback")
+def discard_commit_callbacks(session, previous_transaction):
+    session.info.pop("after_commit", None)
+    session.info.pop("notify_events", None)
+
+# Singleton instance
+event_broker = EventBroker()
@@ -0,0 +1,268 @@
+"""
+Background export jobs
+
+POST /admin/exports queues a row in export_jobs. Every API process runs a
+worker (unless EXPORT_WORKER_ENABLED=false) that claims the oldest queued job
+with a conditional UPDATE, so two workers never run the same job, and streams
+the export from the read replica into EXPORT_DIR, recording progress about
+once a second. With EXPORT_STORAGE=s3 the finished file is uploaded and
+removed locally, so any process can hand it out; with local storage only the
+processes sharing EXPORT_DIR can. A running job whose progress stops for
+EXPORT_JOB_STALE_SECONDS (its process died) is claimed again. Finished jobs
+and their files are deleted after EXPORT_JOB_RETENTION_HOURS.
+"""
+from sqlalchemy import select, update, delete, or_, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from app.database import AsyncSessionLocal, AsyncReplicaSessionLocal
+from app.exports import stream_export, count_statement, EXPORT_FORMATS
+from app.members import get_members_export
+from app.donations import get_donations_export
+from app.complaints import get_complaints_export
+from app.models import ExportJob
+from app.schemas import MemberFilters, DonationFilters, ComplaintFilters
+from app.s3_storage import get_s3_storage
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+import anyio
+import asyncio
+import json
+import os
+import time
+import uuid
+
+# Background exports (POST /admin/exports)
+EXPORT_WORKER_ENABLED = os.getenv("EXPORT_WORKER_ENABLED", "true").lower() == "true"
+EXPORT_STORAGE = os.getenv("EXPORT_STORAGE", "local")
+EXPORT_DIR = os.getenv("EXPORT_DIR", "exports")
+EXPORT_JOB_POLL_SECONDS = float(os.getenv("EXPORT_JOB_POLL_SECONDS", "2"))
+EXPORT_JOB_STALE_SECONDS = float(os.getenv("EXPORT_JOB_STALE_SECONDS", "300"))
+EXPORT_JOB_RETENTION_HOURS = float(os.getenv("EXPORT_JOB_RETENTION_HOURS", "24"))
+
+if EXPORT_STORAGE not in ("local", "s3"):
+    raise ValueError("EXPORT_STORAGE must be local or s3")
+
+# Progress writes double as the running job's heartbeat
+PROGRESS_INTERVAL_SECONDS = 1
+PURGE_INTERVAL_SECONDS = 600
+
+# Filters model and export builder for each job kind
+EXPORT_KINDS = {
+    "members": (MemberFilters, get_members_export),
+    "donations": (DonationFilters, get_donations_export),
+    "complaints": (ComplaintFilters, get_complaints_export)
+}
+
+# List paging fields mean nothing to an export
+PAGING_FIELDS = {"page", "limit", "cursor", "count_mode"}
+
+class ExportJobLost(Exception):
+    """The job was claimed again by another worker while this one ran it"""
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+def get_export_filename(job: ExportJob) -> str:
+    return f"{job.kind}_export.{EXPORT_FORMATS[job.format].extension}"
+
+def describe_export_job(job: ExportJob) -> dict:
+    """ExportJobResponse fields for a job row"""
+    if job.status == "completed":
+        progress = 1.0
+    elif job.total_rows is not None:
+        progress = min(job.rows_written / job.total_rows, 1.0) if job.total_rows else 0.0
+    else:
+        progress = None
+    return {
+        "id": job.id,
+        "kind": job.kind,
+        "format": job.format,
+        "filters": json.loads(job.filters),
+        "status": job.status,
+        "rows_written": job.rows_written,
+        "total_rows": job.total_rows,
+        "progress": progress,
+        "size": job.size,
+        "error": job.error,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+        "download_url": f"/admin/exports/{job.id}/download" if job.status == "completed" else None
+    }
+
+async def create_export_job(db: AsyncSession, kind: str, export_format: str, filters, admin_id: int) -> ExportJob:
+    """Queue an export of the rows matching filters"""
+    now = utcnow()
+    job = ExportJob(
+        id=uuid.uuid4().hex,
+        kind=kind,
+        format=export_format,
+        filters=json.dumps(filters.model_dump(mode="json", exclude=PAGING_FIELDS, exclude_none=True)),
+        status="queued",
+        rows_written=0,
+        created_by=admin_id,
+        created_at=now,
+        updated_at=now
+    )
+    db.add(job)
+    await db.commit()
+    export_worker.notify()
+    return job
+
+async def get_export_job(db: AsyncSession, job_id: str) -> Optional[ExportJob]:
+    return await db.get(ExportJob, job_id)
+
+def delete_export_file(location: str):
+    if location.startswith("https://"):
+        get_s3_storage().delete_file(location)
+    elif os.path.exists(location):
+        os.remove(location)
+
+class ExportWorker:
+    """Runs export jobs one at a time in this process"""
+    
+    def __init__(self, enabled: bool = EXPORT_WORKER_ENABLED, storage: str = EXPORT_STORAGE,
+                 export_dir: str = EXPORT_DIR, poll_seconds: float = EXPORT_JOB_POLL_SECONDS,
+                 stale_seconds: float = EXPORT_JOB_STALE_SECONDS, retention_hours: float = EXPORT_JOB_RETENTION_HOURS):
+        self.enabled = enabled
+        self.storage = storage
+        self.export_dir = export_dir
+        self.poll_seconds = poll_seconds
+        self.stale_seconds = stale_seconds
+        self.retention_hours = retention_hours
+        self._wakeup = None
+        self._purged_at = None
+    
+    def notify(self):
+        """Pick up a job queued by this process without waiting for the next poll"""
+        if self._wakeup is not None:
+            self._wakeup.set()
+    
+    async def claim(self) -> Optional[tuple]:
+        """Mark the oldest runnable job as running; returns (job id, claim time)"""
+        now = utcnow()
+        runnable = or_(
+            ExportJob.status == "queued",
+            and_(ExportJob.status == "running", ExportJob.updated_at < now - timedelta(seconds=self.stale_seconds))
+        )
+        async with AsyncSessionLocal() as db:
+            while True:
+                job_id = await db.scalar(select(ExportJob.id).where(runnable).order_by(ExportJob.created_at).limit(1))
+                if job_id is None:
+                    return None
+                result = await db.execute(
+                    update(ExportJob)
+                    .where(ExportJob.id == job_id, runnable)
+                    .values(status="running", rows_written=0, started_at=now, updated_at=now)
+                    .execution_options(synchronize_session=False)
+                )
+                await db.commit()
+                if result.rowcount == 1:
+                    return job_id, now
+                # Another worker claimed it between the two statements
+    
+    async def update(self, job_id: str, claimed_at: datetime, **values):
+        """Write job fields, unless another worker has claimed the job since"""
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                update(ExportJob)
+                .where(ExportJob.id == job_id, ExportJob.started_at == claimed_at)
+                .values(updated_at=utcnow(), **values)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+        if result.rowcount != 1:
+            raise ExportJobLost(job_id)
+    
+    async def run(self, job_id: str, claimed_at: datetime):
+        async with AsyncSessionLocal() as db:
+            job = await db.get(ExportJob, job_id)
+        filters_model, get_export = EXPORT_KINDS[job.kind]
+        export = get_export(filters_model(**json.loads(job.filters)))
+        export_format = EXPORT_FORMATS[job.format]
+        path = os.path.join(self.export_dir, f"{job.id}.{export_format.extension}")
+        partial_path = f"{path}.part"
+        rows_written = 0
+        
+        def add_rows(rows: int):
+            nonlocal rows_written
+            rows_written += rows
+        
+        try:
+            async with AsyncReplicaSessionLocal() as db:
+                total_rows = await db.scalar(count_statement(export.build_statement(db.get_bind().dialect.name)))
+            await self.update(job_id, claimed_at, total_rows=total_rows)
+            
+            os.makedirs(self.export_dir, exist_ok=True)
+            size = 0
+            reported_at = time.monotonic()
+            async with await anyio.open_file(partial_path, "wb") as output:
+                async for chunk in stream_export(AsyncReplicaSessionLocal, export, job.format, progress=add_rows):
+                    await output.write(chunk)
+                    size += len(chunk)
+                    if time.monotonic() - reported_at >= PROGRESS_INTERVAL_SECONDS:
+                        await self.update(job_id, claimed_at, rows_written=rows_written)
+                        reported_at = time.monotonic()
+            os.replace(partial_path, path)
+            
+            location = path
+            if self.storage == "s3":
+                location = await run_in_threadpool(
+                    get_s3_storage().upload_path, path, f"exports/{os.path.basename(path)}", export_format.media_type
+                )
+                os.remove(path)
+            await self.update(
+                job_id, claimed_at,
+                status="completed", rows_written=rows_written, size=size, location=location, finished_at=utcnow()
+            )
+        except ExportJobLost:
+            print(f"Export job {job_id} was claimed by another worker, stopping")
+        except Exception as e:
+            print(f"Failed to run export job {job_id}: {str(e)}")
+            for leftover in (partial_path, path):
+                if os.path.exists(leftover):
+                    os.remove(leftover)
+            try:
+                await self.update(job_id, claimed_at, status="failed", error=str(e), finished_at=utcnow())
+            except ExportJobLost:
+                pass
+    
+    async def purge_expired(self):
+        """Delete jobs, and their files, finished more than EXPORT_JOB_RETENTION_HOURS ago"""
+        cutoff = utcnow() - timedelta(hours=self.retention_hours)
+        async with AsyncSessionLocal() as db:
+            jobs = (await db.scalars(select(ExportJob).where(ExportJob.finished_at < cutoff))).all()
+            if not jobs:
+                return
+            for job in jobs:
+                if job.location:
+                    await run_in_threadpool(delete_export_file, job.location)
+            await db.execute(
+                delete(ExportJob)
+                .where(ExportJob.id.in_([job.id for job in jobs]))
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+    
+    async def maintain(self):
+        """Run jobs until none are left, then wait for a notify or the next poll"""
+        self._wakeup = asyncio.Event()
+        while True:
+            try:
+                claimed = await self.claim()
+                while claimed:
+                    await self.run(*claimed)
+                    claimed = await self.claim()
+                if self._purged_at is None or time.monotonic() - self._purged_at >= PURGE_INTERVAL_SECONDS:
+                    await self.purge_expired()
+                    self._purged_at = time.monotonic()
+            except Exception as e:
+                print(f"Failed to run export jobs: {str(e)}")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+# Singleton instance
+export_worker = ExportWorker()
@@ -0,0 +1,315 @@
+"""
+Streaming exports: CSV, Parquet and compressed NDJSON
+
+The query runs on a session opened inside the response generator (the
+request's own session is closed once the endpoint returns) and is read in
+EXPORT_BATCH_SIZE-row batches through a server-side cursor. Each batch goes
+to the format's writer and whatever it produces is sent straight away, so
+memory stays at one batch (one row group for Parquet) whatever the export
+size. The CSV header row goes out before the query runs.
+
+CSV keeps the formatted columns of the original export. Parquet and NDJSON
+carry the typed values under the column names: numbers stay numbers and
+created_at is a UTC timestamp (ISO 8601 in NDJSON). Parquet needs pyarrow
+and zstd-compressed NDJSON needs zstandard; both are optional.
+
+The same ExportSpec feeds the background export jobs (app/export_jobs.py),
+whose finished files are served by file_response with HTTP Range support so
+an interrupted download can resume.
+"""
+from collections import namedtuple
+from fastapi.responses import Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import select, func, Boolean, Integer, Float, Numeric, DateTime, Date
+from datetime import date, datetime
+from typing import Optional
+import anyio
+import csv
+import importlib.util
+import io
+import json
+import os
+import re
+import zlib
+
+# Rows fetched and written per chunk of an export
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+# Rows per Parquet row group (one group is held in memory while it fills)
+EXPORT_PARQUET_ROW_GROUP_SIZE = int(os.getenv("EXPORT_PARQUET_ROW_GROUP_SIZE", "50000"))
+EXPORT_PARQUET_COMPRESSION = os.getenv("EXPORT_PARQUET_COMPRESSION", "zstd")
+
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+# Bytes read per chunk when serving an export file
+FILE_CHUNK_SIZE = 64 * 1024
+
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+# name is the download filename without extension; build_statement(dialect)
+# returns a column-only SELECT; header and format_row give the CSV columns
+ExportSpec = namedtuple("ExportSpec", ["name", "header", "build_statement", "format_row"])
+
+def format_timestamp(value) -> str:
+    return value.strftime('%Y-%m-%d %H:%M:%S') if value else ''
+
+def count_statement(statement):
+    """COUNT(*) over an export's SELECT, without its ORDER BY"""
+    return select(func.count()).select_from(statement.order_by(None).subquery())
+
+class CsvExportWriter:
+    def __init__(self, export: ExportSpec, columns):
+        self.export = export
+        self.buffer = io.StringIO()
+        self.writer = csv.writer(self.buffer)
+    
+    def _take(self) -> bytes:
+        chunk = self.buffer.getvalue().encode('utf-8')
+        self.buffer.seek(0)
+        self.buffer.truncate(0)
+        return chunk
+    
+    def begin(self) -> bytes:
+        self.writer.writerow(self.export.header)
+        return self._take()
+    
+    def write(self, rows) -> bytes:
+        self.writer.writerows(self.export.format_row(row) for row in rows)
+        return self._take()
+    
+    def finish(self) -> bytes:
+        return b''
+
+def json_default(value):
+    if isinstance(value, datetime):
+        # Stored in UTC; SQLite hands them back naive
+        return value.isoformat() if value.tzinfo else value.isoformat() + '+00:00'
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+class NdjsonExportWriter:
+    """One JSON object per line, through a streaming gzip or zstd compressor"""
+    
+    def __init__(self, export: ExportSpec, columns, compression: str):
+        self.keys = [column.key for column in columns]
+        self.encode = json.JSONEncoder(default=json_default, ensure_ascii=False, separators=(',', ':')).encode
+        if compression == "zstd":
+            import zstandard
+            self.compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+        else:
+            # wbits 31: gzip container
+            self.compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+    
+    def begin(self) -> bytes:
+        return b''
+    
+    def write(self, rows) -> bytes:
+        keys = self.keys
+        lines = ''.join(self.encode(dict(zip(keys, row))) + '\n' for row in rows)
+        return self.compressor.compress(lines.encode('utf-8'))
+    
+    def finish(self) -> bytes:
+        return self.compressor.flush()
+
+class ByteSink:
+    """Write-only file object for pyarrow that hands back what was written since the last take()"""
+    
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+        self.closed = False
+    
+    def write(self, data) -> int:
+        data = bytes(data)
+        self.chunks.append(data)
+        self.position += len(data)
+        return len(data)
+    
+    def tell(self) -> int:
+        # Parquet footers record absolute offsets, so this never goes back
+        return self.position
+    
+    def flush(self):
+        pass
+    
+    def close(self):
+        self.closed = True
+    
+    def take(self) -> bytes:
+        chunk = b''.join(self.chunks)
+        self.chunks = []
+        return chunk
+
+def get_arrow_type(pa, column_type):
+    if isinstance(column_type, Boolean):
+        return pa.bool_()
+    if isinstance(column_type, Integer):
+        return pa.int64()
+    if isinstance(column_type, (Float, Numeric)):
+        return pa.float64()
+    if isinstance(column_type, DateTime):
+        # Timestamps are stored in UTC; SQLite hands them back naive
+        return pa.timestamp("us", tz="UTC")
+    if isinstance(column_type, Date):
+        return pa.date32()
+    return pa.string()
+
+class ParquetExportWriter:
+    """Rows collected column by column and written out one row group at a time"""
+    
+    def __init__(self, export: ExportSpec, columns):
+        # Imported here so app startup does not pay for pyarrow
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        self.pa = pa
+        self.schema = pa.schema([(column.key, get_arrow_type(pa, column.type)) for column in columns])
+        self.sink = ByteSink()
+        self.writer = pq.ParquetWriter(self.sink, self.schema, compression=EXPORT_PARQUET_COMPRESSION)
+        self.columns = [[] for _ in columns]
+        self.pending = 0
+    
+    def _write_row_group(self):
+        arrays = [
+            self.pa.array(values, type=field.type)
+            for values, field in zip(self.columns, self.schema)
+        ]
+        self.writer.write_table(self.pa.Table.from_arrays(arrays, schema=self.schema))
+        self.columns = [[] for _ in self.columns]
+        self.pending = 0
+    
+    def begin(self) -> bytes:
+        return self.sink.take()
+    
+    def write(self, rows) -> bytes:
+        for values, column in zip(self.columns, zip(*rows)):
+            values.extend(column)
+        self.pending += len(rows)
+        if self.pending >= EXPORT_PARQUET_ROW_GROUP_SIZE:
+            self._write_row_group()
+        return self.sink.take()
+    
+    def finish(self) -> bytes:
+        if self.pending:
+            self._write_row_group()
+        self.writer.close()
+        return self.sink.take()
+
+# extension, media type, optional module it needs, writer(export, columns)
+ExportFileFormat = namedtuple("ExportFileFormat", ["extension", "media_type", "requires", "writer"])
+
+EXPORT_FORMATS = {
+    "csv": ExportFileFormat("csv", "text/csv", None, CsvExportWriter),
+    "parquet": ExportFileFormat("parquet", "application/vnd.apache.parquet", "pyarrow", ParquetExportWriter),
+    "ndjson.gz": ExportFileFormat(
+        "ndjson.gz", "application/gzip", None,
+        lambda export, columns: NdjsonExportWriter(export, columns, "gzip")
+    ),
+    "ndjson.zst": ExportFileFormat(
+        "ndjson.zst", "application/zstd", "zstandard",
+        lambda export, columns: NdjsonExportWriter(export, columns, "zstd")
+    )
+}
+
+def get_missing_dependency(export_format: str) -> Optional[str]:
+    """The optional package an export format needs, if it is not installed"""
+    requires = EXPORT_FORMATS[export_format].requires
+    if requires and importlib.util.find_spec(requires) is None:
+        return requires
+    return None
+
+def get_export_filename(export: ExportSpec, export_format: str) -> str:
+    return f"{export.name}.{EXPORT_FORMATS[export_format].extension}"
+
+async def stream_export(session_factory, export: ExportSpec, export_format: str = "csv",
+                        batch_size: int = EXPORT_BATCH_SIZE, progress=None):
+    """Yield the export file in chunks, one per batch of rows.
+    
+    Formatting, serialization and compression run in the threadpool, so a
+    large export does not hold up other requests on the event loop.
+    progress, if given, is called with the number of rows in each batch.
+    """
+    async with session_factory() as db:
+        statement = export.build_statement(db.get_bind().dialect.name)
+        writer = EXPORT_FORMATS[export_format].writer(export, statement.selected_columns)
+        chunk = await run_in_threadpool(writer.begin)
+        if chunk:
+            yield chunk
+        
+        result = await db.stream(statement.execution_options(yield_per=batch_size))
+        async for rows in result.partitions():
+            chunk = await run_in_threadpool(writer.write, rows)
+            if progress is not None:
+                progress(len(rows))
+            if chunk:
+                yield chunk
+        chunk = await run_in_threadpool(writer.finish)
+        if chunk:
+            yield chunk
+
+def export_response(session_factory, export: ExportSpec, export_format: str = "csv") -> StreamingResponse:
+    return StreamingResponse(
+        stream_export(session_factory, export, export_format),
+        media_type=EXPORT_FORMATS[export_format].media_type,
+        headers={'Content-Disposition': f'attachment; filename={get_export_filename(export, export_format)}'}
+    )
+
+def parse_range(value: str, size: int):
+    """(start, end) inclusive for a single "bytes=" range, "unsatisfiable", or None to send the whole file.
+    
+    Multiple ranges and malformed headers get the whole file, which RFC 9110
+    allows a server to do for any Range request.
+    """
+    match = RANGE_PATTERN.match(value.strip()) if value else None
+    if not match or match.groups() == ("", ""):
+        return None
+    first, last = match.groups()
+    if first == "":
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            return "unsatisfiable"
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if end < start and last:
+        return None
+    if start >= size:
+        return "unsatisfiable"
+    return start, end
+
+async def read_file(path: str, start: int, end: int):
+    async with await anyio.open_file(path, "rb") as file:
+        await file.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = await file.read(min(FILE_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+def file_response(path: str, filename: str, etag: str, range_header: str = None,
+                  if_range: str = None, media_type: str = 'text/csv') -> Response:
+    """Serve a finished file, or the byte range the client asked for (206).
+    
+    A Range is honoured only when If-Range is absent or matches etag, so a
+    client never splices bytes from two different files.
+    """
+    size = os.path.getsize(path)
+    headers = {
+        'Accept-Ranges': 'bytes',
+        'ETag': etag,
+        'Content-Disposition': f'attachment; filename={filename}'
+    }
+    byte_range = parse_range(range_header, size) if not if_range or if_range == etag else None
+    if byte_range == "unsatisfiable":
+        return Response(status_code=416, headers={**headers, 'Content-Range': f'bytes */{size}'})
+    if byte_range is None:
+        start, end, status_code = 0, size - 1, 200
+    else:
+        (start, end), status_code = byte_range, 206
+        headers['Content-Range'] = f'bytes {start}-{end}/{size}'
+    headers['Content-Length'] = str(end - start + 1)
+    return StreamingResponse(read_file(path, start, end), status_code=status_code, media_type=media_type, headers=headers)
@@ -0,0 +1,19 @@
+"""
+Identifier formats shared by the public form validators and the admin search router
+"""
+import re
+
+AADHAAR_PATTERN = r'^\d{12}$'
+PHONE_PATTERN = r'^\d{10}$'
+LETTERS_ONLY_PATTERN = r'^[a-zA-Z\s]+$'
+
+# MEM + 8 uppercase hex digits (see the application approve endpoint)
+MEMBERSHIP_ID_PREFIX = "MEM"
+MEMBERSHIP_ID_PATTERN = r'^MEM[0-9A-F]*\d[0-9A-F]*$'
+
+# MMN-CMP-YYYYMMDD-XXXX (see generate_reference_id)
+REFERENCE_ID_PREFIX = "MMN-CMP-"
+REFERENCE_ID_PATTERN = r'^MMN-CMP-[0-9A-Z-]*$'
+
+def matches(pattern: str, value: str) -> bool:
+    return re.match(pattern, value) is not None
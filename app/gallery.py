@@ -1,9 +1,13 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func
 from app.models import Gallery, MediaType
 from app.schemas import GallerySummary, GalleryList, GalleryResponse, GalleryFilters, GalleryCreate, GalleryUpdate
-from app.s3_storage import s3_storage
+from app.s3_storage import get_s3_storage
+from app.dashboard_cache import dashboard_cache
+from app.pagination import paginate
+from app.counts import count_rows
 from fastapi import UploadFile, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from typing import Optional
 from pathlib import Path
 
@@ -11,11 +15,15 @@ from pathlib import Path
 ALLOWED_IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
 ALLOWED_VIDEO_EXTENSIONS = {".mp4", ".avi", ".mov", ".wmv", ".flv", ".webm"}
 
-def get_gallery_summary(db: Session) -> GallerySummary:
+async def get_gallery_summary(db: AsyncSession) -> GallerySummary:
     """Get gallery summary for overview"""
-    total_items = db.query(Gallery).count()
-    total_images = db.query(Gallery).filter(Gallery.media_type == "image").count()
-    total_videos = db.query(Gallery).filter(Gallery.media_type == "video").count()
+    total_items = await db.scalar(select(func.count()).select_from(Gallery))
+    total_images = await db.scalar(
+        select(func.count()).select_from(Gallery).where(Gallery.media_type == "image")
+    )
+    total_videos = await db.scalar(
+        select(func.count()).select_from(Gallery).where(Gallery.media_type == "video")
+    )
     
     return GallerySummary(
         total_items=total_items,
@@ -23,30 +31,32 @@ def get_gallery_summary(db: Session) -> GallerySummary:
         total_videos=total_videos
     )
 
-def get_gallery_list(db: Session, filters: GalleryFilters) -> GalleryList:
+async def get_gallery_list(db: AsyncSession, filters: GalleryFilters) -> GalleryList:
     """Get paginated gallery list with filters"""
-    query = db.query(Gallery)
+    conditions = []
     
     # Apply media type filter
     if filters.media_type:
-        query = query.filter(Gallery.media_type == filters.media_type)
+        conditions.append(Gallery.media_type == filters.media_type)
     
-    # Get total count before pagination
-    total = query.count()
+    # Get total count before pagination, in the list's count mode
+    count = await count_rows(db, "gallery", Gallery, conditions, filters.model_dump(), filters.count_mode)
     
     # Apply pagination
-    offset = (filters.page - 1) * filters.limit
-    items = query.order_by(Gallery.created_at.desc()).offset(offset).limit(filters.limit).all()
+    page = await paginate(db, Gallery, conditions, filters.page, filters.limit, filters.cursor)
     
     # Calculate total pages
-    total_pages = (total + filters.limit - 1) // filters.limit
+    total_pages = (count.total + filters.limit - 1) // filters.limit
     
     return GalleryList(
-        items=[GalleryResponse.from_orm(item) for item in items],
-        total=total,
-        page=filters.page,
+        items=[GalleryResponse.from_orm(item) for item in page.items],
+        total=count.total,
+        total_is_exact=count.exact,
+        page=page.page,
         limit=filters.limit,
-        total_pages=total_pages
+        total_pages=total_pages,
+        next_cursor=page.next_cursor,
+        prev_cursor=page.prev_cursor
     )
 
 def save_uploaded_file(file: UploadFile) -> tuple[str, str]:
@@ -68,14 +78,14 @@ def save_uploaded_file(file: UploadFile) -> tuple[str, str]:
         )
     
     # Upload to S3
-    media_url = s3_storage.upload_file(file, folder)
+    media_url = get_s3_storage().upload_file(file, folder)
     
     return media_url, media_type
 
-def create_gallery_item(db: Session, gallery_data: GalleryCreate, file: UploadFile) -> Gallery:
+async def create_gallery_item(db: AsyncSession, gallery_data: GalleryCreate, file: UploadFile) -> Gallery:
     """Create new gallery item with file upload"""
-    # Save uploaded file
-    media_url, media_type = save_uploaded_file(file)
+    # Save uploaded file (boto3 is blocking, keep it off the event loop)
+    media_url, media_type = await run_in_threadpool(save_uploaded_file, file)
     
     # Create gallery item
     gallery_item = Gallery(
@@ -86,18 +96,19 @@ def create_gallery_item(db: Session, gallery_data: GalleryCreate, file: UploadFi
     )
     
     db.add(gallery_item)
-    db.commit()
-    db.refresh(gallery_item)
+    await db.commit()
+    dashboard_cache.invalidate("gallery")
+    await db.refresh(gallery_item)
     
     return gallery_item
 
-def get_gallery_item_by_id(db: Session, item_id: int) -> Optional[Gallery]:
+async def get_gallery_item_by_id(db: AsyncSession, item_id: int) -> Optional[Gallery]:
     """Get gallery item by ID"""
-    return db.query(Gallery).filter(Gallery.id == item_id).first()
+    return await db.get(Gallery, item_id)
 
-def update_gallery_item(db: Session, item_id: int, gallery_data: GalleryUpdate, file: Optional[UploadFile] = None) -> Optional[Gallery]:
+async def update_gallery_item(db: AsyncSession, item_id: int, gallery_data: GalleryUpdate, file: Optional[UploadFile] = None) -> Optional[Gallery]:
     """Update gallery item"""
-    gallery_item = db.query(Gallery).filter(Gallery.id == item_id).first()
+    gallery_item = await db.get(Gallery, item_id)
     if not gallery_item:
         return None
     
@@ -110,29 +121,31 @@ def update_gallery_item(db: Session, item_id: int, gallery_data: GalleryUpdate,
     # Update media file if provided
     if file:
         # Delete old file from S3
-        s3_storage.delete_file(gallery_item.media_url)
+        await run_in_threadpool(lambda: get_s3_storage().delete_file(gallery_item.media_url))
         
         # Save new file to S3
-        media_url, media_type = save_uploaded_file(file)
+        media_url, media_type = await run_in_threadpool(save_uploaded_file, file)
         gallery_item.media_url = media_url
         gallery_item.media_type = media_type
     
-    db.commit()
-    db.refresh(gallery_item)
+    await db.commit()
+    dashboard_cache.invalidate("gallery")
+    await db.refresh(gallery_item)
     
     return gallery_item
 
-def delete_gallery_item(db: Session, item_id: int) -> bool:
+async def delete_gallery_item(db: AsyncSession, item_id: int) -> bool:
     """Delete gallery item and associated file from S3"""
-    gallery_item = db.query(Gallery).filter(Gallery.id == item_id).first()
+    gallery_item = await db.get(Gallery, item_id)
     if not gallery_item:
         return False
     
     # Delete file from S3
-    s3_storage.delete_file(gallery_item.media_url)
+    await run_in_threadpool(lambda: get_s3_storage().delete_file(gallery_item.media_url))
     
     # Delete from database
-    db.delete(gallery_item)
-    db.commit()
+    await db.delete(gallery_item)
+    await db.commit()
+    dashboard_cache.invalidate("gallery")
     
     return True
\ No newline at end of file
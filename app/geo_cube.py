@@ -0,0 +1,289 @@
+"""
+In-memory member cube: place (state, district, mandal) x status x month
+
+Built from one grouped query over members, then kept current by the member
+write paths: record_created / record_status_change queue an update that is
+applied once the transaction commits. Drill-down queries slice and sum
+NumPy arrays and never touch the database. A periodic rebuild
+picks up rows written outside the API (sample-data scripts, other workers).
+"""
+from sqlalchemy import select, func, extract
+from app.database import AsyncSessionLocal
+from app.events import run_after_commit
+from app.models import Member
+from datetime import date, datetime, timezone
+import asyncio
+import os
+
+# Geography analytics cube (GET /admin/analytics/geography)
+GEO_CUBE_ENABLED = os.getenv("GEO_CUBE_ENABLED", "true").lower() == "true"
+GEO_CUBE_REBUILD_SECONDS = float(os.getenv("GEO_CUBE_REBUILD_SECONDS", "3600"))
+
+GEOGRAPHY_LEVELS = ("state", "district", "mandal")
+CUBE_DIMENSIONS = GEOGRAPHY_LEVELS + ("status", "month")
+
+def get_month_number(day: date) -> int:
+    return day.year * 12 + day.month - 1
+
+def format_month(month_number: int) -> str:
+    return f"{month_number // 12:04d}-{month_number % 12 + 1:02d}"
+
+def parse_month(value: str) -> int:
+    """YYYY-MM to a month number"""
+    return get_month_number(datetime.strptime(value, "%Y-%m").date())
+
+class CubeData:
+    """Dimension dictionaries plus an over-allocated int32 count array"""
+    
+    def __init__(self, np):
+        self.np = np
+        self.places = {}
+        self.place_keys = []
+        self.states = {}
+        self.districts = {}
+        self.place_states = []
+        self.place_districts = []
+        self.statuses = {}
+        self.status_keys = []
+        self.base_month = None
+        self.month_count = 0
+        self.counts = np.zeros((64, 4, 12), dtype=np.int32)
+        self._codes = None
+    
+    def _grow(self, places: int, statuses: int, months: int, front: int = 0):
+        capacity = self.counts.shape
+        if front == 0 and places <= capacity[0] and statuses <= capacity[1] and months <= capacity[2]:
+            return
+        counts = self.np.zeros((
+            capacity[0] if places <= capacity[0] else max(places, capacity[0] * 2),
+            max(statuses, capacity[1]),
+            capacity[2] + front if months <= capacity[2] + front else months + 12
+        ), dtype=self.np.int32)
+        counts[:capacity[0], :capacity[1], front:front + capacity[2]] = self.counts
+        self.counts = counts
+    
+    def add(self, state: str, district: str, mandal: str, status: str, month_number: int, delta: int):
+        place = self.places.get((state, district, mandal))
+        if place is None:
+            place = len(self.place_keys)
+            self.places[(state, district, mandal)] = place
+            self.place_keys.append((state, district, mandal))
+            self.place_states.append(self.states.setdefault(state, len(self.states)))
+            self.place_districts.append(self.districts.setdefault((state, district), len(self.districts)))
+            self._codes = None
+        status_index = self.statuses.get(status)
+        if status_index is None:
+            status_index = self.statuses[status] = len(self.status_keys)
+            self.status_keys.append(status)
+        
+        if self.base_month is None:
+            self.base_month = month_number
+        if month_number < self.base_month:
+            # Shift every existing month to make room at the front
+            front = self.base_month - month_number
+            self._grow(self.counts.shape[0], self.counts.shape[1], self.counts.shape[2] + front, front)
+            self.base_month = month_number
+            self.month_count += front
+        month = month_number - self.base_month
+        self.month_count = max(self.month_count, month + 1)
+        
+        self._grow(len(self.place_keys), len(self.status_keys), self.month_count)
+        self.counts[place, status_index, month] += delta
+    
+    def codes(self) -> dict:
+        """Group code and label of every place at each geography level"""
+        if self._codes is None:
+            np = self.np
+            self._codes = {
+                "state": np.array(self.place_states, dtype=np.intp),
+                "district": np.array(self.place_districts, dtype=np.intp),
+                "mandal": np.arange(len(self.place_keys), dtype=np.intp),
+                "labels": {
+                    level: np.array([key[position] for key in self.place_keys], dtype=str)
+                    for position, level in enumerate(GEOGRAPHY_LEVELS)
+                }
+            }
+        return self._codes
+    
+    def group_count(self, level: str) -> int:
+        return len(self.states if level == "state" else self.districts if level == "district" else self.place_keys)
+    
+    def view(self):
+        return self.counts[:len(self.place_keys), :len(self.status_keys), :self.month_count]
+
+class GeoCube:
+    """Member counts by geography, status and UTC creation month, answered from memory"""
+    
+    def __init__(self, enabled: bool = GEO_CUBE_ENABLED, rebuild_seconds: float = GEO_CUBE_REBUILD_SECONDS):
+        self.enabled = enabled
+        self.rebuild_seconds = rebuild_seconds
+        self.built_at = None
+        self.build_ms = None
+        self._data = None
+        self._building = False
+        self._changed_during_build = False
+    
+    @property
+    def ready(self) -> bool:
+        return self._data is not None
+    
+    async def build(self):
+        """Load the cube from one grouped query over members"""
+        # Imported here so app startup does not pay for NumPy
+        import numpy as np
+        
+        started_at = datetime.now(timezone.utc)
+        for _ in range(3):
+            self._building = True
+            self._changed_during_build = False
+            try:
+                async with AsyncSessionLocal() as db:
+                    created_at = Member.created_at
+                    if db.get_bind().dialect.name == "postgresql":
+                        created_at = func.timezone("UTC", created_at)
+                    year, month = extract("year", created_at), extract("month", created_at)
+                    status = func.coalesce(Member.status, "pending")
+                    result = await db.execute(
+                        select(Member.state, Member.district, Member.mandal, status, year, month, func.count())
+                        .group_by(Member.state, Member.district, Member.mandal, status, year, month)
+                    )
+                    rows = result.all()
+            finally:
+                self._building = False
+            
+            data = CubeData(np)
+            for state, district, mandal, status, year, month, count in rows:
+                if year is None:
+                    # created_at not set; count the row under the current month
+                    month_number = get_month_number(datetime.now(timezone.utc).date())
+                else:
+                    month_number = int(year) * 12 + int(month) - 1
+                data.add(state, district, mandal, status, month_number, count)
+            
+            # A member write committed while the query ran may or may not be in
+            # the snapshot, so load again rather than guess
+            if not self._changed_during_build:
+                break
+        
+        self._data = data
+        self.built_at = datetime.now(timezone.utc)
+        self.build_ms = round((self.built_at - started_at).total_seconds() * 1000, 3)
+    
+    async def maintain(self):
+        """Build the cube, then rebuild it every GEO_CUBE_REBUILD_SECONDS"""
+        while True:
+            try:
+                await self.build()
+            except Exception as e:
+                print(f"Failed to build geography cube: {str(e)}")
+            await asyncio.sleep(self.rebuild_seconds)
+    
+    def apply(self, state: str, district: str, mandal: str, status: str, day: date, delta: int):
+        if self._building:
+            self._changed_during_build = True
+        if self._data is not None:
+            self._data.add(state, district, mandal, status, get_month_number(day), delta)
+    
+    def queue_member_change(self, db, member, old_status: str, status: str, day: date):
+        """Move a member between status cells once the transaction commits (old_status None: new member)"""
+        if not self.enabled:
+            return
+        place = (member.state, member.district, member.mandal)
+        
+        def apply_change():
+            if old_status is not None:
+                self.apply(*place, old_status, day, -1)
+            self.apply(*place, status, day, 1)
+        
+        run_after_commit(db, apply_change)
+    
+    def query(self, state: str = None, district: str = None, mandal: str = None, status: str = None,
+              month_from: int = None, month_to: int = None, by: tuple = None) -> dict:
+        """Slice the cube by the given filters and sum it up to the `by` dimensions.
+        
+        By default the rows drill one level below the most specific geography
+        filter (states, then districts, then mandals, then statuses).
+        """
+        data = self._data
+        np = data.np
+        if by is None:
+            by = ("status",) if mandal else ("mandal",) if district else ("district",) if state else ("state",)
+        
+        counts = data.view()
+        codes = data.codes()
+        place_mask = np.ones(len(data.place_keys), dtype=bool)
+        for level, value in zip(GEOGRAPHY_LEVELS, (state, district, mandal)):
+            if value is not None:
+                place_mask &= codes["labels"][level] == value
+        
+        if status is None:
+            status_keys = data.status_keys
+            status_index = slice(None)
+        else:
+            status_keys = [status] if status in data.statuses else []
+            status_index = [data.statuses[status]] if status_keys else []
+        
+        months = np.arange(data.month_count) + (data.base_month or 0)
+        month_mask = np.ones(data.month_count, dtype=bool)
+        if month_from is not None:
+            month_mask &= months >= month_from
+        if month_to is not None:
+            month_mask &= months <= month_to
+        month_keys = months[month_mask]
+        
+        cells = counts[place_mask][:, status_index][:, :, month_mask].astype(np.int64)
+        if "status" not in by:
+            cells = cells.sum(axis=1, keepdims=True)
+        if "month" not in by:
+            cells = cells.sum(axis=2, keepdims=True)
+        
+        level = next((level for level in reversed(GEOGRAPHY_LEVELS) if level in by), None)
+        if level is None:
+            grouped = cells.sum(axis=0, keepdims=True)
+            group_places = [None]
+        else:
+            group_codes = codes[level][place_mask]
+            grouped = np.zeros((data.group_count(level),) + cells.shape[1:], dtype=np.int64)
+            np.add.at(grouped, group_codes, cells)
+            # Any place of a group carries the group's labels
+            group_places = [None] * grouped.shape[0]
+            for place, code in zip(np.flatnonzero(place_mask), group_codes):
+                group_places[code] = data.place_keys[place]
+        
+        rows = []
+        for group, status_position, month_position in zip(*np.nonzero(grouped)):
+            row = {}
+            if level is not None:
+                place = group_places[group]
+                for position, name in enumerate(GEOGRAPHY_LEVELS[:GEOGRAPHY_LEVELS.index(level) + 1]):
+                    row[name] = place[position]
+            if "status" in by:
+                row["status"] = status_keys[status_position]
+            if "month" in by:
+                row["month"] = format_month(int(month_keys[month_position]))
+            row["member_count"] = int(grouped[group, status_position, month_position])
+            rows.append(row)
+        rows.sort(key=lambda row: tuple(str(value) for key, value in row.items() if key != "member_count"))
+        
+        return {
+            "dimensions": list(by),
+            "total": int(cells.sum()),
+            "built_at": self.built_at,
+            "rows": rows
+        }
+    
+    def stats(self) -> dict:
+        data = self._data
+        return {
+            "enabled": self.enabled,
+            "ready": self.ready,
+            "built_at": self.built_at,
+            "build_ms": self.build_ms,
+            "places": len(data.place_keys) if data else 0,
+            "statuses": len(data.status_keys) if data else 0,
+            "months": data.month_count if data else 0,
+            "bytes": data.counts.nbytes if data else 0
+        }
+
+# Singleton instance
+geo_cube = GeoCube()
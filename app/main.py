@@ -1,44 +1,76 @@
-from fastapi import FastAPI, Depends, HTTPException, status, Query, UploadFile, File, Form
+from fastapi import FastAPI, Depends, HTTPException, status, Query, Body, UploadFile, File, Form, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from app.database import get_db, engine
-from app.models import Base, Admin, Member, Donation, Complaint, Gallery
+from fastapi.responses import StreamingResponse, RedirectResponse
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from app.database import get_async_db, get_read_db, get_read_session_factory, engine, async_engine, replica_engine, AsyncSessionLocal
+from app.pool_metrics import AdmissionControlMiddleware, DB_ADMISSION_CONTROL
+from app.migrations import check_schema_version
+from app.query_stats import QueryStatsMiddleware, endpoint_query_stats, QUERY_STATS_ENABLED
+from app.slow_queries import slow_query_log
+from app.dashboard_cache import dashboard_cache
+from app.geo_cube import geo_cube, parse_month, CUBE_DIMENSIONS
+from app.models import Admin, Member, Donation, Complaint, Gallery
 from app.schemas import (
-    AdminLogin, Token, AdminResponse, DashboardSummary, MonthlyTrend, DistrictDistribution,
+    AdminLogin, Token, AdminResponse, DashboardSummary, MonthlyTrend, DistrictDistribution, DashboardOverview,
     MembersSummary, MembersList, MemberResponse, MemberFilters, MemberStatus,
     DonationsSummary, DonationsList, DonationResponse, DonationFilters, DonationStatus,
     ComplaintsSummary, ComplaintsList, ComplaintResponse, ComplaintFilters, ComplaintStatus, ComplaintType, ComplaintStatusUpdate,
-    GallerySummary, GalleryList, GalleryResponse, GalleryFilters, MediaType, GalleryCreate, GalleryUpdate
+    GallerySummary, GalleryList, GalleryResponse, GalleryFilters, MediaType, GalleryCreate, GalleryUpdate,
+    ExportJobCreate, ExportJobResponse, ExportFormat
 )
-from app.auth import authenticate_admin, create_access_token, blacklist_token
-from app.deps import get_current_admin, security
-from app.dashboard import get_dashboard_summary, get_monthly_trends, get_district_distribution
+from app.auth import (
+    authenticate_admin, create_access_token, blacklist_token, purge_expired_tokens, principal_cache,
+    decode_token, get_token_jti, is_token_blacklisted
+)
+from app.revocation import revocation_cache, REVOCATION_PURGE_INTERVAL_SECONDS
+from app.deps import get_current_admin, get_stream_token, security
+from app.rollups import record_created
+from app.events import event_broker, queue_event, EVENT_HEARTBEAT_SECONDS
+from app.formats import MEMBERSHIP_ID_PREFIX
+from app.pagination import paginate, decode_cursor
+from app.counts import count_rows, COUNT_MODES
+from app.exports import export_response, file_response, get_missing_dependency, EXPORT_FORMATS
+from app.export_jobs import (
+    export_worker, create_export_job, get_export_job, describe_export_job, get_export_filename
+)
+from app.s3_storage import get_s3_storage
+from app.dashboard import get_dashboard_section, get_dashboard_overview, DASHBOARD_SECTIONS, TREND_GRANULARITIES
 from app.members import (
-    get_members_summary, get_members_list, approve_member, reject_member,
-    get_member_by_id, export_members_csv, get_filter_options
+    get_members_list, approve_member, reject_member,
+    get_member_by_id, get_members_export, get_filter_options
 )
 from app.donations import (
-    get_donations_summary, get_donations_list, verify_donation, acknowledge_donation,
-    get_donation_by_id, export_donations_csv
+    get_donations_list, verify_donation, acknowledge_donation,
+    get_donation_by_id, get_donations_export
 )
 from app.complaints import (
-    get_complaints_summary, get_complaints_list, get_complaint_by_id,
-    update_complaint_status, export_complaints_csv
+    get_complaints_list, get_complaint_by_id,
+    update_complaint_status, get_complaints_export
 )
 from app.gallery import (
-    get_gallery_summary, get_gallery_list, create_gallery_item, get_gallery_item_by_id,
+    get_gallery_list, create_gallery_item, get_gallery_item_by_id,
     update_gallery_item, delete_gallery_item
 )
 from app.public.routes import router as public_router
 from typing import List, Optional
+import asyncio
 import os
-
-# Create tables
-Base.metadata.create_all(bind=engine)
+import time
 
 app = FastAPI(title="Admin Dashboard API")
 
+# Shed load with 503 + Retry-After once the connection pool queue gets too long
+# (added before CORS so rejected responses still carry CORS headers)
+if DB_ADMISSION_CONTROL:
+    app.add_middleware(AdmissionControlMiddleware, read_engine=replica_engine, write_engine=async_engine)
+
+# SQL statement count and database time per request, as Server-Timing headers
+if QUERY_STATS_ENABLED:
+    app.add_middleware(QueryStatsMiddleware)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -51,9 +83,72 @@ app.add_middleware(
 # Include public routes
 app.include_router(public_router)
 
+@app.on_event("startup")
+async def check_database_schema():
+    """Verify the schema version (one query) and apply pending migrations if allowed"""
+    await check_schema_version(async_engine, engine)
+
+@app.on_event("startup")
+async def load_revocation_cache():
+    """Warm the token revocation cache from token_blacklist"""
+    if revocation_cache.enabled:
+        async with AsyncSessionLocal() as db:
+            await revocation_cache.load(db)
+
+async def purge_token_blacklist_periodically():
+    while True:
+        await asyncio.sleep(REVOCATION_PURGE_INTERVAL_SECONDS)
+        try:
+            async with AsyncSessionLocal() as db:
+                await purge_expired_tokens(db)
+        except Exception as e:
+            print(f"Failed to purge expired tokens: {str(e)}")
+
+@app.on_event("startup")
+async def start_token_blacklist_purge():
+    """Keep token_blacklist bounded to tokens that have not expired yet"""
+    app.state.token_purge_task = asyncio.create_task(purge_token_blacklist_periodically())
+
+@app.on_event("shutdown")
+async def stop_token_blacklist_purge():
+    app.state.token_purge_task.cancel()
+
+@app.on_event("startup")
+async def start_event_listener():
+    """Receive the dashboard events of every worker (PostgreSQL LISTEN/NOTIFY)"""
+    if async_engine.dialect.name == "postgresql":
+        app.state.event_listener_task = asyncio.create_task(event_broker.listen(async_engine.url))
+
+@app.on_event("shutdown")
+async def stop_event_listener():
+    if async_engine.dialect.name == "postgresql":
+        app.state.event_listener_task.cancel()
+
+@app.on_event("startup")
+async def start_geo_cube():
+    """Build the geography cube in the background and refresh it periodically"""
+    if geo_cube.enabled:
+        app.state.geo_cube_task = asyncio.create_task(geo_cube.maintain())
+
+@app.on_event("shutdown")
+async def stop_geo_cube():
+    if geo_cube.enabled:
+        app.state.geo_cube_task.cancel()
+
+@app.on_event("startup")
+async def start_export_worker():
+    """Run queued background exports in this process"""
+    if export_worker.enabled:
+        app.state.export_worker_task = asyncio.create_task(export_worker.maintain())
+
+@app.on_event("shutdown")
+async def stop_export_worker():
+    if export_worker.enabled:
+        app.state.export_worker_task.cancel()
+
 @app.post("/admin/login", response_model=Token)
-async def admin_login(admin_data: AdminLogin, db: Session = Depends(get_db)):
-    admin = authenticate_admin(db, admin_data.email, admin_data.password)
+async def admin_login(admin_data: AdminLogin, db: AsyncSession = Depends(get_async_db)):
+    admin = await authenticate_admin(db, admin_data.email, admin_data.password)
     if not admin:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -66,55 +161,252 @@ async def admin_login(admin_data: AdminLogin, db: Session = Depends(get_db)):
 @app.post("/admin/logout")
 async def admin_logout(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     token = credentials.credentials
-    blacklist_token(db, token)
+    await blacklist_token(db, token)
     return {"message": "Successfully logged out"}
 
 @app.get("/admin/dashboard", response_model=AdminResponse)
 async def admin_dashboard(current_admin: Admin = Depends(get_current_admin)):
     return current_admin
 
+@app.get("/admin/auth/cache-stats")
+async def auth_cache_stats(current_admin: Admin = Depends(get_current_admin)):
+    """Get hit/miss counters for the authentication caches"""
+    return {
+        "principal_cache": principal_cache.stats(),
+        "revocation_cache": revocation_cache.stats()
+    }
+
+@app.get("/admin/system/dashboard-cache")
+async def dashboard_cache_stats(current_admin: Admin = Depends(get_current_admin)):
+    """Get hit/miss counters for the dashboard aggregate cache"""
+    return dashboard_cache.stats()
+
+@app.delete("/admin/system/dashboard-cache")
+async def clear_dashboard_cache(current_admin: Admin = Depends(get_current_admin)):
+    """Drop every cached dashboard aggregate"""
+    dashboard_cache.clear()
+    return {"message": "Dashboard cache cleared"}
+
+@app.get("/admin/system/pool")
+async def pool_stats(current_admin: Admin = Depends(get_current_admin)):
+    """Get connection pool usage and checkout wait histograms"""
+    stats = {"primary": async_engine.sync_engine.pool.stats()}
+    if replica_engine is not async_engine:
+        stats["replica"] = replica_engine.sync_engine.pool.stats()
+    return stats
+
+@app.get("/admin/system/query-stats")
+async def query_stats(current_admin: Admin = Depends(get_current_admin)):
+    """Get SQL statement counts and database time per endpoint"""
+    return endpoint_query_stats.stats()
+
+@app.get("/admin/system/slow-queries")
+async def slow_queries(
+    limit: int = Query(50, ge=1, le=1000),
+    current_admin: Admin = Depends(get_current_admin)
+):
+    """Get the most recent slow statements with their query plans"""
+    return {
+        **slow_query_log.stats(),
+        "entries": slow_query_log.entries(limit)
+    }
+
+@app.delete("/admin/system/slow-queries")
+async def clear_slow_queries(current_admin: Admin = Depends(get_current_admin)):
+    """Empty the slow-query log"""
+    slow_query_log.clear()
+    return {"message": "Slow-query log cleared"}
+
 # Dashboard APIs
-@app.get("/admin/dashboard/summary", response_model=DashboardSummary)
-async def dashboard_summary(
-    current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+def validate_trend_params(months: int, granularity: str):
+    if months < 1 or months > 12:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Months must be between 1 and 12"
+        )
+    if granularity not in TREND_GRANULARITIES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Granularity must be one of: {', '.join(TREND_GRANULARITIES)}"
+        )
+
+def validate_cursor(cursor: Optional[str]) -> Optional[str]:
+    if cursor:
+        try:
+            decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor"
+            )
+    return cursor
+
+def validate_count_mode(count: Optional[str]) -> Optional[str]:
+    if count and count not in COUNT_MODES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Count must be one of: {', '.join(COUNT_MODES)}"
+        )
+    return count
+
+def validate_export_format(export_format: ExportFormat) -> str:
+    missing = get_missing_dependency(export_format.value)
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail=f"{export_format.value} exports need the {missing} package installed on the server"
+        )
+    return export_format.value
+
+@app.get("/admin/dashboard/overview", response_model=DashboardOverview, response_model_exclude_unset=True)
+async def dashboard_overview(
+    sections: Optional[str] = Query(None, description="Comma-separated sections to include (default: all)"),
+    months: int = 6,
+    granularity: str = "month",
+    current_admin: Admin = Depends(get_current_admin)
 ):
+    """Get every admin home page section in one response, computed concurrently"""
+    if sections:
+        requested = list(dict.fromkeys(section.strip() for section in sections.split(",") if section.strip()))
+    else:
+        requested = list(DASHBOARD_SECTIONS)
+    unknown = [section for section in requested if section not in DASHBOARD_SECTIONS]
+    if unknown or not requested:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Sections must be chosen from: {', '.join(DASHBOARD_SECTIONS)}"
+        )
+    validate_trend_params(months, granularity)
+    return await get_dashboard_overview(requested, months, granularity)
+
+@app.get("/admin/dashboard/summary", response_model=DashboardSummary)
+async def dashboard_summary(current_admin: Admin = Depends(get_current_admin)):
     """Get dashboard summary metrics"""
-    return get_dashboard_summary(db)
+    return await get_dashboard_section("summary")
 
 @app.get("/admin/dashboard/monthly-trends", response_model=List[MonthlyTrend])
 async def monthly_trends(
     months: int = 6,
-    current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    granularity: str = "month",
+    current_admin: Admin = Depends(get_current_admin)
 ):
-    """Get monthly trends for last N months"""
-    if months < 1 or months > 12:
+    """Get trends for the last N calendar months, bucketed by day, week or month"""
+    validate_trend_params(months, granularity)
+    return await get_dashboard_section("monthly_trends", months, granularity)
+
+@app.get("/admin/dashboard/district-distribution", response_model=List[DistrictDistribution])
+async def district_distribution(current_admin: Admin = Depends(get_current_admin)):
+    """Get member distribution by district"""
+    return await get_dashboard_section("district_distribution")
+
+@app.get("/admin/events")
+async def dashboard_events(request: Request, token: str = Depends(get_stream_token)):
+    """Stream dashboard changes as Server-Sent Events.
+    
+    Open the stream, then fetch the summaries (e.g. /admin/dashboard/overview)
+    and apply the `deltas` of each event to them. Refetch on a `resync` event.
+    The stream ends when the token expires or is revoked (checked against the
+    database every EVENT_HEARTBEAT_SECONDS, so logouts on other workers count).
+    """
+    payload = decode_token(token)
+    jti = get_token_jti(payload, token)
+    last_event_id = request.headers.get("last-event-id")
+    
+    async def is_revoked() -> bool:
+        # A session of its own, held only for the check
+        async with AsyncSessionLocal() as db:
+            return await is_token_blacklisted(db, jti)
+    
+    async def stream():
+        queue = event_broker.subscribe(last_event_id)
+        checked_at = time.monotonic()
+        try:
+            yield "retry: 5000\n\n"
+            while True:
+                remaining = payload["exp"] - time.time()
+                if remaining <= 0 or revocation_cache.revoked(jti):
+                    break
+                if time.monotonic() - checked_at >= EVENT_HEARTBEAT_SECONDS:
+                    if await is_revoked():
+                        break
+                    checked_at = time.monotonic()
+                try:
+                    yield await asyncio.wait_for(queue.get(), timeout=min(EVENT_HEARTBEAT_SECONDS, remaining))
+                except asyncio.TimeoutError:
+                    # Comment line, keeps proxies from closing an idle connection
+                    yield ": heartbeat\n\n"
+        finally:
+            event_broker.unsubscribe(queue)
+    
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.get("/admin/system/events")
+async def event_stats(current_admin: Admin = Depends(get_current_admin)):
+    """Get live event subscriber and publish counters"""
+    return event_broker.stats()
+
+# Analytics APIs
+@app.get("/admin/analytics/geography")
+async def geography_analytics(
+    state: Optional[str] = Query(None, description="Filter by state"),
+    district: Optional[str] = Query(None, description="Filter by district"),
+    mandal: Optional[str] = Query(None, description="Filter by mandal"),
+    member_status: Optional[MemberStatus] = Query(None, alias="status", description="Filter by member status"),
+    month_from: Optional[str] = Query(None, description="First month (YYYY-MM)"),
+    month_to: Optional[str] = Query(None, description="Last month (YYYY-MM)"),
+    by: Optional[str] = Query(None, description="Comma-separated: state, district, mandal, status, month (default: one level below the filters)"),
+    current_admin: Admin = Depends(get_current_admin)
+):
+    """Drill down member counts by geography, status and month, answered from memory"""
+    if not geo_cube.ready:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Geography cube is still loading",
+            headers={"Retry-After": "5"}
+        )
+    dimensions = None
+    if by:
+        dimensions = tuple(dict.fromkeys(dimension.strip() for dimension in by.split(",") if dimension.strip()))
+        if not dimensions or any(dimension not in CUBE_DIMENSIONS for dimension in dimensions):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Dimensions must be chosen from: {', '.join(CUBE_DIMENSIONS)}"
+            )
+    try:
+        months = [parse_month(value) if value else None for value in (month_from, month_to)]
+    except ValueError:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Months must be between 1 and 12"
+            detail="Months must be formatted as YYYY-MM"
         )
-    return get_monthly_trends(db, months)
+    return geo_cube.query(
+        state=state, district=district, mandal=mandal, status=member_status.value if member_status else None,
+        month_from=months[0], month_to=months[1], by=dimensions
+    )
 
-@app.get("/admin/dashboard/district-distribution", response_model=List[DistrictDistribution])
-async def district_distribution(
-    current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
-):
-    """Get member distribution by district"""
-    return get_district_distribution(db)
+@app.get("/admin/system/geo-cube")
+async def geo_cube_stats(current_admin: Admin = Depends(get_current_admin)):
+    """Get size and build time of the geography cube"""
+    return geo_cube.stats()
+
+@app.post("/admin/system/geo-cube/rebuild")
+async def rebuild_geo_cube(current_admin: Admin = Depends(get_current_admin)):
+    """Reload the geography cube, e.g. after loading members outside the API"""
+    await geo_cube.build()
+    return geo_cube.stats()
 
 # Members Module APIs
 @app.get("/admin/members/summary", response_model=MembersSummary)
-async def members_summary(
-    current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
-):
+async def members_summary(current_admin: Admin = Depends(get_current_admin)):
     """Get members summary for dashboard cards"""
-    return get_members_summary(db)
+    return await get_dashboard_section("members")
 
 @app.get("/admin/members", response_model=MembersList)
 async def members_list(
@@ -125,8 +417,10 @@ async def members_list(
     status: Optional[MemberStatus] = Query(None, description="Filter by status"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(10, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor / prev_cursor from a previous page; replaces page"),
+    count: Optional[str] = Query(None, description="Total count mode: exact, cached, estimated or capped"),
     current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get paginated members list with search and filters"""
     filters = MemberFilters(
@@ -136,9 +430,11 @@ async def members_list(
         mandal=mandal,
         status=status,
         page=page,
-        limit=limit
+        limit=limit,
+        cursor=validate_cursor(cursor),
+        count_mode=validate_count_mode(count)
     )
-    return get_members_list(db, filters)
+    return await get_members_list(db, filters)
 
 @app.get("/admin/members/export")
 async def export_members(
@@ -147,10 +443,11 @@ async def export_members(
     district: Optional[str] = Query(None),
     mandal: Optional[str] = Query(None),
     status: Optional[MemberStatus] = Query(None),
+    export_format: ExportFormat = Query(ExportFormat.csv, alias="format", description="csv, parquet, ndjson.gz or ndjson.zst"),
     current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    session_factory = Depends(get_read_session_factory)
 ):
-    """Export filtered members as CSV"""
+    """Export filtered members as CSV, Parquet or compressed NDJSON"""
     filters = MemberFilters(
         search=search,
         state=state,
@@ -160,24 +457,24 @@ async def export_members(
         page=1,
         limit=999999
     )
-    return export_members_csv(db, filters)
+    return export_response(session_factory, get_members_export(filters), validate_export_format(export_format))
 
 @app.get("/admin/members/filter-options")
 async def members_filter_options(
     current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get available filter options for dropdowns"""
-    return get_filter_options(db)
+    return await get_filter_options(db)
 
 @app.get("/admin/members/{member_id}", response_model=MemberResponse)
 async def member_details(
     member_id: int,
     current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get member details by ID"""
-    member = get_member_by_id(db, member_id)
+    member = await get_member_by_id(db, member_id)
     if not member:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -189,10 +486,10 @@ async def member_details(
 async def approve_member_action(
     member_id: int,
     current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Approve a member"""
-    member = approve_member(db, member_id)
+    member = await approve_member(db, member_id)
     if not member:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -204,10 +501,10 @@ async def approve_member_action(
 async def reject_member_action(
     member_id: int,
     current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Reject a member"""
-    member = reject_member(db, member_id)
+    member = await reject_member(db, member_id)
     if not member:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -222,46 +519,52 @@ async def get_member_applications(
     status: Optional[str] = Query(None),
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    count: Optional[str] = Query(None),
     current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get member applications list"""
     from app.models import MemberApplication
     
-    query = db.query(MemberApplication)
+    conditions = []
     
     if status:
-        query = query.filter(MemberApplication.status == status)
+        conditions.append(MemberApplication.status == status)
     
-    total = query.count()
-    offset = (page - 1) * limit
-    applications = query.order_by(MemberApplication.created_at.desc()).offset(offset).limit(limit).all()
+    applications_count = await count_rows(
+        db, "member_applications", MemberApplication, conditions, {"status": status}, validate_count_mode(count)
+    )
+    applications = await paginate(db, MemberApplication, conditions, page, limit, validate_cursor(cursor))
     
     return {
-        "applications": applications,
-        "total": total,
-        "page": page,
+        "applications": applications.items,
+        "total": applications_count.total,
+        "total_is_exact": applications_count.exact,
+        "page": applications.page,
         "limit": limit,
-        "total_pages": (total + limit - 1) // limit
+        "total_pages": (applications_count.total + limit - 1) // limit,
+        "next_cursor": applications.next_cursor,
+        "prev_cursor": applications.prev_cursor
     }
 
 @app.post("/admin/member-applications/{application_id}/approve")
 async def approve_member_application(
     application_id: int,
     current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Approve member application and create member"""
     from app.models import MemberApplication, Member
     import uuid
     
-    application = db.query(MemberApplication).filter(MemberApplication.id == application_id).first()
+    application = await db.get(MemberApplication, application_id)
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
     
     # Create member from application
     member = Member(
-        membership_id=f"MEM{str(uuid.uuid4())[:8].upper()}",
+        membership_id=f"{MEMBERSHIP_ID_PREFIX}{str(uuid.uuid4())[:8].upper()}",
         name=application.full_name,
         phone=application.phone_number,
         email=application.email_address or "",
@@ -273,8 +576,14 @@ async def approve_member_application(
     )
     
     db.add(member)
+    old_status = application.status
     application.status = "approved"
-    db.commit()
+    queue_event(db, "member_application.status_changed", {
+        "id": application.id, "status": "approved", "old_status": old_status, "deltas": {}
+    })
+    await record_created(db, member)
+    await db.commit()
+    dashboard_cache.invalidate("members", "member_applications")
     
     return {"message": "Member application approved", "member_id": member.id}
 
@@ -282,28 +591,30 @@ async def approve_member_application(
 async def reject_member_application(
     application_id: int,
     current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Reject member application"""
     from app.models import MemberApplication
     
-    application = db.query(MemberApplication).filter(MemberApplication.id == application_id).first()
+    application = await db.get(MemberApplication, application_id)
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
     
+    old_status = application.status
     application.status = "rejected"
-    db.commit()
+    queue_event(db, "member_application.status_changed", {
+        "id": application.id, "status": "rejected", "old_status": old_status, "deltas": {}
+    })
+    await db.commit()
+    dashboard_cache.invalidate("member_applications")
     
     return {"message": "Member application rejected"}
 
 # Donations Module APIs
 @app.get("/admin/donations/summary", response_model=DonationsSummary)
-async def donations_summary(
-    current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
-):
+async def donations_summary(current_admin: Admin = Depends(get_current_admin)):
     """Get donations summary for dashboard cards"""
-    return get_donations_summary(db)
+    return await get_dashboard_section("donations")
 
 @app.get("/admin/donations", response_model=DonationsList)
 async def donations_list(
@@ -311,26 +622,47 @@ async def donations_list(
     status: Optional[DonationStatus] = Query(None, description="Filter by donation status"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(10, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor / prev_cursor from a previous page; replaces page"),
+    count: Optional[str] = Query(None, description="Total count mode: exact, cached, estimated or capped"),
     current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get paginated donations list with search and filters"""
     filters = DonationFilters(
         search=search,
         status=status,
         page=page,
-        limit=limit
+        limit=limit,
+        cursor=validate_cursor(cursor),
+        count_mode=validate_count_mode(count)
+    )
+    return await get_donations_list(db, filters)
+
+@app.get("/admin/donations/export")
+async def export_donations(
+    search: Optional[str] = Query(None),
+    status: Optional[DonationStatus] = Query(None),
+    export_format: ExportFormat = Query(ExportFormat.csv, alias="format", description="csv, parquet, ndjson.gz or ndjson.zst"),
+    current_admin: Admin = Depends(get_current_admin),
+    session_factory = Depends(get_read_session_factory)
+):
+    """Export filtered donations as CSV, Parquet or compressed NDJSON"""
+    filters = DonationFilters(
+        search=search,
+        status=status,
+        page=1,
+        limit=999999  # Export all matching records
     )
-    return get_donations_list(db, filters)
+    return export_response(session_factory, get_donations_export(filters), validate_export_format(export_format))
 
 @app.get("/admin/donations/{donation_id}", response_model=DonationResponse)
 async def donation_details(
     donation_id: int,
     current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get donation details by ID"""
-    donation = get_donation_by_id(db, donation_id)
+    donation = await get_donation_by_id(db, donation_id)
     if not donation:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -342,10 +674,10 @@ async def donation_details(
 async def verify_donation_action(
     donation_id: int,
     current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Verify a donation"""
-    donation = verify_donation(db, donation_id)
+    donation = await verify_donation(db, donation_id)
     if not donation:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -357,10 +689,10 @@ async def verify_donation_action(
 async def acknowledge_donation_action(
     donation_id: int,
     current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Acknowledge a donation"""
-    donation = acknowledge_donation(db, donation_id)
+    donation = await acknowledge_donation(db, donation_id)
     if not donation:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -368,30 +700,11 @@ async def acknowledge_donation_action(
         )
     return donation
 
-@app.get("/admin/donations/export")
-async def export_donations(
-    search: Optional[str] = Query(None),
-    status: Optional[DonationStatus] = Query(None),
-    current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
-):
-    """Export filtered donations as CSV"""
-    filters = DonationFilters(
-        search=search,
-        status=status,
-        page=1,
-        limit=999999  # Export all matching records
-    )
-    return export_donations_csv(db, filters)
-
 # Complaints Module APIs
 @app.get("/admin/complaints/summary", response_model=ComplaintsSummary)
-async def complaints_summary(
-    current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
-):
+async def complaints_summary(current_admin: Admin = Depends(get_current_admin)):
     """Get complaints summary for dashboard cards"""
-    return get_complaints_summary(db)
+    return await get_dashboard_section("complaints")
 
 @app.get("/admin/complaints", response_model=ComplaintsList)
 async def complaints_list(
@@ -400,8 +713,10 @@ async def complaints_list(
     type: Optional[ComplaintType] = Query(None, description="Filter by complaint type"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(10, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor / prev_cursor from a previous page; replaces page"),
+    count: Optional[str] = Query(None, description="Total count mode: exact, cached, estimated or capped"),
     current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get paginated complaints list with search and filters"""
     filters = ComplaintFilters(
@@ -409,18 +724,39 @@ async def complaints_list(
         status=status,
         type=type,
         page=page,
-        limit=limit
+        limit=limit,
+        cursor=validate_cursor(cursor),
+        count_mode=validate_count_mode(count)
     )
-    return get_complaints_list(db, filters)
+    return await get_complaints_list(db, filters)
+
+@app.get("/admin/complaints/export")
+async def export_complaints(
+    search: Optional[str] = Query(None),
+    status: Optional[ComplaintStatus] = Query(None),
+    type: Optional[ComplaintType] = Query(None),
+    export_format: ExportFormat = Query(ExportFormat.csv, alias="format", description="csv, parquet, ndjson.gz or ndjson.zst"),
+    current_admin: Admin = Depends(get_current_admin),
+    session_factory = Depends(get_read_session_factory)
+):
+    """Export filtered complaints as CSV, Parquet or compressed NDJSON"""
+    filters = ComplaintFilters(
+        search=search,
+        status=status,
+        type=type,
+        page=1,
+        limit=999999  # Export all matching records
+    )
+    return export_response(session_factory, get_complaints_export(filters), validate_export_format(export_format))
 
 @app.get("/admin/complaints/{complaint_id}", response_model=ComplaintResponse)
 async def complaint_details(
     complaint_id: int,
     current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get complaint details by ID"""
-    complaint = get_complaint_by_id(db, complaint_id)
+    complaint = await get_complaint_by_id(db, complaint_id)
     if not complaint:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -433,10 +769,10 @@ async def update_complaint_status_action(
     complaint_id: int,
     status_update: ComplaintStatusUpdate,
     current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update complaint status and admin notes"""
-    complaint = update_complaint_status(db, complaint_id, status_update)
+    complaint = await update_complaint_status(db, complaint_id, status_update)
     if not complaint:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -444,48 +780,92 @@ async def update_complaint_status_action(
         )
     return complaint
 
-@app.get("/admin/complaints/export")
-async def export_complaints(
-    search: Optional[str] = Query(None),
-    status: Optional[ComplaintStatus] = Query(None),
-    type: Optional[ComplaintType] = Query(None),
+# Export Job APIs
+@app.post("/admin/exports", response_model=ExportJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def queue_export(
+    job: ExportJobCreate = Body(..., discriminator="kind"),
     current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Export filtered complaints as CSV"""
-    filters = ComplaintFilters(
-        search=search,
-        status=status,
-        type=type,
-        page=1,
-        limit=999999  # Export all matching records
+    """Queue an export of members, donations or complaints, filtered like the list"""
+    export_job = await create_export_job(db, job.kind, validate_export_format(job.format), job.filters, current_admin.id)
+    return describe_export_job(export_job)
+
+@app.get("/admin/exports/{job_id}", response_model=ExportJobResponse)
+async def export_status(
+    job_id: str,
+    current_admin: Admin = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Get an export job's status and progress"""
+    export_job = await get_export_job(db, job_id)
+    if not export_job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Export not found"
+        )
+    return describe_export_job(export_job)
+
+@app.get("/admin/exports/{job_id}/download")
+async def download_export(
+    job_id: str,
+    request: Request,
+    current_admin: Admin = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Download a finished export; supports Range requests to resume"""
+    export_job = await get_export_job(db, job_id)
+    if not export_job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Export not found"
+        )
+    if export_job.status != "completed":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Export is {export_job.status}"
+        )
+    filename = get_export_filename(export_job)
+    if export_job.location.startswith("https://"):
+        # S3 serves the file, Range requests included
+        url = await run_in_threadpool(lambda: get_s3_storage().get_download_url(export_job.location, filename))
+        return RedirectResponse(url, status_code=status.HTTP_307_TEMPORARY_REDIRECT)
+    if not os.path.exists(export_job.location):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Export file is not on this server"
+        )
+    return file_response(
+        export_job.location, filename, f'"{export_job.id}"',
+        request.headers.get("range"), request.headers.get("if-range"),
+        EXPORT_FORMATS[export_job.format].media_type
     )
-    return export_complaints_csv(db, filters)
 
 # Gallery Module APIs
 @app.get("/admin/gallery/summary", response_model=GallerySummary)
-async def gallery_summary(
-    current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
-):
+async def gallery_summary(current_admin: Admin = Depends(get_current_admin)):
     """Get gallery summary for overview"""
-    return get_gallery_summary(db)
+    return await get_dashboard_section("gallery")
 
 @app.get("/admin/gallery", response_model=GalleryList)
 async def gallery_list(
     media_type: Optional[MediaType] = Query(None, description="Filter by media type"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(10, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor / prev_cursor from a previous page; replaces page"),
+    count: Optional[str] = Query(None, description="Total count mode: exact, cached, estimated or capped"),
     current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get paginated gallery list with filters"""
     filters = GalleryFilters(
         media_type=media_type,
         page=page,
-        limit=limit
+        limit=limit,
+        cursor=validate_cursor(cursor),
+        count_mode=validate_count_mode(count)
     )
-    return get_gallery_list(db, filters)
+    return await get_gallery_list(db, filters)
 
 @app.post("/admin/gallery", response_model=GalleryResponse)
 async def create_gallery(
@@ -493,20 +873,20 @@ async def create_gallery(
     description: Optional[str] = Form(None),
     file: UploadFile = File(...),
     current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create new gallery item with file upload"""
     gallery_data = GalleryCreate(title=title, description=description)
-    return create_gallery_item(db, gallery_data, file)
+    return await create_gallery_item(db, gallery_data, file)
 
 @app.get("/admin/gallery/{item_id}", response_model=GalleryResponse)
 async def gallery_item_details(
     item_id: int,
     current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get gallery item details by ID"""
-    item = get_gallery_item_by_id(db, item_id)
+    item = await get_gallery_item_by_id(db, item_id)
     if not item:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -521,11 +901,11 @@ async def update_gallery(
     description: Optional[str] = Form(None),
     file: Optional[UploadFile] = File(None),
     current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update gallery item"""
     gallery_data = GalleryUpdate(title=title, description=description)
-    item = update_gallery_item(db, item_id, gallery_data, file)
+    item = await update_gallery_item(db, item_id, gallery_data, file)
     if not item:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -537,10 +917,10 @@ async def update_gallery(
 async def delete_gallery(
     item_id: int,
     current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete gallery item"""
-    success = delete_gallery_item(db, item_id)
+    success = await delete_gallery_item(db, item_id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,17 +1,24 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func, or_, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, or_, and_
 from app.models import Member, MemberStatus
 from app.schemas import MembersSummary, MembersList, MemberResponse, MemberFilters
+from app.rollups import change_status
+from app.dashboard_cache import dashboard_cache
+from app.search import plan_member_search
+from app.pagination import paginate
+from app.counts import count_rows
+from app.exports import ExportSpec, format_timestamp
 from typing import List, Optional
-import csv
-import io
-from fastapi.responses import StreamingResponse
 
-def get_members_summary(db: Session) -> MembersSummary:
+async def get_members_summary(db: AsyncSession) -> MembersSummary:
     """Get members summary for dashboard cards"""
-    total_members = db.query(Member).count()
-    approved_members = db.query(Member).filter(Member.status == "approved").count()
-    pending_members = db.query(Member).filter(Member.status == "pending").count()
+    total_members = await db.scalar(select(func.count()).select_from(Member))
+    approved_members = await db.scalar(
+        select(func.count()).select_from(Member).where(Member.status == "approved")
+    )
+    pending_members = await db.scalar(
+        select(func.count()).select_from(Member).where(Member.status == "pending")
+    )
     
     return MembersSummary(
         total_members=total_members,
@@ -19,149 +26,109 @@ def get_members_summary(db: Session) -> MembersSummary:
         pending_members=pending_members
     )
 
-def get_members_list(db: Session, filters: MemberFilters) -> MembersList:
-    """Get paginated members list with filters"""
-    query = db.query(Member)
+def get_member_conditions(filters: MemberFilters, dialect: str) -> tuple:
+    """Build WHERE conditions shared by the members list and export, plus the search ranking"""
+    conditions = []
+    ranking = []
     
     # Apply search filters
     if filters.search:
-        search_term = f"%{filters.search}%"
-        query = query.filter(
-            or_(
-                Member.name.ilike(search_term),
-                Member.membership_id.ilike(search_term),
-                Member.phone.ilike(search_term),
-                Member.email.ilike(search_term),
-                Member.aadhaar.ilike(search_term)
-            )
-        )
+        search = plan_member_search(filters.search, dialect)
+        conditions.append(search.condition)
+        ranking = search.order_by
     
     # Apply dropdown filters
     if filters.state:
-        query = query.filter(Member.state == filters.state)
+        conditions.append(Member.state == filters.state)
     
     if filters.district:
-        query = query.filter(Member.district == filters.district)
+        conditions.append(Member.district == filters.district)
     
     if filters.mandal:
-        query = query.filter(Member.mandal == filters.mandal)
+        conditions.append(Member.mandal == filters.mandal)
     
     if filters.status:
-        query = query.filter(Member.status == filters.status)
+        conditions.append(Member.status == filters.status)
+    
+    return conditions, ranking
+
+async def get_members_list(db: AsyncSession, filters: MemberFilters) -> MembersList:
+    """Get paginated members list with filters"""
+    conditions, ranking = get_member_conditions(filters, db.get_bind().dialect.name)
     
-    # Get total count before pagination
-    total = query.count()
+    # Get total count before pagination, in the list's count mode
+    count = await count_rows(db, "members", Member, conditions, filters.model_dump(), filters.count_mode)
     
     # Apply pagination
-    offset = (filters.page - 1) * filters.limit
-    members = query.order_by(Member.created_at.desc()).offset(offset).limit(filters.limit).all()
+    page = await paginate(db, Member, conditions, filters.page, filters.limit, filters.cursor, ranking)
     
     # Calculate total pages
-    total_pages = (total + filters.limit - 1) // filters.limit
+    total_pages = (count.total + filters.limit - 1) // filters.limit
     
     return MembersList(
-        members=[MemberResponse.from_orm(member) for member in members],
-        total=total,
-        page=filters.page,
+        members=[MemberResponse.from_orm(member) for member in page.items],
+        total=count.total,
+        total_is_exact=count.exact,
+        page=page.page,
         limit=filters.limit,
-        total_pages=total_pages
+        total_pages=total_pages,
+        next_cursor=page.next_cursor,
+        prev_cursor=page.prev_cursor
     )
 
-def approve_member(db: Session, member_id: int) -> Optional[Member]:
+async def approve_member(db: AsyncSession, member_id: int) -> Optional[Member]:
     """Approve a member"""
-    member = db.query(Member).filter(Member.id == member_id).first()
+    member = await db.get(Member, member_id)
     if member:
-        member.status = "approved"
-        db.commit()
-        db.refresh(member)
+        await change_status(db, member, "approved")
+        await db.commit()
+        dashboard_cache.invalidate("members")
+        await db.refresh(member)
     return member
 
-def reject_member(db: Session, member_id: int) -> Optional[Member]:
+async def reject_member(db: AsyncSession, member_id: int) -> Optional[Member]:
     """Reject a member"""
-    member = db.query(Member).filter(Member.id == member_id).first()
+    member = await db.get(Member, member_id)
     if member:
-        member.status = "rejected"
-        db.commit()
-        db.refresh(member)
+        await change_status(db, member, "rejected")
+        await db.commit()
+        dashboard_cache.invalidate("members")
+        await db.refresh(member)
     return member
 
-def get_member_by_id(db: Session, member_id: int) -> Optional[Member]:
+async def get_member_by_id(db: AsyncSession, member_id: int) -> Optional[Member]:
     """Get member details by ID"""
-    return db.query(Member).filter(Member.id == member_id).first()
+    return await db.get(Member, member_id)
 
-def export_members_csv(db: Session, filters: MemberFilters) -> StreamingResponse:
-    """Export filtered members as CSV"""
-    # Get all members matching filters (no pagination for export)
-    query = db.query(Member)
-    
-    # Apply same filters as get_members_list
-    if filters.search:
-        search_term = f"%{filters.search}%"
-        query = query.filter(
-            or_(
-                Member.name.ilike(search_term),
-                Member.membership_id.ilike(search_term),
-                Member.phone.ilike(search_term),
-                Member.email.ilike(search_term),
-                Member.aadhaar.ilike(search_term)
-            )
-        )
-    
-    if filters.state:
-        query = query.filter(Member.state == filters.state)
-    
-    if filters.district:
-        query = query.filter(Member.district == filters.district)
-    
-    if filters.mandal:
-        query = query.filter(Member.mandal == filters.mandal)
-    
-    if filters.status:
-        query = query.filter(Member.status == filters.status)
-    
-    members = query.order_by(Member.created_at.desc()).all()
-    
-    # Create CSV content
-    output = io.StringIO()
-    writer = csv.writer(output)
-    
-    # Write header
-    writer.writerow([
+def get_members_export(filters: MemberFilters) -> ExportSpec:
+    """Query and CSV columns of the members export"""
+    def build_statement(dialect: str):
+        conditions, _ = get_member_conditions(filters, dialect)
+        return select(
+            Member.membership_id, Member.name, Member.phone, Member.email, Member.aadhaar,
+            Member.state, Member.district, Member.mandal, Member.status, Member.created_at
+        ).where(*conditions).order_by(Member.created_at.desc())
+    
+    header = [
         'Membership ID', 'Name', 'Phone', 'Email', 'Aadhaar',
         'State', 'District', 'Mandal', 'Status', 'Registration Date'
-    ])
+    ]
     
-    # Write data
-    for member in members:
-        writer.writerow([
-            member.membership_id,
-            member.name,
-            member.phone,
-            member.email,
-            member.aadhaar,
-            member.state,
-            member.district,
-            member.mandal,
-            member.status,
-            member.created_at.strftime('%Y-%m-%d %H:%M:%S')
-        ])
+    def format_row(row) -> list:
+        return [*row[:-1], format_timestamp(row.created_at)]
     
-    output.seek(0)
-    
-    return StreamingResponse(
-        io.BytesIO(output.getvalue().encode('utf-8')),
-        media_type='text/csv',
-        headers={'Content-Disposition': 'attachment; filename=members_export.csv'}
-    )
+    return ExportSpec('members_export', header, build_statement, format_row)
 
-def get_filter_options(db: Session):
+async def get_filter_options(db: AsyncSession):
     """Get unique values for dropdown filters"""
-    states = db.query(Member.state).distinct().all()
-    districts = db.query(Member.district).distinct().all()
-    mandals = db.query(Member.mandal).distinct().all()
+    # Straight from members, not the geography cube: a place added since the
+    # cube's last rebuild by a bulk load or another worker must be selectable
+    states = await db.scalars(select(Member.state).distinct().order_by(Member.state))
+    districts = await db.scalars(select(Member.district).distinct().order_by(Member.district))
+    mandals = await db.scalars(select(Member.mandal).distinct().order_by(Member.mandal))
     
     return {
-        'states': [state[0] for state in states],
-        'districts': [district[0] for district in districts],
-        'mandals': [mandal[0] for mandal in mandals]
-    }
\ No newline at end of file
+        'states': states.all(),
+        'districts': districts.all(),
+        'mandals': mandals.all()
+    }
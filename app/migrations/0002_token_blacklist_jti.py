@@ -0,0 +1,38 @@
+"""
+Move token_blacklist from full JWT strings to jti + expiry
+(previously migrate_token_blacklist.py). No-op for databases created with jti.
+"""
+from datetime import datetime, timezone
+from jose import JWTError, jwt
+from sqlalchemy import inspect, text
+from app.models import TokenBlacklist
+from app.auth import SECRET_KEY, ALGORITHM, get_token_jti
+
+def upgrade(conn):
+    columns = [column["name"] for column in inspect(conn).get_columns("token_blacklist")]
+    if "jti" in columns:
+        return
+    
+    tokens = [row[0] for row in conn.execute(text("SELECT token FROM token_blacklist"))]
+    
+    # Keep only revocations for tokens that are still valid
+    now = datetime.now(timezone.utc)
+    rows = {}
+    for token in tokens:
+        try:
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM], options={"verify_exp": False})
+        except JWTError:
+            continue
+        expires_at = datetime.fromtimestamp(payload.get("exp", 0), tz=timezone.utc)
+        if expires_at > now:
+            rows[get_token_jti(payload, token)] = expires_at
+    
+    conn.execute(text("DROP TABLE token_blacklist"))
+    TokenBlacklist.__table__.create(bind=conn)
+    if rows:
+        conn.execute(
+            TokenBlacklist.__table__.insert(),
+            [{"jti": jti, "expires_at": expires_at} for jti, expires_at in rows.items()]
+        )
+    
+    print(f"token_blacklist migrated ({len(rows)} of {len(tokens)} revocations still active)")
@@ -0,0 +1,7 @@
+"""
+Fill the daily rollup tables from existing members, donations and complaints
+"""
+from app.rollups import rebuild_rollups
+
+def upgrade(conn):
+    rebuild_rollups(conn)
@@ -0,0 +1,151 @@
+"""
+Versioned schema migrations
+
+Each migration is either NNNN_name.sql in the folder for its dialect
+(postgresql/, sqlite/) or NNNN_name.py next to this file with an
+upgrade(conn) function, for changes that need Python and work on both.
+A dialect may skip versions it has nothing to do for. Applied versions are
+recorded in the schema_version table.
+
+Run: python -m app.migrations [upgrade|status]
+"""
+from collections import namedtuple
+from sqlalchemy import Table, Column, Integer, String, DateTime, MetaData, select, func, inspect
+from sqlalchemy.exc import DBAPIError
+from starlette.concurrency import run_in_threadpool
+import importlib.util
+import os
+import re
+import sqlite3
+
+MIGRATIONS_DIR = os.path.dirname(os.path.abspath(__file__))
+MIGRATION_FILE_PATTERN = re.compile(r"^(\d{4})_(\w+)\.(sql|py)$")
+
+# Apply pending migrations at startup; disable to migrate only as a deploy step
+DB_AUTO_MIGRATE = os.getenv("DB_AUTO_MIGRATE", "true").lower() == "true"
+
+# Serializes workers that start at the same time (PostgreSQL advisory lock key)
+MIGRATION_LOCK_ID = 720130008
+
+Migration = namedtuple("Migration", ["version", "name", "path"])
+
+schema_version = Table(
+    "schema_version",
+    MetaData(),
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("name", String(255), nullable=False),
+    Column("applied_at", DateTime(timezone=True), server_default=func.now())
+)
+
+def get_migrations(dialect: str) -> list:
+    """List migrations for a dialect ordered by version"""
+    migrations = {}
+    for folder, extension in ((os.path.join(MIGRATIONS_DIR, dialect), "sql"), (MIGRATIONS_DIR, "py")):
+        if not os.path.isdir(folder):
+            continue
+        for filename in os.listdir(folder):
+            match = MIGRATION_FILE_PATTERN.match(filename)
+            if not match or match.group(3) != extension:
+                continue
+            version = int(match.group(1))
+            if version in migrations:
+                raise RuntimeError(f"Duplicate migration version {version:04d}: {filename}")
+            migrations[version] = Migration(version, match.group(2), os.path.join(folder, filename))
+    return [migrations[version] for version in sorted(migrations)]
+
+def get_head_version(dialect: str) -> int:
+    migrations = get_migrations(dialect)
+    return migrations[-1].version if migrations else 0
+
+def get_current_version(conn):
+    """Latest applied version, or None when the database is not versioned yet.
+    
+    A single indexed MAX() query, cheap enough to run on every worker start.
+    """
+    try:
+        return conn.execute(select(func.max(schema_version.c.version))).scalar() or 0
+    except DBAPIError:
+        conn.rollback()
+        return None
+
+def split_sqlite_script(script: str) -> list:
+    """Split a script into statements, keeping trigger bodies together"""
+    statements = []
+    buffer = ""
+    for line in script.splitlines(keepends=True):
+        buffer += line
+        if sqlite3.complete_statement(buffer):
+            statements.append(buffer.strip())
+            buffer = ""
+    if buffer.strip():
+        statements.append(buffer.strip())
+    return statements
+
+def apply_migration(conn, migration: Migration):
+    if migration.path.endswith(".py"):
+        spec = importlib.util.spec_from_file_location(f"migration_{migration.version:04d}", migration.path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        module.upgrade(conn)
+        return
+    
+    with open(migration.path, encoding="utf-8") as f:
+        script = f.read()
+    if conn.dialect.name == "sqlite":
+        statements = split_sqlite_script(script)
+    else:
+        statements = [script]
+    for statement in statements:
+        # No bind parameters, so a literal % in the SQL is left alone
+        conn.exec_driver_sql(statement, execution_options={"no_parameters": True})
+
+def upgrade(engine) -> int:
+    """Apply pending migrations and return the resulting schema version"""
+    migrations = get_migrations(engine.dialect.name)
+    with engine.connect() as conn:
+        if conn.dialect.name == "postgresql":
+            conn.exec_driver_sql(f"SELECT pg_advisory_lock({MIGRATION_LOCK_ID})")
+            conn.commit()
+        try:
+            current = get_current_version(conn)
+            if current is None:
+                schema_version.create(conn, checkfirst=True)
+                # Databases created by create_all or database_schema*.sql already
+                # have the initial tables; adopt them as version 1
+                current = 1 if inspect(conn).has_table("admins") else 0
+                if current:
+                    conn.execute(schema_version.insert().values(version=1, name="initial_schema"))
+                conn.commit()
+            
+            for migration in migrations:
+                if migration.version <= current:
+                    continue
+                apply_migration(conn, migration)
+                conn.execute(schema_version.insert().values(version=migration.version, name=migration.name))
+                conn.commit()
+                current = migration.version
+                print(f"Applied migration {migration.version:04d}_{migration.name}")
+        finally:
+            if conn.dialect.name == "postgresql":
+                conn.rollback()
+                conn.exec_driver_sql(f"SELECT pg_advisory_unlock({MIGRATION_LOCK_ID})")
+                conn.commit()
+    return current
+
+async def check_schema_version(async_engine, sync_engine):
+    """Startup check: one version query, migrating only when the schema is behind"""
+    async with async_engine.connect() as conn:
+        current = await conn.run_sync(get_current_version)
+    head = get_head_version(async_engine.dialect.name)
+    if current is not None and current >= head:
+        if current > head:
+            print(f"Database schema version {current} is newer than this code ({head})")
+        return
+    
+    if not DB_AUTO_MIGRATE:
+        raise RuntimeError(
+            f"Database schema is at version {current or 0}, expected {head}. "
+            "Run: python -m app.migrations upgrade"
+        )
+    
+    await run_in_threadpool(upgrade, sync_engine)
@@ -0,0 +1,21 @@
+import sys
+from app.database import engine
+from app.migrations import upgrade, get_current_version, get_migrations
+
+def status():
+    with engine.connect() as conn:
+        current = get_current_version(conn)
+    print(f"Current schema version: {'unversioned' if current is None else current}")
+    for migration in get_migrations(engine.dialect.name):
+        state = "applied" if current is not None and migration.version <= current else "pending"
+        print(f"  {migration.version:04d}_{migration.name:<40} {state}")
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "upgrade"
+    if command == "upgrade":
+        print(f"Schema is at version {upgrade(engine)}")
+    elif command == "status":
+        status()
+    else:
+        print("Usage: python -m app.migrations [upgrade|status]")
+        sys.exit(1)
@@ -0,0 +1,21 @@
+-- Status and type columns are plain strings validated by the API; drop the
+-- CHECK constraints and enum types older databases were created with
+-- (previously done by hand with fix_enums.py)
+
+ALTER TABLE members DROP CONSTRAINT IF EXISTS members_status_check;
+ALTER TABLE member_applications DROP CONSTRAINT IF EXISTS member_applications_status_check;
+ALTER TABLE member_applications DROP CONSTRAINT IF EXISTS member_applications_gender_check;
+ALTER TABLE donations DROP CONSTRAINT IF EXISTS donations_status_check;
+ALTER TABLE donations DROP CONSTRAINT IF EXISTS donations_payment_method_check;
+ALTER TABLE complaints DROP CONSTRAINT IF EXISTS complaints_status_check;
+ALTER TABLE complaints DROP CONSTRAINT IF EXISTS complaints_type_check;
+ALTER TABLE gallery DROP CONSTRAINT IF EXISTS gallery_media_type_check;
+
+ALTER TABLE members ALTER COLUMN status TYPE VARCHAR(20);
+ALTER TABLE member_applications ALTER COLUMN status TYPE VARCHAR(20);
+ALTER TABLE member_applications ALTER COLUMN gender TYPE VARCHAR(10);
+ALTER TABLE donations ALTER COLUMN status TYPE VARCHAR(20);
+ALTER TABLE donations ALTER COLUMN payment_method TYPE VARCHAR(50);
+ALTER TABLE complaints ALTER COLUMN status TYPE VARCHAR(20);
+ALTER TABLE complaints ALTER COLUMN type TYPE VARCHAR(50);
+ALTER TABLE gallery ALTER COLUMN media_type TYPE VARCHAR(10);
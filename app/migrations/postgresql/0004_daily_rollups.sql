@@ -0,0 +1,27 @@
+-- Daily rollups of members, donations and complaints, kept up to date by the
+-- write paths (app/rollups.py) and backfilled by 0005
+
+CREATE TABLE IF NOT EXISTS member_daily_stats (
+    day DATE NOT NULL,
+    state VARCHAR(100) NOT NULL,
+    district VARCHAR(100) NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    member_count INTEGER NOT NULL DEFAULT 0,
+    active_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, state, district, status)
+);
+
+CREATE TABLE IF NOT EXISTS donation_daily_stats (
+    day DATE NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    donation_count INTEGER NOT NULL DEFAULT 0,
+    amount_total DECIMAL(14, 2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, status)
+);
+
+CREATE TABLE IF NOT EXISTS complaint_daily_stats (
+    day DATE NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    complaint_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, status)
+);
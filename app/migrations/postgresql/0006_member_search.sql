@@ -0,0 +1,10 @@
+-- Trigram indexes for member search (app/search.py). GIN gin_trgm_ops serves
+-- ILIKE '%term%' for terms of three or more characters.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_members_name_trgm ON members USING GIN (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_members_membership_id_trgm ON members USING GIN (membership_id gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_members_phone_trgm ON members USING GIN (phone gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_members_email_trgm ON members USING GIN (email gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_members_aadhaar_trgm ON members USING GIN (aadhaar gin_trgm_ops);
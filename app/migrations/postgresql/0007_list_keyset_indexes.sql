@@ -0,0 +1,13 @@
+-- (created_at, id) indexes for the keyset-paginated admin lists (app/pagination.py),
+-- plus the same keys behind each list's status (or media type) filter
+
+CREATE INDEX IF NOT EXISTS idx_members_created_at_id ON members(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_members_status_created_at_id ON members(status, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_member_applications_created_at_id ON member_applications(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_member_applications_status_created_at_id ON member_applications(status, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_donations_created_at_id ON donations(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_donations_status_created_at_id ON donations(status, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_complaints_created_at_id ON complaints(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_complaints_status_created_at_id ON complaints(status, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_gallery_created_at_id ON gallery(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_gallery_media_type_created_at_id ON gallery(media_type, created_at, id);
@@ -0,0 +1,20 @@
+-- Background CSV export jobs (app/export_jobs.py)
+
+CREATE TABLE IF NOT EXISTS export_jobs (
+    id VARCHAR(32) PRIMARY KEY,
+    kind VARCHAR(20) NOT NULL,
+    filters TEXT NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'queued',
+    rows_written INTEGER NOT NULL DEFAULT 0,
+    total_rows INTEGER,
+    size BIGINT,
+    location VARCHAR(500),
+    error TEXT,
+    created_by INTEGER,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    started_at TIMESTAMP WITH TIME ZONE,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    finished_at TIMESTAMP WITH TIME ZONE
+);
+
+CREATE INDEX IF NOT EXISTS idx_export_jobs_status ON export_jobs(status);
@@ -0,0 +1,6 @@
+-- lower(email) indexes for the case-insensitive email lookups in admin
+-- search (app/search.py): emails are stored as entered
+
+CREATE INDEX IF NOT EXISTS idx_members_email_lower ON members(lower(email));
+CREATE INDEX IF NOT EXISTS idx_donations_donor_email_lower ON donations(lower(donor_email));
+CREATE INDEX IF NOT EXISTS idx_complaints_email_lower ON complaints(lower(email));
@@ -0,0 +1,4 @@
+-- created_at index for the revocation cache sync (app/revocation.py), which
+-- reads the rows created since its previous sync
+
+CREATE INDEX IF NOT EXISTS idx_token_blacklist_created_at ON token_blacklist(created_at);
@@ -0,0 +1,27 @@
+-- Daily rollups of members, donations and complaints, kept up to date by the
+-- write paths (app/rollups.py) and backfilled by 0005
+
+CREATE TABLE IF NOT EXISTS member_daily_stats (
+    day DATE NOT NULL,
+    state TEXT NOT NULL,
+    district TEXT NOT NULL,
+    status TEXT NOT NULL,
+    member_count INTEGER NOT NULL DEFAULT 0,
+    active_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, state, district, status)
+);
+
+CREATE TABLE IF NOT EXISTS donation_daily_stats (
+    day DATE NOT NULL,
+    status TEXT NOT NULL,
+    donation_count INTEGER NOT NULL DEFAULT 0,
+    amount_total REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, status)
+);
+
+CREATE TABLE IF NOT EXISTS complaint_daily_stats (
+    day DATE NOT NULL,
+    status TEXT NOT NULL,
+    complaint_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, status)
+);
@@ -0,0 +1,27 @@
+-- Trigram full-text index for member search (app/search.py): an external
+-- content FTS5 table over members, kept in sync by triggers
+
+CREATE VIRTUAL TABLE IF NOT EXISTS members_fts USING fts5(
+    name, membership_id, phone, email, aadhaar,
+    content='members', content_rowid='id', tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS members_fts_insert AFTER INSERT ON members BEGIN
+    INSERT INTO members_fts (rowid, name, membership_id, phone, email, aadhaar)
+    VALUES (new.id, new.name, new.membership_id, new.phone, new.email, new.aadhaar);
+END;
+
+CREATE TRIGGER IF NOT EXISTS members_fts_delete AFTER DELETE ON members BEGIN
+    INSERT INTO members_fts (members_fts, rowid, name, membership_id, phone, email, aadhaar)
+    VALUES ('delete', old.id, old.name, old.membership_id, old.phone, old.email, old.aadhaar);
+END;
+
+-- Status changes do not touch the index
+CREATE TRIGGER IF NOT EXISTS members_fts_update AFTER UPDATE OF name, membership_id, phone, email, aadhaar ON members BEGIN
+    INSERT INTO members_fts (members_fts, rowid, name, membership_id, phone, email, aadhaar)
+    VALUES ('delete', old.id, old.name, old.membership_id, old.phone, old.email, old.aadhaar);
+    INSERT INTO members_fts (rowid, name, membership_id, phone, email, aadhaar)
+    VALUES (new.id, new.name, new.membership_id, new.phone, new.email, new.aadhaar);
+END;
+
+INSERT INTO members_fts (members_fts) VALUES ('rebuild');
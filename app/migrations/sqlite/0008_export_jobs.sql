@@ -0,0 +1,20 @@
+-- Background CSV export jobs (app/export_jobs.py)
+
+CREATE TABLE IF NOT EXISTS export_jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    filters TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    rows_written INTEGER NOT NULL DEFAULT 0,
+    total_rows INTEGER,
+    size INTEGER,
+    location TEXT,
+    error TEXT,
+    created_by INTEGER,
+    created_at DATETIME NOT NULL,
+    started_at DATETIME,
+    updated_at DATETIME NOT NULL,
+    finished_at DATETIME
+);
+
+CREATE INDEX IF NOT EXISTS idx_export_jobs_status ON export_jobs(status);
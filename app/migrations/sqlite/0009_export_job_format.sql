@@ -0,0 +1,3 @@
+-- File format of a background export (csv, parquet, ndjson.gz, ndjson.zst)
+
+ALTER TABLE export_jobs ADD COLUMN format TEXT NOT NULL DEFAULT 'csv';
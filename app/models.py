@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Float, Enum, Text, Date
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Boolean, Float, Enum, Text, Date
 from sqlalchemy.sql import func
 from app.database import Base
 import enum
@@ -56,7 +56,8 @@ class TokenBlacklist(Base):
     __tablename__ = "token_blacklist"
     
     id = Column(Integer, primary_key=True, index=True)
-    token = Column(String, unique=True, index=True, nullable=False)
+    jti = Column(String(64), unique=True, index=True, nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
 class Member(Base):
@@ -137,4 +138,49 @@ class Gallery(Base):
     description = Column(Text)
     media_url = Column(String, nullable=False)
     media_type = Column(String, nullable=False, index=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+class ExportJob(Base):
+    __tablename__ = "export_jobs"
+    
+    id = Column(String(32), primary_key=True)  # uuid4 hex
+    kind = Column(String, nullable=False)  # members, donations or complaints
+    format = Column(String, nullable=False, default="csv")  # csv, parquet, ndjson.gz or ndjson.zst
+    filters = Column(Text, nullable=False)  # JSON
+    status = Column(String, nullable=False, default="queued", index=True)  # queued, running, completed or failed
+    rows_written = Column(Integer, nullable=False, default=0)
+    total_rows = Column(Integer)
+    size = Column(BigInteger)
+    location = Column(String)  # file path, or S3 URL with EXPORT_STORAGE=s3
+    error = Column(Text)
+    created_by = Column(Integer)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    started_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+    finished_at = Column(DateTime(timezone=True))
+
+# Daily rollups, maintained on the write paths by app/rollups.py
+class MemberDailyStats(Base):
+    __tablename__ = "member_daily_stats"
+    
+    day = Column(Date, primary_key=True)
+    state = Column(String, primary_key=True)
+    district = Column(String, primary_key=True)
+    status = Column(String, primary_key=True)
+    member_count = Column(Integer, nullable=False, default=0)
+    active_count = Column(Integer, nullable=False, default=0)
+
+class DonationDailyStats(Base):
+    __tablename__ = "donation_daily_stats"
+    
+    day = Column(Date, primary_key=True)
+    status = Column(String, primary_key=True)
+    donation_count = Column(Integer, nullable=False, default=0)
+    amount_total = Column(Float, nullable=False, default=0)
+
+class ComplaintDailyStats(Base):
+    __tablename__ = "complaint_daily_stats"
+    
+    day = Column(Date, primary_key=True)
+    status = Column(String, primary_key=True)
+    complaint_count = Column(Integer, nullable=False, default=0)
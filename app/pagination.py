@@ -0,0 +1,106 @@
+"""
+Keyset pagination for the admin lists
+
+Lists are ordered newest first by (created_at, id). A cursor is an opaque
+encoding of the (created_at, id) of the row a page ends at plus a direction,
+so the next page is "rows older than that one" and the database seeks to it
+through the (created_at, id) index (migration 0007) instead of reading and
+discarding OFFSET rows. Rows inserted meanwhile do not shift later pages.
+
+The page parameter keeps working through OFFSET, and its responses carry
+cursors too, so a client can switch over from any page.
+"""
+from collections import namedtuple
+from datetime import datetime
+from sqlalchemy import select, tuple_, literal, type_coerce, String
+import base64
+import json
+
+Cursor = namedtuple("Cursor", ["created_at", "id", "direction"])
+Page = namedtuple("Page", ["items", "page", "next_cursor", "prev_cursor"])
+
+CURSOR_DIRECTIONS = ("next", "prev")
+
+def encode_cursor(created_at, row_id: int, direction: str) -> str:
+    if isinstance(created_at, datetime):
+        created_at = created_at.isoformat()
+    payload = json.dumps([created_at, row_id, direction], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(value: str) -> Cursor:
+    """Raises ValueError for anything encode_cursor did not produce"""
+    try:
+        created_at, row_id, direction = json.loads(base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)))
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Malformed cursor: {str(e)}")
+    if not isinstance(created_at, str) or not isinstance(row_id, int) or direction not in CURSOR_DIRECTIONS:
+        raise ValueError("Malformed cursor")
+    try:
+        # Parsed only when paginating on PostgreSQL, but checked here so a bad one is a 400 there too
+        datetime.fromisoformat(created_at)
+    except ValueError as e:
+        raise ValueError(f"Malformed cursor: {str(e)}")
+    return Cursor(created_at, row_id, direction)
+
+def get_created_at_key(model, dialect: str):
+    """created_at as compared by the cursor condition.
+    
+    SQLite keeps timestamps as text, with or without fractional seconds
+    depending on who wrote the row, and a parsed datetime binds with them.
+    Comparing the stored text as-is keeps rows sharing a second from being
+    skipped or repeated. Neither form adds anything to the SQL, so the index
+    still serves the ORDER BY.
+    """
+    if dialect == "sqlite":
+        return type_coerce(model.created_at, String)
+    return model.created_at
+
+async def paginate(db, model, conditions: list, page: int, limit: int, cursor: str = None,
+                   order_by: list = None) -> Page:
+    """One page of model rows matching conditions, newest first.
+    
+    order_by (e.g. search ranking) is applied before recency on page-based
+    requests only; such pages carry no cursors, and a cursor request is
+    always ordered by recency.
+    """
+    dialect = db.get_bind().dialect.name
+    created_at = get_created_at_key(model, dialect)
+    statement = select(model, created_at.label("cursor_created_at")).where(*conditions)
+    position = decode_cursor(cursor) if cursor else None
+    
+    if position:
+        value = position.created_at if dialect == "sqlite" else datetime.fromisoformat(position.created_at)
+        key = tuple_(created_at, model.id)
+        bound = tuple_(literal(value, created_at.type), literal(position.id))
+        if position.direction == "next":
+            statement = statement.where(key < bound).order_by(created_at.desc(), model.id.desc())
+        else:
+            # Walk forward from the cursor, then flip the rows back to newest first
+            statement = statement.where(key > bound).order_by(created_at.asc(), model.id.asc())
+        page = None
+    else:
+        statement = statement.order_by(*(order_by or []), created_at.desc(), model.id.desc())
+        statement = statement.offset((page - 1) * limit)
+    
+    # One extra row tells whether there is anything beyond this page
+    result = await db.execute(statement.limit(limit + 1))
+    rows = result.all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if position and position.direction == "prev":
+        rows.reverse()
+    
+    next_cursor = prev_cursor = None
+    if rows and not (order_by and not position):
+        first, last = rows[0], rows[-1]
+        if position and position.direction == "prev":
+            next_cursor = encode_cursor(last[1], last[0].id, "next")
+            if has_more:
+                prev_cursor = encode_cursor(first[1], first[0].id, "prev")
+        else:
+            if has_more:
+                next_cursor = encode_cursor(last[1], last[0].id, "next")
+            if position or page > 1:
+                prev_cursor = encode_cursor(first[1], first[0].id, "prev")
+    
+    return Page([row[0] for row in rows], page, next_cursor, prev_cursor)
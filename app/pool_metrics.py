@@ -0,0 +1,168 @@
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from fastapi import status
+from fastapi.responses import JSONResponse
+import bisect
+import math
+import os
+import threading
+import time
+
+# Admission control: reject early instead of queueing for a connection
+DB_ADMISSION_CONTROL = os.getenv("DB_ADMISSION_CONTROL", "false").lower() == "true"
+DB_ADMISSION_MAX_WAIT_MS = float(os.getenv("DB_ADMISSION_MAX_WAIT_MS", "500"))
+
+# Upper bounds (ms) of the checkout wait histogram buckets
+WAIT_BUCKETS_MS = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+# Weight of the newest sample in the moving averages
+EWMA_ALPHA = 0.2
+
+class PoolMetrics:
+    """Checkout wait histogram and connection hold times for one pool"""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.checkouts = 0
+        self.timeouts = 0
+        self.rejected = 0
+        self.waiting = 0
+        self.wait_total_ms = 0.0
+        self.wait_ewma_ms = 0.0
+        self.hold_ewma_ms = 0.0
+        self.buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self._lock = threading.Lock()
+    
+    def record_wait(self, wait_ms: float):
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total_ms += wait_ms
+            self.wait_ewma_ms += EWMA_ALPHA * (wait_ms - self.wait_ewma_ms)
+            self.buckets[bisect.bisect_left(WAIT_BUCKETS_MS, wait_ms)] += 1
+    
+    def record_hold(self, hold_ms: float):
+        with self._lock:
+            self.hold_ewma_ms += EWMA_ALPHA * (hold_ms - self.hold_ewma_ms)
+    
+    def histogram(self) -> dict:
+        labels = [f"le_{bound}ms" for bound in WAIT_BUCKETS_MS] + ["gt_10000ms"]
+        return dict(zip(labels, self.buckets))
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that times how long each checkout waits"""
+    
+    @property
+    def metrics(self) -> PoolMetrics:
+        if not hasattr(self, "_metrics"):
+            self._metrics = PoolMetrics(self.logging_name or "pool")
+        return self._metrics
+    
+    def recreate(self):
+        pool = super().recreate()
+        pool._metrics = self.metrics
+        return pool
+    
+    def _do_get(self):
+        metrics = self.metrics
+        metrics.waiting += 1
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            metrics.timeouts += 1
+            raise
+        finally:
+            metrics.waiting -= 1
+            metrics.record_wait((time.perf_counter() - start) * 1000)
+    
+    def capacity(self) -> int:
+        return self.size() + max(self._max_overflow, 0)
+    
+    def expected_wait_ms(self) -> float:
+        """Estimate how long a new checkout would queue right now"""
+        if self.checkedout() < self.capacity():
+            return 0.0
+        # Every queued request needs one of `capacity` connections to be returned
+        return (self.metrics.waiting + 1) * self.metrics.hold_ewma_ms / max(self.capacity(), 1)
+    
+    def stats(self) -> dict:
+        metrics = self.metrics
+        return {
+            "pool_size": self.size(),
+            "max_overflow": self._max_overflow,
+            "timeout_seconds": self._timeout,
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "waiting": metrics.waiting,
+            "checkouts": metrics.checkouts,
+            "checkout_timeouts": metrics.timeouts,
+            "rejected_requests": metrics.rejected,
+            "wait_mean_ms": round(metrics.wait_total_ms / metrics.checkouts, 3) if metrics.checkouts else 0.0,
+            "wait_ewma_ms": round(metrics.wait_ewma_ms, 3),
+            "hold_ewma_ms": round(metrics.hold_ewma_ms, 3),
+            "expected_wait_ms": round(self.expected_wait_ms(), 3),
+            "wait_histogram": metrics.histogram()
+        }
+
+def instrument_engine(engine):
+    """Track how long connections stay checked out of an engine's pool"""
+    sync_engine = getattr(engine, "sync_engine", engine)
+    
+    @event.listens_for(sync_engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checked_out_at"] = time.perf_counter()
+    
+    @event.listens_for(sync_engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        pool = sync_engine.pool
+        if checked_out_at is not None and isinstance(pool, InstrumentedAsyncQueuePool):
+            pool.metrics.record_hold((time.perf_counter() - checked_out_at) * 1000)
+
+class AdmissionControlMiddleware:
+    """Reject requests with 503 when the pool they need is saturated.
+    
+    GET requests are checked against the read pool and everything else against
+    the primary. Admin GETs are checked against the primary too, since
+    authenticating them (get_current_admin) takes a primary connection.
+    Rejected requests get a Retry-After hint instead of queueing until pool
+    timeouts pile up.
+    """
+    
+    def __init__(self, app, read_engine, write_engine, max_wait_ms: float = DB_ADMISSION_MAX_WAIT_MS):
+        self.app = app
+        self.read_engine = read_engine
+        self.write_engine = write_engine
+        self.max_wait_ms = max_wait_ms
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(("/admin", "/public")):
+            await self.app(scope, receive, send)
+            return
+        
+        if scope["method"] not in ("GET", "HEAD"):
+            engines = [self.write_engine]
+        elif scope["path"].startswith("/admin") and self.write_engine is not self.read_engine:
+            engines = [self.read_engine, self.write_engine]
+        else:
+            engines = [self.read_engine]
+        
+        # The most saturated of the pools the request will check out from
+        expected_wait_ms, pool = 0.0, None
+        for engine in engines:
+            engine_pool = engine.sync_engine.pool
+            if isinstance(engine_pool, InstrumentedAsyncQueuePool) and engine_pool.expected_wait_ms() > expected_wait_ms:
+                expected_wait_ms, pool = engine_pool.expected_wait_ms(), engine_pool
+        if expected_wait_ms > self.max_wait_ms:
+            pool.metrics.rejected += 1
+            response = JSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content={"detail": "Server is busy, please retry"},
+                headers={"Retry-After": str(max(1, math.ceil(expected_wait_ms / 1000)))}
+            )
+            await response(scope, receive, send)
+            return
+        
+        await self.app(scope, receive, send)
@@ -1,8 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Query
-from sqlalchemy.orm import Session
-from app.database import get_db
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db, get_read_db
 from app.models import Donation, MemberApplication, Complaint, Gallery, PaymentMethod, Gender, ComplaintType, MediaType
-from app.s3_storage import s3_storage
+from app.s3_storage import get_s3_storage
+from app.rollups import record_created
+from app.dashboard_cache import dashboard_cache
+from app.events import queue_event
+from app.formats import AADHAAR_PATTERN, PHONE_PATTERN, LETTERS_ONLY_PATTERN, REFERENCE_ID_PREFIX
 from pydantic import BaseModel, EmailStr, validator
 from typing import Optional, List
 from datetime import datetime, date
@@ -27,7 +33,7 @@ class PublicDonationCreate(BaseModel):
     
     @validator('phone_number')
     def validate_phone(cls, v):
-        if not re.match(r'^\d{10}$', v):
+        if not re.match(PHONE_PATTERN, v):
             raise ValueError('Phone number must be exactly 10 digits')
         return v
 
@@ -48,19 +54,19 @@ class PublicMembershipCreate(BaseModel):
     
     @validator('full_name', 'father_husband_name', 'caste')
     def validate_letters_only(cls, v):
-        if not re.match(r'^[a-zA-Z\s]+$', v):
+        if not re.match(LETTERS_ONLY_PATTERN, v):
             raise ValueError('Field must contain only letters and spaces')
         return v
     
     @validator('aadhaar_number')
     def validate_aadhaar(cls, v):
-        if not re.match(r'^\d{12}$', v):
+        if not re.match(AADHAAR_PATTERN, v):
             raise ValueError('Aadhaar number must be exactly 12 digits')
         return v
     
     @validator('phone_number')
     def validate_phone(cls, v):
-        if not re.match(r'^\d{10}$', v):
+        if not re.match(PHONE_PATTERN, v):
             raise ValueError('Phone number must be exactly 10 digits')
         return v
     
@@ -83,7 +89,7 @@ class PublicComplaintCreate(BaseModel):
     
     @validator('phone_number')
     def validate_phone(cls, v):
-        if not re.match(r'^\d{10}$', v):
+        if not re.match(PHONE_PATTERN, v):
             raise ValueError('Phone number must be exactly 10 digits')
         return v
 
@@ -117,16 +123,16 @@ def save_uploaded_file_to_s3(file: UploadFile, folder: str) -> str:
         )
     
     # Upload to S3
-    return s3_storage.upload_file(file, folder)
+    return get_s3_storage().upload_file(file, folder)
 
 def generate_reference_id() -> str:
     today = datetime.now().strftime('%Y%m%d')
     random_part = str(uuid.uuid4())[:4].upper()
-    return f"MMN-CMP-{today}-{random_part}"
+    return f"{REFERENCE_ID_PREFIX}{today}-{random_part}"
 
 # API Endpoints
 @router.post("/donations")
-async def create_donation(donation: PublicDonationCreate, db: Session = Depends(get_db)):
+async def create_donation(donation: PublicDonationCreate, db: AsyncSession = Depends(get_async_db)):
     # Determine final amount
     final_amount = donation.preset_amount if donation.preset_amount else donation.custom_amount
     
@@ -149,8 +155,10 @@ async def create_donation(donation: PublicDonationCreate, db: Session = Depends(
     )
     
     db.add(db_donation)
-    db.commit()
-    db.refresh(db_donation)
+    await record_created(db, db_donation)
+    await db.commit()
+    dashboard_cache.invalidate("donations")
+    await db.refresh(db_donation)
     
     return {
         "message": "Donation submitted successfully",
@@ -174,7 +182,7 @@ async def apply_membership(
     village: str = Form(...),
     full_address: str = Form(...),
     photo: UploadFile = File(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     # Validate form data using Pydantic
     try:
@@ -199,8 +207,8 @@ async def apply_membership(
             detail=str(e)
         )
     
-    # Save photo to S3
-    photo_path = save_uploaded_file_to_s3(photo, "membership/photos")
+    # Save photo to S3 (boto3 is blocking, keep it off the event loop)
+    photo_path = await run_in_threadpool(save_uploaded_file_to_s3, photo, "membership/photos")
     
     # Convert date format
     dob = datetime.strptime(date_of_birth, '%d-%m-%Y').date()
@@ -225,8 +233,13 @@ async def apply_membership(
     )
     
     db.add(db_application)
-    db.commit()
-    db.refresh(db_application)
+    await db.flush()
+    queue_event(db, "member_application.created", {
+        "id": db_application.id, "status": "pending", "old_status": None, "deltas": {}
+    })
+    await db.commit()
+    dashboard_cache.invalidate("member_applications")
+    await db.refresh(db_application)
     
     return {
         "message": "Membership application submitted successfully",
@@ -244,7 +257,7 @@ async def create_complaint(
     detailed_description: str = Form(...),
     email_address: Optional[str] = Form(None),
     supporting_document: Optional[UploadFile] = File(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     # Validate form data
     try:
@@ -266,7 +279,7 @@ async def create_complaint(
     # Save supporting document to S3 if provided
     document_path = None
     if supporting_document and supporting_document.filename:
-        document_path = save_uploaded_file_to_s3(supporting_document, "complaints/documents")
+        document_path = await run_in_threadpool(save_uploaded_file_to_s3, supporting_document, "complaints/documents")
     
     # Generate reference ID
     reference_id = generate_reference_id()
@@ -286,8 +299,10 @@ async def create_complaint(
     )
     
     db.add(db_complaint)
-    db.commit()
-    db.refresh(db_complaint)
+    await record_created(db, db_complaint)
+    await db.commit()
+    dashboard_cache.invalidate("complaints")
+    await db.refresh(db_complaint)
     
     return {
         "message": "Complaint submitted successfully",
@@ -299,15 +314,16 @@ async def create_complaint(
 @router.get("/gallery", response_model=PublicGalleryList)
 async def get_gallery(
     media_type: Optional[MediaType] = Query(None, description="Filter by media type"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
-    query = db.query(Gallery)
+    query = select(Gallery)
     
     # Apply media type filter
     if media_type:
-        query = query.filter(Gallery.media_type == media_type)
+        query = query.where(Gallery.media_type == media_type)
     
-    items = query.order_by(Gallery.created_at.desc()).all()
+    result = await db.scalars(query.order_by(Gallery.created_at.desc()))
+    items = result.all()
     
     return PublicGalleryList(
         items=[PublicGalleryResponse.from_orm(item) for item in items],
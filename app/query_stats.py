@@ -0,0 +1,182 @@
+from sqlalchemy import event
+from contextvars import ContextVar
+from collections import Counter
+import os
+import threading
+import time
+
+# Per-request SQL instrumentation (Server-Timing headers, query budget warnings)
+QUERY_STATS_ENABLED = os.getenv("QUERY_STATS_ENABLED", "true").lower() == "true"
+# Warn when one request issues more statements than this
+QUERY_COUNT_THRESHOLD = int(os.getenv("QUERY_COUNT_THRESHOLD", "10"))
+# Warn when the same statement runs this many times in one request (likely N+1)
+QUERY_REPEAT_THRESHOLD = int(os.getenv("QUERY_REPEAT_THRESHOLD", "5"))
+# Print one line with the query stats of every request
+QUERY_DEBUG_LOG = os.getenv("QUERY_DEBUG_LOG", "false").lower() == "true"
+
+# Characters of the slowest statement sent in the Server-Timing header
+SERVER_TIMING_STATEMENT_LENGTH = 100
+
+class QueryStats:
+    """SQL statements issued while handling one request"""
+    
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.slowest_ms = 0.0
+        self.slowest_statement = None
+        self.statements = Counter()
+    
+    def record(self, statement: str, elapsed_ms: float):
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.statements[statement] += 1
+        if elapsed_ms > self.slowest_ms:
+            self.slowest_ms = elapsed_ms
+            self.slowest_statement = statement
+    
+    def repeated_statements(self) -> list:
+        return [(statement, count) for statement, count in self.statements.items() if count >= QUERY_REPEAT_THRESHOLD]
+
+current_query_stats: ContextVar = ContextVar("current_query_stats", default=None)
+current_request_scope: ContextVar = ContextVar("current_request_scope", default=None)
+
+def get_endpoint(scope) -> str:
+    """Method and route template, e.g. GET /admin/members/{member_id}"""
+    # The matched route template groups /admin/members/1 and /admin/members/2 together;
+    # unmatched paths share one bucket so 404 scans cannot grow the table
+    route = scope.get("route")
+    return f"{scope['method']} {route.path if route is not None else '<unmatched>'}"
+
+def get_current_endpoint():
+    """Endpoint of the request being handled, if any"""
+    scope = current_request_scope.get()
+    return get_endpoint(scope) if scope is not None else None
+
+def instrument_queries(engine):
+    """Time every statement an engine executes into the current request's QueryStats"""
+    sync_engine = getattr(engine, "sync_engine", engine)
+    
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        context._query_started_at = time.perf_counter()
+    
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        stats = current_query_stats.get()
+        if stats is not None:
+            stats.record(statement, (time.perf_counter() - context._query_started_at) * 1000)
+
+class EndpointQueryStats:
+    """Per-endpoint aggregates, so query count regressions show up over time"""
+    
+    def __init__(self):
+        self._endpoints = {}
+        self._lock = threading.Lock()
+    
+    def record(self, endpoint: str, stats: QueryStats, flagged: bool):
+        with self._lock:
+            entry = self._endpoints.setdefault(endpoint, {
+                "requests": 0,
+                "queries": 0,
+                "max_queries": 0,
+                "db_ms": 0.0,
+                "flagged_requests": 0
+            })
+            entry["requests"] += 1
+            entry["queries"] += stats.count
+            entry["max_queries"] = max(entry["max_queries"], stats.count)
+            entry["db_ms"] += stats.total_ms
+            entry["flagged_requests"] += int(flagged)
+    
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                endpoint: {
+                    "requests": entry["requests"],
+                    "avg_queries": round(entry["queries"] / entry["requests"], 2),
+                    "max_queries": entry["max_queries"],
+                    "avg_db_ms": round(entry["db_ms"] / entry["requests"], 3),
+                    "flagged_requests": entry["flagged_requests"]
+                }
+                for endpoint, entry in sorted(self._endpoints.items())
+            }
+    
+    def clear(self):
+        with self._lock:
+            self._endpoints.clear()
+
+def normalize_statement(statement: str) -> str:
+    """The statement on one line, whitespace collapsed (parameters are already placeholders)"""
+    return ' '.join(statement.split())
+
+def quote_header_value(value: str) -> str:
+    """HTTP quoted-string, limited to the latin-1 headers can carry"""
+    value = value.replace('\\', '\\\\').replace('"', '\\"')
+    return '"' + value.encode("latin-1", "replace").decode("latin-1") + '"'
+
+def format_server_timing(stats: QueryStats, app_ms: float) -> str:
+    slowest = f"db-slowest;dur={stats.slowest_ms:.2f}"
+    if stats.slowest_statement:
+        statement = normalize_statement(stats.slowest_statement)
+        if len(statement) > SERVER_TIMING_STATEMENT_LENGTH:
+            statement = statement[:SERVER_TIMING_STATEMENT_LENGTH - 3] + "..."
+        slowest += f";desc={quote_header_value(statement)}"
+    return (
+        f'db;dur={stats.total_ms:.2f};desc="{stats.count} queries", '
+        f"{slowest}, "
+        f"app;dur={app_ms:.2f}"
+    )
+
+class QueryStatsMiddleware:
+    """Collect SQL stats per request and report them as Server-Timing headers"""
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+        scope_token = current_request_scope.set(scope)
+        started_at = time.perf_counter()
+        
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                app_ms = (time.perf_counter() - started_at) * 1000
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", format_server_timing(stats, app_ms).encode("latin-1")))
+                message = {**message, "headers": headers}
+                report_request(scope, stats, app_ms)
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_query_stats.reset(token)
+            current_request_scope.reset(scope_token)
+
+def report_request(scope, stats: QueryStats, app_ms: float):
+    endpoint = get_endpoint(scope)
+    repeated = stats.repeated_statements()
+    flagged = stats.count > QUERY_COUNT_THRESHOLD or bool(repeated)
+    endpoint_query_stats.record(endpoint, stats, flagged)
+    
+    if stats.count > QUERY_COUNT_THRESHOLD:
+        print(f"Query budget exceeded: {endpoint} issued {stats.count} statements (threshold {QUERY_COUNT_THRESHOLD})")
+    for statement, count in repeated:
+        print(f"Possible N+1 in {endpoint}: statement ran {count} times: {normalize_statement(statement)[:200]}")
+    if QUERY_DEBUG_LOG:
+        line = (
+            f"{endpoint}: {stats.count} queries, {stats.total_ms:.2f}ms in db, "
+            f"slowest {stats.slowest_ms:.2f}ms, {app_ms:.2f}ms total"
+        )
+        if stats.slowest_statement:
+            line += f"; slowest statement: {normalize_statement(stats.slowest_statement)}"
+        print(line)
+
+# Singleton instance
+endpoint_query_stats = EndpointQueryStats()
@@ -0,0 +1,173 @@
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models import TokenBlacklist
+from datetime import datetime, timedelta, timezone
+import hashlib
+import math
+import os
+import threading
+import time
+
+# Revocation cache configuration
+REVOCATION_CACHE_ENABLED = os.getenv("REVOCATION_CACHE_ENABLED", "true").lower() == "true"
+REVOCATION_CACHE_CAPACITY = int(os.getenv("REVOCATION_CACHE_CAPACITY", "100000"))
+REVOCATION_CACHE_ERROR_RATE = float(os.getenv("REVOCATION_CACHE_ERROR_RATE", "0.001"))
+REVOCATION_SYNC_SECONDS = float(os.getenv("REVOCATION_SYNC_SECONDS", "5"))
+# Each sync re-reads rows created this long before the previous one: ids and
+# created_at are assigned before commit, so rows can become visible out of order
+REVOCATION_SYNC_OVERLAP_SECONDS = float(os.getenv("REVOCATION_SYNC_OVERLAP_SECONDS", "60"))
+REVOCATION_PURGE_INTERVAL_SECONDS = float(os.getenv("REVOCATION_PURGE_INTERVAL_SECONDS", "300"))
+
+class BloomFilter:
+    """Fixed-size Bloom filter over string keys"""
+    
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+    
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+    
+    def add(self, key: str):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+    
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+class RevocationCache:
+    """In-process mirror of token_blacklist, keyed by JWT ID.
+    
+    A Bloom filter answers definite misses without a database round trip and an
+    exact map of jti -> expiry confirms positives. Rows written by other workers
+    are picked up by an incremental sync every REVOCATION_SYNC_SECONDS, which
+    reads rows created since the previous sync (by the database clock) less
+    REVOCATION_SYNC_OVERLAP_SECONDS, so a revocation that commits after a
+    later one is still seen; rows read twice are de-duplicated by jti.
+    """
+    
+    def __init__(self, capacity: int = REVOCATION_CACHE_CAPACITY, error_rate: float = REVOCATION_CACHE_ERROR_RATE,
+                 sync_seconds: float = REVOCATION_SYNC_SECONDS, enabled: bool = REVOCATION_CACHE_ENABLED,
+                 sync_overlap_seconds: float = REVOCATION_SYNC_OVERLAP_SECONDS):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_seconds = sync_seconds
+        self.sync_overlap_seconds = sync_overlap_seconds
+        self.enabled = enabled
+        self.loaded = False
+        self._lock = threading.Lock()
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._revoked = {}
+        self._synced_at = None
+        self._last_sync = 0.0
+    
+    def _rebuild_bloom_locked(self, capacity: int):
+        self._bloom = BloomFilter(capacity, self.error_rate)
+        for existing in self._revoked:
+            self._bloom.add(existing)
+    
+    def _add_locked(self, jti: str, expires_at: datetime):
+        if jti in self._revoked:
+            return
+        if self._bloom.count >= self._bloom.capacity:
+            # Grow the filter so the false positive rate stays bounded
+            self._rebuild_bloom_locked(self._bloom.capacity * 2)
+        self._revoked[jti] = expires_at
+        self._bloom.add(jti)
+    
+    async def load(self, db: AsyncSession):
+        """Load every revoked token from the database"""
+        # Database clock, taken first so the next sync overlaps this read
+        synced_at = await db.scalar(select(func.now()))
+        result = await db.execute(select(TokenBlacklist.jti, TokenBlacklist.expires_at))
+        rows = result.all()
+        with self._lock:
+            self._revoked = {}
+            self._rebuild_bloom_locked(max(self.capacity, len(rows) * 2))
+            for jti, expires_at in rows:
+                self._add_locked(jti, expires_at)
+            self._synced_at = synced_at
+            self._last_sync = time.monotonic()
+            self.loaded = True
+    
+    async def sync(self, db: AsyncSession):
+        """Pull rows added since the last sync (e.g. by other workers)"""
+        synced_at = await db.scalar(select(func.now()))
+        result = await db.execute(
+            select(TokenBlacklist.jti, TokenBlacklist.expires_at).where(
+                TokenBlacklist.created_at >= self._synced_at - timedelta(seconds=self.sync_overlap_seconds)
+            )
+        )
+        rows = result.all()
+        with self._lock:
+            for jti, expires_at in rows:
+                # Known jtis are skipped, so the overlap costs no more than the read
+                self._add_locked(jti, expires_at)
+            self._synced_at = synced_at
+            self._last_sync = time.monotonic()
+    
+    def add(self, jti: str, expires_at: datetime):
+        """Record a token revoked by this worker"""
+        with self._lock:
+            self._add_locked(jti, expires_at)
+    
+    def purge(self, now: datetime = None):
+        """Forget revocations whose tokens have expired anyway"""
+        now = now or datetime.now(timezone.utc)
+        with self._lock:
+            expired = [jti for jti, expires_at in self._revoked.items() if _as_utc(expires_at) <= now]
+            if not expired:
+                return 0
+            for jti in expired:
+                del self._revoked[jti]
+            # Bloom filters cannot delete, so rebuild from the surviving entries
+            self._rebuild_bloom_locked(max(self.capacity, len(self._revoked) * 2))
+            return len(expired)
+    
+    async def contains(self, db: AsyncSession, jti: str) -> bool:
+        """Check whether a JWT ID is revoked, touching the database only when needed"""
+        if not self.loaded:
+            await self.load(db)
+        elif time.monotonic() - self._last_sync >= self.sync_seconds:
+            await self.sync(db)
+        
+        if jti not in self._bloom:
+            return False
+        if jti in self._revoked:
+            return True
+        
+        # Bloom filter false positive: let the database decide
+        return await db.scalar(select(TokenBlacklist.id).where(TokenBlacklist.jti == jti)) is not None
+    
+    def revoked(self, jti: str) -> bool:
+        """Whether this worker already knows the token is revoked (no database access)"""
+        with self._lock:
+            return jti in self._revoked
+    
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "loaded": self.loaded,
+            "revoked_tokens": len(self._revoked),
+            "bloom_capacity": self._bloom.capacity,
+            "bloom_bits": self._bloom.size,
+            "bloom_hashes": self._bloom.hash_count
+        }
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes; everything stored here is UTC
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+# Singleton instance
+revocation_cache = RevocationCache()
@@ -0,0 +1,222 @@
+"""
+Daily rollups of members, donations and complaints
+
+The write paths call record_created / change_status before they commit, so each fact row change and its rollup delta land in the same
+transaction. Dashboard aggregates then read a few hundred rollup rows
+instead of scanning the fact tables. The same hooks queue the live
+dashboard event (app.events) and the geography cube update (app.geo_cube)
+that are applied once the transaction commits.
+
+Backfill or repair: python -m app.rollups rebuild
+"""
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, delete, insert, func, case, cast, Date
+from sqlalchemy.dialects import postgresql, sqlite
+from datetime import date, datetime, timezone
+from app.models import (
+    Member, Donation, Complaint, MemberDailyStats, DonationDailyStats, ComplaintDailyStats
+)
+from app.events import queue_event
+from app.geo_cube import geo_cube
+
+def rollup_day(created_at: datetime) -> date:
+    """UTC calendar day a row is counted under"""
+    if created_at is None:
+        # Server default not loaded yet: the row is being inserted right now
+        return datetime.now(timezone.utc).date()
+    if created_at.tzinfo is not None:
+        created_at = created_at.astimezone(timezone.utc)
+    return created_at.date()
+
+def get_current_month_start() -> date:
+    """First rollup day of the current UTC month"""
+    return datetime.now(timezone.utc).date().replace(day=1)
+
+def get_rollup_delta(obj, status: str, sign: int):
+    """Rollup table, key columns and increments for one fact row under a status"""
+    day = rollup_day(obj.created_at)
+    if isinstance(obj, Member):
+        return MemberDailyStats, {
+            "day": day, "state": obj.state, "district": obj.district, "status": status
+        }, {
+            "member_count": sign, "active_count": sign if obj.id_card_generated else 0
+        }
+    if isinstance(obj, Donation):
+        return DonationDailyStats, {"day": day, "status": status}, {
+            "donation_count": sign, "amount_total": sign * float(obj.amount or 0)
+        }
+    if isinstance(obj, Complaint):
+        return ComplaintDailyStats, {"day": day, "status": status}, {"complaint_count": sign}
+    raise TypeError(f"No rollup for {type(obj).__name__}")
+
+async def apply_rollup_delta(db: AsyncSession, obj, status: str, sign: int):
+    model, keys, increments = get_rollup_delta(obj, status or "pending", sign)
+    table = model.__table__
+    dialect_insert = postgresql.insert if db.get_bind().dialect.name == "postgresql" else sqlite.insert
+    
+    # Atomic upsert so concurrent writers never lose an increment
+    statement = dialect_insert(table).values(**keys, **increments)
+    statement = statement.on_conflict_do_update(
+        index_elements=list(keys),
+        set_={column: table.c[column] + statement.excluded[column] for column in increments}
+    )
+    await db.execute(statement)
+
+def get_summary_contribution(obj, status: str) -> dict:
+    """What one row adds to each dashboard summary card, by overview section"""
+    if status is None:
+        return {}
+    if isinstance(obj, Member):
+        return {
+            "summary": {
+                "total_members": 1,
+                "members_growth": int(rollup_day(obj.created_at) >= get_current_month_start()),
+                "active_members": int(bool(obj.id_card_generated))
+            },
+            "members": {
+                "total_members": 1,
+                "approved_members": int(status == "approved"),
+                "pending_members": int(status == "pending")
+            }
+        }
+    if isinstance(obj, Donation):
+        amount = float(obj.amount or 0)
+        return {
+            "summary": {
+                "total_donations": amount if status == "verified" else 0.0,
+                "donation_count": int(status == "verified")
+            },
+            "donations": {
+                "total_donations": 1,
+                "pending_donations": int(status == "pending"),
+                "verified_donations": int(status == "verified"),
+                "acknowledged_donations": int(status == "acknowledged"),
+                "total_raised_amount": amount if status in ("verified", "acknowledged") else 0.0
+            }
+        }
+    if isinstance(obj, Complaint):
+        return {
+            "summary": {
+                "total_complaints": 1,
+                "pending_complaints": int(status == "pending")
+            },
+            "complaints": {
+                "total_complaints": 1,
+                **{f"{value}_complaints": int(status == value) for value in ("pending", "in_progress", "resolved", "closed")}
+            }
+        }
+    raise TypeError(f"No summary for {type(obj).__name__}")
+
+def get_summary_deltas(obj, old_status: str, new_status: str) -> dict:
+    """Increments that take the summary cards from old_status to new_status (None: no row)"""
+    old = get_summary_contribution(obj, old_status)
+    new = get_summary_contribution(obj, new_status)
+    deltas = {}
+    for section in new.keys() | old.keys():
+        changes = {
+            field: new.get(section, {}).get(field, 0) - old.get(section, {}).get(field, 0)
+            for field in new.get(section, {}).keys() | old.get(section, {}).keys()
+        }
+        changes = {field: change for field, change in changes.items() if change}
+        if changes:
+            deltas[section] = changes
+    return deltas
+
+def queue_change_event(db: AsyncSession, obj, old_status: str, status: str, deltas: dict):
+    entity = type(obj).__name__.lower()
+    queue_event(db, f"{entity}.created" if old_status is None else f"{entity}.status_changed", {
+        "id": obj.id,
+        "status": status,
+        "old_status": old_status,
+        "deltas": deltas
+    })
+
+async def record_created(db: AsyncSession, obj):
+    """Count a new member, donation or complaint (call before commit)"""
+    status = obj.status or "pending"
+    # Before the flush below expires the server-side created_at default
+    deltas = get_summary_deltas(obj, None, status)
+    day = rollup_day(obj.created_at)
+    await apply_rollup_delta(db, obj, status, 1)
+    if obj.id is None:
+        # The event carries the primary key
+        await db.flush()
+    queue_change_event(db, obj, None, status, deltas)
+    if isinstance(obj, Member):
+        geo_cube.queue_member_change(db, obj, None, status, day)
+
+async def record_status_change(db: AsyncSession, obj, old_status: str):
+    """Move a row from its old status bucket to its current one (call before commit)"""
+    if old_status == obj.status:
+        return
+    await apply_rollup_delta(db, obj, old_status, -1)
+    await apply_rollup_delta(db, obj, obj.status, 1)
+    queue_change_event(db, obj, old_status, obj.status, get_summary_deltas(obj, old_status, obj.status))
+    if isinstance(obj, Member):
+        geo_cube.queue_member_change(db, obj, old_status, obj.status, rollup_day(obj.created_at))
+
+async def change_status(db: AsyncSession, obj, status: str, only_from: str = None) -> bool:
+    """Set a row's status and record the change (call before commit).
+    
+    The UPDATE only matches while the row still has the status that was read,
+    so of two concurrent transitions only one moves the rollups out of that
+    status; the other re-reads the row and moves them from where the first
+    left it. With only_from, nothing changes (returns False) unless the row
+    is in that status.
+    """
+    model = type(obj)
+    while True:
+        old_status = obj.status
+        if only_from is not None and old_status != only_from:
+            return False
+        matches_old = model.status.is_(None) if old_status is None else model.status == old_status
+        result = await db.execute(update(model).where(model.id == obj.id, matches_old).values(status=status))
+        if result.rowcount == 1:
+            break
+        # Changed by another transaction since it was read
+        await db.refresh(obj, ["status"])
+    await record_status_change(db, obj, old_status)
+    return True
+
+def day_expression(column, dialect_name: str):
+    if dialect_name == "postgresql":
+        return cast(func.timezone("UTC", column), Date)
+    return func.date(column)
+
+def rebuild_rollups(conn):
+    """Recompute every rollup table from the fact tables (sync connection)"""
+    dialect_name = conn.dialect.name
+    
+    member_day = day_expression(Member.created_at, dialect_name)
+    member_status = func.coalesce(Member.status, "pending")
+    donation_day = day_expression(Donation.created_at, dialect_name)
+    donation_status = func.coalesce(Donation.status, "pending")
+    complaint_day = day_expression(Complaint.created_at, dialect_name)
+    complaint_status = func.coalesce(Complaint.status, "pending")
+    
+    rebuilds = [
+        (MemberDailyStats, ["day", "state", "district", "status", "member_count", "active_count"], select(
+            member_day, Member.state, Member.district, member_status,
+            func.count(), func.sum(case((Member.id_card_generated == True, 1), else_=0))
+        ).group_by(member_day, Member.state, Member.district, member_status)),
+        (DonationDailyStats, ["day", "status", "donation_count", "amount_total"], select(
+            donation_day, donation_status, func.count(), func.sum(Donation.amount)
+        ).group_by(donation_day, donation_status)),
+        (ComplaintDailyStats, ["day", "status", "complaint_count"], select(
+            complaint_day, complaint_status, func.count()
+        ).group_by(complaint_day, complaint_status))
+    ]
+    for model, columns, query in rebuilds:
+        conn.execute(delete(model))
+        conn.execute(insert(model).from_select(columns, query))
+
+if __name__ == "__main__":
+    import sys
+    from app.database import engine
+    
+    if sys.argv[1:] != ["rebuild"]:
+        print("Usage: python -m app.rollups rebuild")
+        sys.exit(1)
+    with engine.begin() as conn:
+        rebuild_rollups(conn)
+    print("Daily rollups rebuilt")
@@ -1,8 +1,7 @@
-import boto3
-from botocore.exceptions import ClientError
 from fastapi import UploadFile, HTTPException, status
 import os
 from dotenv import load_dotenv
+import threading
 import uuid
 from pathlib import Path
 
@@ -10,6 +9,9 @@ load_dotenv()
 
 class S3Storage:
     def __init__(self):
+        # boto3 takes a large share of startup time, so only import it once storage is used
+        import boto3
+        
         self.s3_client = boto3.client(
             's3',
             aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
@@ -20,6 +22,8 @@ class S3Storage:
     
     def upload_file(self, file: UploadFile, folder: str = "uploads") -> str:
         """Upload file to S3 and return the URL"""
+        from botocore.exceptions import ClientError
+        
         try:
             # Generate unique filename
             file_extension = Path(file.filename).suffix.lower()
@@ -36,13 +40,31 @@ class S3Storage:
             # Return S3 URL
             s3_url = f"https://{self.bucket_name}.s3.amazonaws.com/{unique_filename}"
             return s3_url
-            
+        
         except ClientError as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to upload file to S3: {str(e)}"
             )
     
+    def upload_path(self, path: str, key: str, content_type: str) -> str:
+        """Upload a local file (e.g. a finished export) to S3 and return the URL"""
+        self.s3_client.upload_file(path, self.bucket_name, key, ExtraArgs={'ContentType': content_type})
+        return f"https://{self.bucket_name}.s3.amazonaws.com/{key}"
+    
+    def get_download_url(self, file_url: str, filename: str, expires_in: int = 3600) -> str:
+        """Presigned GET URL for a stored file; S3 serves Range requests on it"""
+        key = file_url.split(f"{self.bucket_name}.s3.amazonaws.com/")[1]
+        return self.s3_client.generate_presigned_url(
+            'get_object',
+            Params={
+                'Bucket': self.bucket_name,
+                'Key': key,
+                'ResponseContentDisposition': f'attachment; filename={filename}'
+            },
+            ExpiresIn=expires_in
+        )
+    
     def delete_file(self, file_url: str) -> bool:
         """Delete file from S3"""
         try:
@@ -54,10 +76,20 @@ class S3Storage:
                 Key=key
             )
             return True
-            
+        
         except Exception as e:
             print(f"Failed to delete file from S3: {str(e)}")
             return False
 
-# Singleton instance
-s3_storage = S3Storage()
+# Singleton instance, created on first use
+_s3_storage = None
+_s3_storage_lock = threading.Lock()
+
+def get_s3_storage() -> S3Storage:
+    """Return the shared S3Storage, building the boto3 client on the first call"""
+    global _s3_storage
+    if _s3_storage is None:
+        with _s3_storage_lock:
+            if _s3_storage is None:
+                _s3_storage = S3Storage()
+    return _s3_storage
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, EmailStr
-from typing import List, Optional
-from datetime import datetime
+from typing import List, Optional, Literal, Union
+from datetime import date, datetime
 from enum import Enum
 
 class MemberStatus(str, Enum):
@@ -67,6 +67,8 @@ class DashboardSummary(BaseModel):
 class MonthlyTrend(BaseModel):
     month: str
     year: int
+    period_start: Optional[date] = None
+    period_end: Optional[date] = None
     members_joined: int
     donations_received: float
     complaints_raised: int
@@ -100,9 +102,12 @@ class MemberResponse(BaseModel):
 class MembersList(BaseModel):
     members: List[MemberResponse]
     total: int
-    page: int
+    total_is_exact: bool = True  # False for cached, estimated or capped ("10000+") totals
+    page: Optional[int]  # None when paged by cursor
     limit: int
     total_pages: int
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
 
 class MemberFilters(BaseModel):
     search: Optional[str] = None
@@ -112,6 +117,8 @@ class MemberFilters(BaseModel):
     status: Optional[MemberStatus] = None
     page: int = 1
     limit: int = 10
+    cursor: Optional[str] = None
+    count_mode: Optional[str] = None
 
 # Donations Module Schemas
 class DonationsSummary(BaseModel):
@@ -137,15 +144,20 @@ class DonationResponse(BaseModel):
 class DonationsList(BaseModel):
     donations: List[DonationResponse]
     total: int
-    page: int
+    total_is_exact: bool = True  # False for cached, estimated or capped ("10000+") totals
+    page: Optional[int]  # None when paged by cursor
     limit: int
     total_pages: int
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
 
 class DonationFilters(BaseModel):
     search: Optional[str] = None
     status: Optional[DonationStatus] = None
     page: int = 1
     limit: int = 10
+    cursor: Optional[str] = None
+    count_mode: Optional[str] = None
 
 # Complaints Module Schemas
 class ComplaintsSummary(BaseModel):
@@ -175,9 +187,12 @@ class ComplaintResponse(BaseModel):
 class ComplaintsList(BaseModel):
     complaints: List[ComplaintResponse]
     total: int
-    page: int
+    total_is_exact: bool = True  # False for cached, estimated or capped ("10000+") totals
+    page: Optional[int]  # None when paged by cursor
     limit: int
     total_pages: int
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
 
 class ComplaintFilters(BaseModel):
     search: Optional[str] = None
@@ -185,6 +200,8 @@ class ComplaintFilters(BaseModel):
     type: Optional[ComplaintType] = None
     page: int = 1
     limit: int = 10
+    cursor: Optional[str] = None
+    count_mode: Optional[str] = None
 
 class ComplaintStatusUpdate(BaseModel):
     status: ComplaintStatus
@@ -210,14 +227,19 @@ class GalleryResponse(BaseModel):
 class GalleryList(BaseModel):
     items: List[GalleryResponse]
     total: int
-    page: int
+    total_is_exact: bool = True  # False for cached, estimated or capped ("10000+") totals
+    page: Optional[int]  # None when paged by cursor
     limit: int
     total_pages: int
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
 
 class GalleryFilters(BaseModel):
     media_type: Optional[MediaType] = None
     page: int = 1
     limit: int = 10
+    cursor: Optional[str] = None
+    count_mode: Optional[str] = None
 
 class GalleryCreate(BaseModel):
     title: str
@@ -225,4 +247,62 @@ class GalleryCreate(BaseModel):
 
 class GalleryUpdate(BaseModel):
     title: Optional[str] = None
-    description: Optional[str] = None
\ No newline at end of file
+    description: Optional[str] = None
+
+# Export Job Schemas
+class ExportJobStatus(str, Enum):
+    queued = "queued"
+    running = "running"
+    completed = "completed"
+    failed = "failed"
+
+class ExportFormat(str, Enum):
+    csv = "csv"
+    parquet = "parquet"
+    ndjson_gz = "ndjson.gz"
+    ndjson_zst = "ndjson.zst"
+
+class ExportJobOptions(BaseModel):
+    format: ExportFormat = ExportFormat.csv
+
+class MembersExportJobCreate(ExportJobOptions):
+    kind: Literal["members"]
+    filters: MemberFilters = MemberFilters()
+
+class DonationsExportJobCreate(ExportJobOptions):
+    kind: Literal["donations"]
+    filters: DonationFilters = DonationFilters()
+
+class ComplaintsExportJobCreate(ExportJobOptions):
+    kind: Literal["complaints"]
+    filters: ComplaintFilters = ComplaintFilters()
+
+# Told apart by kind (Body(discriminator="kind") on the endpoint)
+ExportJobCreate = Union[MembersExportJobCreate, DonationsExportJobCreate, ComplaintsExportJobCreate]
+
+class ExportJobResponse(BaseModel):
+    id: str
+    kind: str
+    format: ExportFormat
+    filters: dict
+    status: ExportJobStatus
+    rows_written: int
+    total_rows: Optional[int]
+    progress: Optional[float]  # 0-1, None until the job has counted its rows
+    size: Optional[int]  # bytes, once completed
+    error: Optional[str]
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+    download_url: Optional[str]  # once completed
+
+# Dashboard Overview Schemas
+class DashboardOverview(BaseModel):
+    """Sections of the admin home page; sections that were not requested are left out"""
+    summary: Optional[DashboardSummary] = None
+    monthly_trends: Optional[List[MonthlyTrend]] = None
+    district_distribution: Optional[List[DistrictDistribution]] = None
+    members: Optional[MembersSummary] = None
+    donations: Optional[DonationsSummary] = None
+    complaints: Optional[ComplaintsSummary] = None
+    gallery: Optional[GallerySummary] = None
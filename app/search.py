@@ -0,0 +1,138 @@
+"""
+Admin list search: route a term to an index by its shape
+
+Pasted identifiers (Aadhaar, phone, membership ID, complaint reference,
+email, transaction ID) are recognized with the same formats the public
+forms validate against (app/formats.py) and answered by an equality or
+prefix lookup on the matching B-tree index. Anything else is free text.
+
+Free-text member search uses a trigram index. On PostgreSQL, ILIKE
+'%term%' on the five searchable columns is served by the pg_trgm GIN
+indexes from migration 0006, and matches are ranked by word_similarity.
+On SQLite, the term is matched against the members_fts FTS5 table
+(trigram tokenizer) and ranked by bm25. Terms shorter than a trigram
+cannot use either index and fall back to the plain ILIKE scan.
+"""
+from collections import namedtuple
+from sqlalchemy import select, func, or_, and_, table, column, literal_column
+from pydantic.networks import validate_email
+from app.models import Member, Donation, Complaint
+from app.formats import (
+    matches, AADHAAR_PATTERN, PHONE_PATTERN, MEMBERSHIP_ID_PATTERN, REFERENCE_ID_PATTERN
+)
+
+SEARCH_MIN_TRIGRAM_LENGTH = 3
+SEARCH_COLUMNS = (Member.name, Member.membership_id, Member.phone, Member.email, Member.aadhaar)
+
+# Payment references: 8+ uppercase letters and digits, at least one digit
+IDENTIFIER_PATTERN = r'^(?=[A-Z0-9]*\d)[A-Z0-9]{8,}$'
+
+# condition goes in WHERE; order_by lists best matches first (empty when unranked)
+SearchPlan = namedtuple("SearchPlan", ["route", "condition", "order_by"])
+
+# (term kind, column, lookup) in the order a module prefers them
+MEMBER_SEARCH_ROUTES = [
+    ("aadhaar", Member.aadhaar, "exact"),
+    ("phone", Member.phone, "exact"),
+    ("membership_id", Member.membership_id, "prefix"),
+    ("email", Member.email, "exact")
+]
+DONATION_SEARCH_ROUTES = [
+    ("email", Donation.donor_email, "exact"),
+    ("identifier", Donation.transaction_id, "prefix")
+]
+COMPLAINT_SEARCH_ROUTES = [
+    ("reference_id", Complaint.reference_id, "prefix"),
+    ("email", Complaint.email, "exact")
+]
+
+members_fts = table("members_fts", column("rowid"), column("rank"))
+
+def is_email(term: str) -> bool:
+    if "@" not in term:
+        return False
+    try:
+        validate_email(term)
+    except ValueError:
+        return False
+    return True
+
+def classify_term(term: str) -> list:
+    """Every identifier kind the term is shaped like, most specific first"""
+    kinds = []
+    if matches(AADHAAR_PATTERN, term):
+        kinds.append("aadhaar")
+    if matches(PHONE_PATTERN, term):
+        kinds.append("phone")
+    if matches(MEMBERSHIP_ID_PATTERN, term.upper()):
+        kinds.append("membership_id")
+    if matches(REFERENCE_ID_PATTERN, term.upper()):
+        kinds.append("reference_id")
+    if is_email(term):
+        kinds.append("email")
+    # Phone and Aadhaar shapes are left out: on donations they go to the
+    # substring search, which finds them in transaction IDs as well
+    if matches(IDENTIFIER_PATTERN, term) and not {"aadhaar", "phone"} & set(kinds):
+        kinds.append("identifier")
+    return kinds
+
+def get_lookup_condition(kind: str, search_column, lookup: str, term: str):
+    if kind == "email":
+        # Stored as entered, so compared case-insensitively (lower(email) indexes, migration 0010)
+        return func.lower(search_column) == term.lower()
+    if kind in ("membership_id", "reference_id"):
+        # Generated upper-case
+        term = term.upper()
+    if lookup == "prefix":
+        # A range rather than LIKE 'term%' so the B-tree index is used under any collation
+        return and_(search_column >= term, search_column < term[:-1] + chr(ord(term[-1]) + 1))
+    return search_column == term
+
+def plan_search(term: str, routes: list, plan_text) -> SearchPlan:
+    """Identifier lookup if the term is shaped like one of the routes, else plan_text(term)"""
+    term = term.strip()
+    kinds = classify_term(term)
+    for kind in kinds:
+        for route_kind, search_column, lookup in routes:
+            if route_kind == kind:
+                return SearchPlan(kind, get_lookup_condition(kind, search_column, lookup, term), [])
+    return plan_text(term)
+
+def get_ilike_condition(term: str, columns: tuple = SEARCH_COLUMNS):
+    search_term = f"%{term}%"
+    return or_(*(search_column.ilike(search_term) for search_column in columns))
+
+def get_fts_query(term: str) -> str:
+    """Quote the term as one FTS5 phrase, i.e. a substring match"""
+    return '"' + term.replace('"', '""') + '"'
+
+def plan_member_text_search(term: str, dialect: str) -> SearchPlan:
+    """Trigram-indexed substring search over the five member search columns"""
+    if len(term) < SEARCH_MIN_TRIGRAM_LENGTH:
+        return SearchPlan("text", get_ilike_condition(term), [])
+    
+    if dialect == "sqlite":
+        fts_matches = (
+            select(members_fts.c.rowid, members_fts.c.rank)
+            .where(literal_column("members_fts").op("MATCH")(get_fts_query(term)))
+            .subquery("search_matches")
+        )
+        # Comparing against the subquery joins it in, so rank is available to ORDER BY
+        return SearchPlan("text", Member.id == fts_matches.c.rowid, [fts_matches.c.rank])
+    
+    if dialect == "postgresql":
+        rank = func.greatest(*(func.word_similarity(term, search_column) for search_column in SEARCH_COLUMNS))
+        return SearchPlan("text", get_ilike_condition(term), [rank.desc()])
+    
+    return SearchPlan("text", get_ilike_condition(term), [])
+
+def plan_member_search(term: str, dialect: str) -> SearchPlan:
+    return plan_search(term, MEMBER_SEARCH_ROUTES, lambda text: plan_member_text_search(text, dialect))
+
+def plan_donation_search(term: str) -> SearchPlan:
+    columns = (Donation.donor_name, Donation.donor_email, Donation.transaction_id)
+    return plan_search(term, DONATION_SEARCH_ROUTES, lambda text: SearchPlan("text", get_ilike_condition(text, columns), []))
+
+def plan_complaint_search(term: str) -> SearchPlan:
+    columns = (Complaint.complainant_name, Complaint.email, Complaint.reference_id, Complaint.subject)
+    return plan_search(term, COMPLAINT_SEARCH_ROUTES, lambda text: SearchPlan("text", get_ilike_condition(text, columns), []))
@@ -0,0 +1,132 @@
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import NullPool
+from app.cache import TTLCache
+from app.query_stats import get_current_endpoint
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+import os
+import re
+import threading
+import time
+
+# Slow-query log (GET /admin/system/slow-queries)
+SLOW_QUERY_LOG_ENABLED = os.getenv("SLOW_QUERY_LOG_ENABLED", "true").lower() == "true"
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200"))
+SLOW_QUERY_LOG_SIZE = int(os.getenv("SLOW_QUERY_LOG_SIZE", "200"))
+SLOW_QUERY_EXPLAIN = os.getenv("SLOW_QUERY_EXPLAIN", "true").lower() == "true"
+
+# Only statements EXPLAIN accepts; plain EXPLAIN never executes them
+EXPLAINABLE_STATEMENT = re.compile(r"^\s*(SELECT|WITH|INSERT|UPDATE|DELETE)\b", re.IGNORECASE)
+ASYNCPG_PARAM = re.compile(r"\$(\d+)")
+
+def get_parameter_shapes(parameters):
+    """Describe bound parameters by type and length without keeping their values"""
+    def shape(value):
+        if isinstance(value, (str, bytes)):
+            return f"{type(value).__name__}({len(value)})"
+        return type(value).__name__
+    
+    if isinstance(parameters, dict):
+        return {key: shape(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [shape(value) for value in parameters]
+    return shape(parameters)
+
+class SlowQueryLog:
+    """Bounded ring buffer of statements slower than SLOW_QUERY_THRESHOLD_MS"""
+    
+    def __init__(self, maxsize: int = SLOW_QUERY_LOG_SIZE):
+        self.recorded = 0
+        self._entries = deque(maxlen=maxsize)
+        self._lock = threading.Lock()
+        # One background thread keeps EXPLAIN round trips off the request path
+        self._explain_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="explain")
+        # Plans per statement text, so a hot slow query is explained once
+        self._plans = TTLCache(maxsize=256, ttl=3600)
+        self._explain_engines = {}
+    
+    def record(self, engine_name: str, explain_url: str, statement: str, parameters, duration_ms: float):
+        entry = {
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+            "engine": engine_name,
+            "endpoint": get_current_endpoint(),
+            "duration_ms": round(duration_ms, 3),
+            "statement": statement,
+            "parameters": get_parameter_shapes(parameters),
+            "plan": None
+        }
+        with self._lock:
+            self._entries.append(entry)
+            self.recorded += 1
+        
+        if SLOW_QUERY_EXPLAIN and explain_url and EXPLAINABLE_STATEMENT.match(statement):
+            entry["plan"] = self._plans.get(statement)
+            if entry["plan"] is None:
+                self._explain_executor.submit(self._explain, entry, explain_url, statement, parameters)
+    
+    def _get_explain_engine(self, url: str):
+        if url not in self._explain_engines:
+            self._explain_engines[url] = create_engine(url, poolclass=NullPool)
+        return self._explain_engines[url]
+    
+    def _explain(self, entry: dict, url: str, statement: str, parameters):
+        try:
+            engine = self._get_explain_engine(url)
+            if engine.dialect.name == "sqlite":
+                explain = f"EXPLAIN QUERY PLAN {statement}"
+            else:
+                explain = f"EXPLAIN {statement}"
+                if ASYNCPG_PARAM.search(statement):
+                    # asyncpg numbers its parameters ($1); psycopg2 expects pyformat
+                    explain = ASYNCPG_PARAM.sub(r"%(p\1)s", explain.replace("%", "%%"))
+                    parameters = {f"p{i + 1}": value for i, value in enumerate(parameters)}
+            with engine.connect() as conn:
+                rows = conn.exec_driver_sql(explain, parameters or ()).all()
+            # PostgreSQL returns one line per row; SQLite puts the detail in the last column
+            plan = [str(row[-1]) for row in rows]
+        except Exception as e:
+            plan = [f"EXPLAIN failed: {str(e)}"]
+        self._plans.set(statement, plan)
+        entry["plan"] = plan
+    
+    def entries(self, limit: int = None) -> list:
+        with self._lock:
+            entries = list(self._entries)
+        entries.reverse()
+        return entries[:limit] if limit else entries
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        self._plans.clear()
+    
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "threshold_ms": SLOW_QUERY_THRESHOLD_MS,
+                "recorded": self.recorded,
+                "buffered": len(self._entries),
+                "capacity": self._entries.maxlen
+            }
+
+def instrument_slow_queries(engine, name: str, explain_url: str = None):
+    """Record statements on an engine that take longer than SLOW_QUERY_THRESHOLD_MS.
+    
+    explain_url is a sync URL for the same database; EXPLAIN runs there in a
+    background thread.
+    """
+    sync_engine = getattr(engine, "sync_engine", engine)
+    
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        context._slow_query_started_at = time.perf_counter()
+    
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        duration_ms = (time.perf_counter() - context._slow_query_started_at) * 1000
+        if duration_ms >= SLOW_QUERY_THRESHOLD_MS:
+            slow_query_log.record(name, None if executemany else explain_url, statement, parameters, duration_ms)
+
+# Singleton instance
+slow_query_log = SlowQueryLog()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Benchmark: API throughput under concurrency, current tree vs. a baseline ref
+
+Seeds a database with members, donations and complaints, then starts uvicorn
+for the current tree and for BASELINE_REF (checked out into a temporary git
+worktree) on the same database and fires CONCURRENCY parallel clients at a mix
+of admin read endpoints.
+
+Run: python -m benchmarks.bench_async_db <baseline-ref>
+e.g. the last commit before the async session port, so both trees share a schema.
+Requires httpx. Point BENCH_DATABASE_URL at PostgreSQL for realistic numbers;
+with SQLite the queries are so cheap that event-loop blocking barely shows.
+"""
+from benchmarks.common import BENCH_DIR, create_admin, percentile, ADMIN_EMAIL, ADMIN_PASSWORD
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+import httpx
+import os
+import random
+import subprocess
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MEMBERS = int(os.getenv("BENCH_MEMBERS", "20000"))
+CONCURRENCY = int(os.getenv("BENCH_CONCURRENCY", "32"))
+DURATION_SECONDS = float(os.getenv("BENCH_DURATION_SECONDS", "15"))
+ENDPOINTS = [
+    "/admin/dashboard/summary",
+    "/admin/members?search=Member%2012",
+    "/admin/members?state=Telangana&page=5",
+    "/admin/donations/summary",
+    "/admin/complaints?status=pending"
+]
+
+def seed():
+    from app.database import SessionLocal, engine
+    from app.migrations import upgrade
+    from app.rollups import rebuild_rollups
+    from app.models import Member, Donation, Complaint
+    
+    upgrade(engine)
+    db = SessionLocal()
+    create_admin(db)
+    now = datetime.now()
+    states = ["Andhra Pradesh", "Telangana", "Karnataka", "Tamil Nadu"]
+    db.bulk_save_objects([
+        Member(
+            membership_id=f"MEM{i:07d}", name=f"Member {i}", phone=f"9{i:09d}", email=f"member{i}@example.com",
+            aadhaar=f"{i:012d}", state=random.choice(states), district=f"District {i % 40}", mandal=f"Mandal {i % 200}",
+            status=random.choice(["pending", "approved", "rejected"]), created_at=now - timedelta(minutes=i)
+        )
+        for i in range(MEMBERS)
+    ])
+    db.bulk_save_objects([
+        Donation(
+            donor_name=f"Donor {i}", donor_email=f"donor{i}@example.com", phone_number=f"8{i:09d}", amount=100 + i % 900,
+            payment_method="upi", transaction_id=f"TXN{i:08d}", status=random.choice(["pending", "verified"]),
+            created_at=now - timedelta(minutes=i)
+        )
+        for i in range(MEMBERS // 4)
+    ])
+    db.bulk_save_objects([
+        Complaint(
+            complainant_name=f"Person {i}", email=f"person{i}@example.com", phone=f"7{i:09d}", address="Address",
+            type="Other", subject=f"Subject {i}", description="Description", reference_id=f"MMN-CMP-{i:08d}",
+            status=random.choice(["pending", "resolved"]), created_at=now - timedelta(minutes=i), updated_at=now
+        )
+        for i in range(MEMBERS // 4)
+    ])
+    db.commit()
+    db.close()
+    with engine.begin() as conn:
+        rebuild_rollups(conn)
+
+def start_server(cwd, port):
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        env=os.environ.copy(),
+        cwd=cwd
+    )
+    for _ in range(100):
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/public/gallery")
+            return server
+        except httpx.TransportError:
+            time.sleep(0.1)
+    server.terminate()
+    raise RuntimeError(f"server in {cwd} did not start")
+
+def run_load(port):
+    base_url = f"http://127.0.0.1:{port}"
+    token = httpx.post(
+        f"{base_url}/admin/login", json={"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD}
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    deadline = time.perf_counter() + DURATION_SECONDS
+    
+    def client(worker):
+        samples = []
+        with httpx.Client(base_url=base_url, headers=headers, timeout=60) as http:
+            i = worker
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                http.get(ENDPOINTS[i % len(ENDPOINTS)]).raise_for_status()
+                samples.append((time.perf_counter() - start) * 1000)
+                i += 1
+        return samples
+    
+    with ThreadPoolExecutor(max_workers=CONCURRENCY) as pool:
+        samples = [s for result in pool.map(client, range(CONCURRENCY)) for s in result]
+    return samples
+
+def measure(label, cwd, port):
+    server = start_server(cwd, port)
+    try:
+        samples = run_load(port)
+    finally:
+        server.terminate()
+        server.wait()
+    print(
+        f"{label:<24} {len(samples) / DURATION_SECONDS:8.1f} req/s  "
+        f"p50={percentile(samples, 50):8.2f}ms  p99={percentile(samples, 99):8.2f}ms"
+    )
+
+def main():
+    if len(sys.argv) != 2:
+        print(__doc__)
+        sys.exit(1)
+    baseline_ref = sys.argv[1]
+    
+    seed()
+    worktree = os.path.join(BENCH_DIR, "baseline")
+    subprocess.run(["git", "worktree", "add", "--detach", worktree, baseline_ref], cwd=REPO_DIR, check=True)
+    try:
+        print(f"{MEMBERS} members, {CONCURRENCY} concurrent clients, {DURATION_SECONDS}s per run")
+        measure(f"baseline ({baseline_ref})", worktree, 8801)
+        measure("current tree", REPO_DIR, 8802)
+    finally:
+        subprocess.run(["git", "worktree", "remove", "--force", worktree], cwd=REPO_DIR)
+
+if __name__ == "__main__":
+    main()
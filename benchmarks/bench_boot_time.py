@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark: worker boot time, current tree vs. a baseline ref
+
+First times the schema step alone in-process (create_all reflection vs. the
+schema_version check), then starts WORKERS uvicorn processes at once against
+the same, already migrated database (like gunicorn forking its workers) and
+measures how long each takes until it answers its first request. Repeated RUNS times for the current tree
+and for BASELINE_REF, checked out into a temporary git worktree.
+
+Run: python -m benchmarks.bench_boot_time <baseline-ref>
+e.g. the last commit that still ran Base.metadata.create_all at import time.
+Requires httpx. Point BENCH_DATABASE_URL at PostgreSQL to include catalog
+round trips; on SQLite reflection is local and the difference is smaller.
+"""
+from benchmarks.common import BENCH_DIR, report, timed
+import httpx
+import os
+import subprocess
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORKERS = int(os.getenv("BENCH_WORKERS", "4"))
+RUNS = int(os.getenv("BENCH_RUNS", "5"))
+
+def boot_workers(cwd, first_port):
+    """Start WORKERS servers together and return each one's time to first response (ms)"""
+    start = time.perf_counter()
+    servers = [
+        subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(first_port + i), "--log-level", "warning"],
+            env=os.environ.copy(),
+            cwd=cwd
+        )
+        for i in range(WORKERS)
+    ]
+    ready = {}
+    try:
+        while len(ready) < WORKERS:
+            if time.perf_counter() - start > 60:
+                raise RuntimeError(f"servers in {cwd} did not start")
+            for i in range(WORKERS):
+                if i in ready:
+                    continue
+                try:
+                    httpx.get(f"http://127.0.0.1:{first_port + i}/public/gallery").raise_for_status()
+                    ready[i] = (time.perf_counter() - start) * 1000
+                except httpx.TransportError:
+                    pass
+            time.sleep(0.005)
+    finally:
+        for server in servers:
+            server.terminate()
+        for server in servers:
+            server.wait()
+    return list(ready.values())
+
+def measure(label, cwd, first_port):
+    samples = []
+    for _ in range(RUNS):
+        samples.extend(boot_workers(cwd, first_port))
+    report(label, samples)
+
+def main():
+    if len(sys.argv) != 2:
+        print(__doc__)
+        sys.exit(1)
+    baseline_ref = sys.argv[1]
+
+    from app.database import engine
+    from app.migrations import upgrade, get_current_version
+    from app.models import Base
+    upgrade(engine)
+
+    def version_check():
+        with engine.connect() as conn:
+            get_current_version(conn)
+
+    report("schema step: create_all", timed(lambda: Base.metadata.create_all(bind=engine), 50))
+    report("schema step: version check", timed(version_check, 50))
+
+    worktree = os.path.join(BENCH_DIR, "baseline")
+    subprocess.run(["git", "worktree", "add", "--detach", worktree, baseline_ref], cwd=REPO_DIR, check=True)
+    try:
+        print(f"{WORKERS} workers booting together, {RUNS} runs, time to first response")
+        measure(f"baseline ({baseline_ref})", worktree, 8811)
+        measure("current tree", REPO_DIR, 8821)
+    finally:
+        subprocess.run(["git", "worktree", "remove", "--force", worktree], cwd=REPO_DIR)
+
+if __name__ == "__main__":
+    main()
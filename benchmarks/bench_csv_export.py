@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark: members CSV export, buffered vs. streamed
+
+Seeds MEMBERS members and exports them all twice: the way export_members_csv
+used to (every ORM object loaded, written to a StringIO, encoded into a
+BytesIO, then sent) and through the streaming export. Reports the time to the
+first byte, the total time and the peak Python memory (tracemalloc, measured
+in a separate pass since tracing slows everything down). Both outputs are
+checked for equality.
+
+Run: python -m benchmarks.bench_csv_export
+"""
+import benchmarks.common  # sets DATABASE_URL before anything from app.*
+from datetime import datetime, timedelta
+from sqlalchemy import select
+import asyncio
+import csv
+import hashlib
+import io
+import os
+import time
+import tracemalloc
+
+MEMBERS = int(os.getenv("BENCH_MEMBERS", "500000"))
+BATCH_SIZE = 50000
+
+def seed():
+    from app.database import engine
+    from app.migrations import upgrade
+    from app.models import Member
+    
+    upgrade(engine)
+    now = datetime.now()
+    started_at = time.perf_counter()
+    with engine.begin() as conn:
+        for offset in range(0, MEMBERS, BATCH_SIZE):
+            conn.execute(Member.__table__.insert(), [
+                {
+                    "membership_id": f"MEM{i:08d}", "name": f"Member {i}", "phone": f"9{i:09d}",
+                    "email": f"member{i}@example.com", "aadhaar": f"{i:012d}", "state": "Telangana",
+                    "district": f"District {i % 40}", "mandal": f"Mandal {i % 600}", "status": "approved",
+                    "is_active": True, "id_card_generated": False, "created_at": now - timedelta(minutes=i)
+                }
+                for i in range(offset, min(offset + BATCH_SIZE, MEMBERS))
+            ])
+    print(f"seeded {MEMBERS} members in {time.perf_counter() - started_at:.1f}s")
+
+async def buffered_export(session_factory):
+    """export_members_csv before streaming"""
+    from fastapi.responses import StreamingResponse
+    from app.models import Member
+    
+    async with session_factory() as db:
+        result = await db.scalars(select(Member).order_by(Member.created_at.desc()))
+        members = result.all()
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow([
+        'Membership ID', 'Name', 'Phone', 'Email', 'Aadhaar',
+        'State', 'District', 'Mandal', 'Status', 'Registration Date'
+    ])
+    for member in members:
+        writer.writerow([
+            member.membership_id, member.name, member.phone, member.email, member.aadhaar,
+            member.state, member.district, member.mandal, member.status,
+            member.created_at.strftime('%Y-%m-%d %H:%M:%S')
+        ])
+    output.seek(0)
+    return StreamingResponse(io.BytesIO(output.getvalue().encode('utf-8')), media_type='text/csv')
+
+async def streamed_export(session_factory):
+    from app.exports import export_response
+    from app.members import get_members_export
+    from app.schemas import MemberFilters
+    
+    return export_response(session_factory, get_members_export(MemberFilters()))
+
+async def consume(export, session_factory):
+    """Read the response body; returns (first byte ms, total ms, size, SHA-256)"""
+    started_at = time.perf_counter()
+    response = await export(session_factory)
+    first_byte_ms = None
+    size = 0
+    digest = hashlib.sha256()
+    async for chunk in response.body_iterator:
+        if first_byte_ms is None:
+            first_byte_ms = (time.perf_counter() - started_at) * 1000
+        size += len(chunk)
+        digest.update(chunk)
+    return first_byte_ms, (time.perf_counter() - started_at) * 1000, size, digest.hexdigest()
+
+async def run():
+    from app.database import AsyncSessionLocal
+    
+    digests = {}
+    for label, export in [("buffered", buffered_export), ("streamed", streamed_export)]:
+        first_byte_ms, total_ms, size, digests[label] = await consume(export, AsyncSessionLocal)
+        tracemalloc.start()
+        await consume(export, AsyncSessionLocal)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{label:<10} first byte={first_byte_ms:9.1f}ms  total={total_ms:9.1f}ms  "
+              f"size={size / 1e6:.1f}MB  peak memory={peak / 1e6:.1f}MB")
+    assert digests["buffered"] == digests["streamed"]
+
+def main():
+    seed()
+    asyncio.run(run())
+
+if __name__ == "__main__":
+    main()
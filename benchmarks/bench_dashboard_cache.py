@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark: dashboard aggregates from the cache vs. recomputed on every request
+
+Seeds MEMBERS members, then for each cached aggregate times a recompute on a
+fresh session against a cache hit. Also fires CONCURRENCY simultaneous reads
+right after an invalidation and after the TTL lapses (stale-while-revalidate),
+and counts how many recomputations each burst caused.
+
+Run: python -m benchmarks.bench_dashboard_cache
+"""
+from benchmarks.common import report
+from datetime import datetime, timedelta
+import asyncio
+import os
+import time
+
+MEMBERS = int(os.getenv("BENCH_MEMBERS", "200000"))
+ITERATIONS = int(os.getenv("BENCH_ITERATIONS", "50"))
+CONCURRENCY = int(os.getenv("BENCH_CONCURRENCY", "100"))
+BATCH_SIZE = 50000
+
+def seed():
+    from app.database import engine
+    from app.migrations import upgrade
+    from app.rollups import rebuild_rollups
+    from app.models import Member
+    
+    upgrade(engine)
+    now = datetime.now()
+    states = ["Andhra Pradesh", "Telangana", "Karnataka", "Tamil Nadu"]
+    statuses = ["pending", "approved", "rejected"]
+    with engine.begin() as conn:
+        for offset in range(0, MEMBERS, BATCH_SIZE):
+            conn.execute(Member.__table__.insert(), [
+                {
+                    "membership_id": f"MEM{i:08d}", "name": f"Member {i}", "phone": f"9{i:09d}",
+                    "email": f"member{i}@example.com", "aadhaar": f"{i:012d}", "state": states[i % 4],
+                    "district": f"District {i % 40}", "mandal": f"Mandal {i % 600}", "status": statuses[i % 3],
+                    "is_active": True, "id_card_generated": i % 5 == 0, "created_at": now - timedelta(minutes=i)
+                }
+                for i in range(offset, min(offset + BATCH_SIZE, MEMBERS))
+            ])
+        rebuild_rollups(conn)
+
+async def measure(label, fn):
+    await fn()
+    samples = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    report(label, samples)
+
+async def burst(cache, key, tags, compute):
+    """CONCURRENCY simultaneous reads; returns how many recomputations they caused"""
+    refreshes = cache.refreshes
+    await asyncio.gather(*(cache.get(key, tags, compute) for _ in range(CONCURRENCY)))
+    # Let a background stale refresh finish before counting
+    while cache._refreshing:
+        await asyncio.sleep(0.001)
+    return cache.refreshes - refreshes
+
+async def run():
+    from app.dashboard_cache import AggregateCache
+    from app.dashboard import get_dashboard_summary, get_district_distribution
+    from app.members import get_members_summary
+    
+    uncached = AggregateCache(enabled=False)
+    cache = AggregateCache(ttl=3600, stale_ttl=3600)
+    aggregates = [
+        ("members summary", ("members-summary",), ("members",), get_members_summary),
+        ("dashboard summary", ("dashboard-summary",), ("members",), get_dashboard_summary),
+        ("district distribution", ("district-distribution",), ("members",), get_district_distribution)
+    ]
+    for label, key, tags, compute in aggregates:
+        await measure(f"{label}, recomputed", lambda: uncached.get(key, tags, compute))
+        await measure(f"{label}, cached", lambda: cache.get(key, tags, compute))
+    
+    label, key, tags, compute = aggregates[0]
+    cache.invalidate("members")
+    print(f"\n{CONCURRENCY} reads after invalidation: {await burst(cache, key, tags, compute)} recomputation(s)")
+    # Entries computed from now on are stale as soon as they are stored
+    cache.ttl = 0
+    cache.invalidate("members")
+    await cache.get(key, tags, compute)
+    print(f"{CONCURRENCY} reads of a stale entry: {await burst(cache, key, tags, compute)} recomputation(s)")
+    print(cache.stats())
+
+def main():
+    seed()
+    asyncio.run(run())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark: admin home page as seven endpoint calls vs. one /admin/dashboard/overview
+
+Seeds MEMBERS members and times loading every home page section through the
+individual endpoints and through the overview endpoint, in process, with the
+dashboard cache disabled (every section recomputed) and enabled.
+
+Run: python -m benchmarks.bench_dashboard_overview
+Point BENCH_DATABASE_URL at PostgreSQL to see the sections overlap; SQLite on
+one core mostly shows the saved per-request overhead.
+"""
+from benchmarks.common import create_admin, report, timed, ADMIN_EMAIL, ADMIN_PASSWORD
+from datetime import datetime, timedelta
+import os
+
+MEMBERS = int(os.getenv("BENCH_MEMBERS", "200000"))
+ITERATIONS = int(os.getenv("BENCH_ITERATIONS", "30"))
+BATCH_SIZE = 50000
+HOME_PAGE_ENDPOINTS = [
+    "/admin/dashboard/summary",
+    "/admin/dashboard/monthly-trends",
+    "/admin/dashboard/district-distribution",
+    "/admin/members/summary",
+    "/admin/donations/summary",
+    "/admin/complaints/summary",
+    "/admin/gallery/summary"
+]
+
+def seed():
+    from app.database import SessionLocal, engine
+    from app.migrations import upgrade
+    from app.rollups import rebuild_rollups
+    from app.models import Member
+    
+    upgrade(engine)
+    with SessionLocal() as db:
+        create_admin(db)
+    now = datetime.now()
+    states = ["Andhra Pradesh", "Telangana", "Karnataka", "Tamil Nadu"]
+    statuses = ["pending", "approved", "rejected"]
+    with engine.begin() as conn:
+        for offset in range(0, MEMBERS, BATCH_SIZE):
+            conn.execute(Member.__table__.insert(), [
+                {
+                    "membership_id": f"MEM{i:08d}", "name": f"Member {i}", "phone": f"9{i:09d}",
+                    "email": f"member{i}@example.com", "aadhaar": f"{i:012d}", "state": states[i % 4],
+                    "district": f"District {i % 40}", "mandal": f"Mandal {i % 600}", "status": statuses[i % 3],
+                    "is_active": True, "id_card_generated": i % 5 == 0, "created_at": now - timedelta(minutes=i)
+                }
+                for i in range(offset, min(offset + BATCH_SIZE, MEMBERS))
+            ])
+        rebuild_rollups(conn)
+
+def main():
+    seed()
+    from fastapi.testclient import TestClient
+    from app.dashboard_cache import dashboard_cache
+    from app.main import app
+    
+    with TestClient(app) as client:
+        token = client.post("/admin/login", json={"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD}).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        
+        def separate():
+            for endpoint in HOME_PAGE_ENDPOINTS:
+                client.get(endpoint, headers=headers).raise_for_status()
+        
+        def overview():
+            client.get("/admin/dashboard/overview", headers=headers).raise_for_status()
+        
+        for enabled in (False, True):
+            dashboard_cache.enabled = enabled
+            state = "cached" if enabled else "uncached"
+            separate()
+            report(f"seven endpoints, {state}", timed(separate, ITERATIONS))
+            overview()
+            report(f"overview, {state}", timed(overview, ITERATIONS))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark: dashboard summary from the daily rollups vs. six queries on the fact tables
+
+Seeds MEMBERS members (default one million) plus donations and complaints,
+builds the daily rollups, then times app.dashboard.get_dashboard_summary
+against the original implementation (six separate COUNT/SUM queries over
+members, donations and complaints, reproduced below) on the same async session.
+
+Run: python -m benchmarks.bench_dashboard_summary
+Point BENCH_DATABASE_URL at PostgreSQL for production-like numbers. Seeding a
+million rows into SQLite takes a minute or two.
+"""
+from benchmarks.common import report
+from datetime import datetime, timedelta
+from sqlalchemy import select, func
+import asyncio
+import os
+import time
+
+MEMBERS = int(os.getenv("BENCH_MEMBERS", "1000000"))
+ITERATIONS = int(os.getenv("BENCH_ITERATIONS", "20"))
+BATCH_SIZE = 50000
+
+def seed():
+    from app.database import engine
+    from app.migrations import upgrade
+    from app.rollups import rebuild_rollups
+    from app.models import Member, Donation, Complaint
+    
+    upgrade(engine)
+    now = datetime.now()
+    states = ["Andhra Pradesh", "Telangana", "Karnataka", "Tamil Nadu"]
+    statuses = ["pending", "approved", "rejected"]
+    started_at = time.perf_counter()
+    with engine.begin() as conn:
+        for offset in range(0, MEMBERS, BATCH_SIZE):
+            conn.execute(Member.__table__.insert(), [
+                {
+                    "membership_id": f"MEM{i:08d}", "name": f"Member {i}", "phone": f"9{i:09d}",
+                    "email": f"member{i}@example.com", "aadhaar": f"{i:012d}", "state": states[i % 4],
+                    "district": f"District {i % 40}", "mandal": f"Mandal {i % 600}", "status": statuses[i % 3],
+                    "is_active": True, "id_card_generated": i % 5 == 0, "created_at": now - timedelta(minutes=i)
+                }
+                for i in range(offset, min(offset + BATCH_SIZE, MEMBERS))
+            ])
+        conn.execute(Donation.__table__.insert(), [
+            {
+                "donor_name": f"Donor {i}", "donor_email": f"donor{i}@example.com", "phone_number": f"8{i:09d}",
+                "amount": 100 + i % 900, "payment_method": "upi", "transaction_id": f"TXN{i:08d}",
+                "status": ["pending", "verified", "acknowledged"][i % 3], "created_at": now - timedelta(minutes=i)
+            }
+            for i in range(MEMBERS // 10)
+        ])
+        conn.execute(Complaint.__table__.insert(), [
+            {
+                "complainant_name": f"Person {i}", "email": f"person{i}@example.com", "phone": f"7{i:09d}",
+                "address": "Address", "type": "Other", "subject": f"Subject {i}", "description": "Description",
+                "reference_id": f"MMN-CMP-{i:08d}", "status": ["pending", "in_progress", "resolved"][i % 3],
+                "created_at": now - timedelta(minutes=i), "updated_at": now
+            }
+            for i in range(MEMBERS // 10)
+        ])
+        rebuild_rollups(conn)
+    print(f"seeded {MEMBERS} members in {time.perf_counter() - started_at:.1f}s")
+
+async def six_queries(db):
+    """The summary as it was computed before: one round trip per figure"""
+    from app.models import Member, Donation, Complaint
+    
+    current_month_start = datetime.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    total_members = await db.scalar(select(func.count()).select_from(Member))
+    members_growth = await db.scalar(
+        select(func.count()).select_from(Member).where(Member.created_at >= current_month_start)
+    )
+    result = await db.execute(
+        select(func.sum(Donation.amount), func.count(Donation.id)).where(Donation.status == "verified")
+    )
+    donation_stats = result.first()
+    total_complaints = await db.scalar(select(func.count()).select_from(Complaint))
+    pending_complaints = await db.scalar(
+        select(func.count()).select_from(Complaint).where(Complaint.status == "pending")
+    )
+    active_members = await db.scalar(
+        select(func.count()).select_from(Member).where(Member.id_card_generated == True)
+    )
+    return (
+        total_members, members_growth, float(donation_stats[0] or 0), donation_stats[1],
+        total_complaints, pending_complaints, active_members
+    )
+
+async def measure(label, fn):
+    from app.database import AsyncSessionLocal
+    
+    samples = []
+    async with AsyncSessionLocal() as db:
+        await fn(db)
+        for _ in range(ITERATIONS):
+            start = time.perf_counter()
+            await fn(db)
+            samples.append((time.perf_counter() - start) * 1000)
+    report(label, samples)
+
+async def run():
+    from app.dashboard import get_dashboard_summary
+    from app.database import AsyncSessionLocal
+    
+    async with AsyncSessionLocal() as db:
+        summary = await get_dashboard_summary(db)
+        expected = await six_queries(db)
+    current = (
+        summary.total_members, summary.members_growth, summary.total_donations, summary.donation_count,
+        summary.total_complaints, summary.pending_complaints, summary.active_members
+    )
+    assert current == expected, (current, expected)
+    
+    await measure("six queries (previous)", six_queries)
+    await measure("rollups, one statement (current)", get_dashboard_summary)
+
+def main():
+    seed()
+    asyncio.run(run())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark: donations export as CSV, Parquet, NDJSON.gz and NDJSON.zst
+
+Seeds DONATIONS donations and writes the full export in each format to a
+file, the way a background export job does. Reports the export time, the
+file size and how long pandas takes to load the file, which is where the
+analysts spend their time, plus the dtypes each format gives amount and
+created_at. Formats whose optional package is missing are skipped.
+
+Requires pandas. Run: python -m benchmarks.bench_export_formats
+"""
+from benchmarks.common import BENCH_DIR
+from datetime import datetime, timedelta
+import asyncio
+import os
+import time
+
+DONATIONS = int(os.getenv("BENCH_DONATIONS", "500000"))
+BATCH_SIZE = 50000
+
+def seed():
+    from app.database import engine
+    from app.migrations import upgrade
+    from app.models import Donation
+    
+    upgrade(engine)
+    now = datetime.now()
+    statuses = ["pending", "verified", "acknowledged", "failed"]
+    methods = ["bank_transfer", "upi", "cash", "cheque", "online_payment"]
+    started_at = time.perf_counter()
+    with engine.begin() as conn:
+        for offset in range(0, DONATIONS, BATCH_SIZE):
+            conn.execute(Donation.__table__.insert(), [
+                {
+                    "donor_name": f"Donor {i}", "donor_email": f"donor{i}@example.com", "phone_number": f"9{i:09d}",
+                    "amount": round(100 + (i * 37) % 100000 + (i % 100) / 100, 2), "payment_method": methods[i % 5],
+                    "transaction_id": f"TXN{i:010d}", "status": statuses[i % 4], "created_at": now - timedelta(minutes=i)
+                }
+                for i in range(offset, min(offset + BATCH_SIZE, DONATIONS))
+            ])
+    print(f"seeded {DONATIONS} donations in {time.perf_counter() - started_at:.1f}s")
+
+def load(path: str, export_format: str):
+    import pandas as pd
+    
+    if export_format == "csv":
+        return pd.read_csv(path)
+    if export_format == "parquet":
+        return pd.read_parquet(path)
+    return pd.read_json(path, lines=True, compression="gzip" if export_format == "ndjson.gz" else "zstd")
+
+async def run():
+    from app.database import AsyncSessionLocal
+    from app.donations import get_donations_export
+    from app.exports import stream_export, get_export_filename, get_missing_dependency, EXPORT_FORMATS
+    from app.schemas import DonationFilters
+    
+    export = get_donations_export(DonationFilters())
+    for export_format in EXPORT_FORMATS:
+        missing = get_missing_dependency(export_format)
+        if missing:
+            print(f"{export_format:<11} skipped, {missing} is not installed")
+            continue
+        path = os.path.join(BENCH_DIR, get_export_filename(export, export_format))
+        started_at = time.perf_counter()
+        with open(path, "wb") as output:
+            async for chunk in stream_export(AsyncSessionLocal, export, export_format):
+                output.write(chunk)
+        export_ms = (time.perf_counter() - started_at) * 1000
+        
+        started_at = time.perf_counter()
+        frame = load(path, export_format)
+        load_ms = (time.perf_counter() - started_at) * 1000
+        assert len(frame) == DONATIONS, export_format
+        amount, created_at = frame.columns[2], frame.columns[-1]
+        print(f"{export_format:<11} export={export_ms:9.1f}ms  size={os.path.getsize(path) / 1e6:7.1f}MB  "
+              f"pandas load={load_ms:8.1f}ms  {amount}: {frame[amount].dtype}, {created_at}: {frame[created_at].dtype}")
+
+def main():
+    seed()
+    asyncio.run(run())
+
+if __name__ == "__main__":
+    main()
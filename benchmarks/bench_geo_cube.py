@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark: geography drill-down from the in-memory cube vs. GROUP BY on members
+
+Seeds MEMBERS members over 4 states, 40 districts and 600 mandals, builds the
+cube, then times each drill-down step (states, districts of a state, mandals
+of a district by status, months of a state) both as ad-hoc queries and as
+cube lookups. Results are checked for equality. The filter options, which
+always come from the database, are timed for reference.
+
+Run: python -m benchmarks.bench_geo_cube
+"""
+from benchmarks.common import report
+from datetime import datetime, timedelta
+from sqlalchemy import select, func
+import asyncio
+import os
+import time
+
+MEMBERS = int(os.getenv("BENCH_MEMBERS", "1000000"))
+ITERATIONS = int(os.getenv("BENCH_ITERATIONS", "20"))
+BATCH_SIZE = 50000
+STATES = ["Andhra Pradesh", "Telangana", "Karnataka", "Tamil Nadu"]
+
+def seed():
+    from app.database import engine
+    from app.migrations import upgrade
+    from app.models import Member
+    
+    upgrade(engine)
+    now = datetime.now()
+    statuses = ["pending", "approved", "rejected"]
+    started_at = time.perf_counter()
+    with engine.begin() as conn:
+        for offset in range(0, MEMBERS, BATCH_SIZE):
+            conn.execute(Member.__table__.insert(), [
+                {
+                    "membership_id": f"MEM{i:08d}", "name": f"Member {i}", "phone": f"9{i:09d}",
+                    "email": f"member{i}@example.com", "aadhaar": f"{i:012d}",
+                    # Mandal determines district determines state, as in real data
+                    "state": STATES[i % 600 % 40 % 4], "district": f"District {i % 600 % 40}",
+                    "mandal": f"Mandal {i % 600}", "status": statuses[i % 3],
+                    "is_active": True, "id_card_generated": False, "created_at": now - timedelta(minutes=i)
+                }
+                for i in range(offset, min(offset + BATCH_SIZE, MEMBERS))
+            ])
+    print(f"seeded {MEMBERS} members in {time.perf_counter() - started_at:.1f}s")
+
+async def measure(label, fn):
+    samples = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    report(label, samples)
+
+async def run():
+    from app.database import AsyncSessionLocal
+    from app.geo_cube import geo_cube
+    from app.members import get_filter_options
+    from app.models import Member
+    
+    started_at = time.perf_counter()
+    await geo_cube.build()
+    print(f"cube built in {(time.perf_counter() - started_at) * 1000:.1f}ms: {geo_cube.stats()}")
+    
+    state, district = "Telangana", "District 1"
+    steps = [
+        (
+            "states",
+            select(Member.state, func.count()).group_by(Member.state),
+            lambda: geo_cube.query(),
+            lambda row: (row["state"], row["member_count"])
+        ),
+        (
+            "districts of a state",
+            select(Member.district, func.count()).where(Member.state == state).group_by(Member.district),
+            lambda: geo_cube.query(state=state),
+            lambda row: (row["district"], row["member_count"])
+        ),
+        (
+            "mandals x status",
+            select(Member.mandal, Member.status, func.count()).where(
+                Member.state == state, Member.district == district
+            ).group_by(Member.mandal, Member.status),
+            lambda: geo_cube.query(state=state, district=district, by=("mandal", "status")),
+            lambda row: (row["mandal"], row["status"], row["member_count"])
+        ),
+        (
+            "districts x month",
+            select(Member.district, func.strftime("%Y-%m", Member.created_at), func.count()).where(
+                Member.state == state
+            ).group_by(Member.district, func.strftime("%Y-%m", Member.created_at)),
+            lambda: geo_cube.query(state=state, by=("district", "month")),
+            lambda row: (row["district"], row["month"], row["member_count"])
+        )
+    ]
+    
+    async with AsyncSessionLocal() as db:
+        for label, statement, cube_query, key in steps:
+            if label == "districts x month" and db.get_bind().dialect.name != "sqlite":
+                continue
+            result = await db.execute(statement)
+            expected = sorted(tuple(row) for row in result.all())
+            assert sorted(key(row) for row in cube_query()["rows"]) == expected, label
+            
+            async def group_by():
+                await db.execute(statement)
+            
+            async def cube():
+                cube_query()
+            
+            await measure(f"{label}, GROUP BY", group_by)
+            await measure(f"{label}, cube", cube)
+        
+        await measure("filter options, DISTINCT", lambda: get_filter_options(db))
+
+def main():
+    seed()
+    asyncio.run(run())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark: import time of the app and the scripts that share its modules
+
+Runs `python -X importtime -c "import <module>"` RUNS times per module in a
+fresh interpreter, reports the median cumulative import time and lists the
+heaviest direct imports of app.main.
+
+Run: python -m benchmarks.bench_import_time
+For CI, set BENCH_IMPORT_BUDGET_MS; the script exits with status 1 when the
+median import time of app.main exceeds it.
+"""
+from benchmarks.common import percentile
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = int(os.getenv("BENCH_RUNS", "5"))
+IMPORT_BUDGET_MS = float(os.getenv("BENCH_IMPORT_BUDGET_MS", "0"))
+MODULES = ["app.main", "app.database", "app.auth", "app.s3_storage"]
+TOP_PACKAGES = 10
+
+# "import time: self [us] | cumulative | imported package"
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+def import_profile(module: str):
+    """Cumulative import time (ms) of `import module` and of each of its direct imports"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, cwd=REPO_DIR, env=os.environ.copy()
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+    # Children are printed before their parent, indented two spaces per level
+    children = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        depth = len(match.group(3)) // 2
+        elapsed = int(match.group(2)) / 1000
+        if depth == 1:
+            children[match.group(4)] = elapsed
+        elif depth == 0:
+            if match.group(4) == module:
+                return elapsed, children
+            children = {}
+    raise RuntimeError(f"no importtime entry for {module}")
+
+def main():
+    print(f"median of {RUNS} fresh interpreters")
+    app_children = []
+    app_median = 0.0
+    for module in MODULES:
+        profiles = [import_profile(module) for _ in range(RUNS)]
+        samples = [elapsed for elapsed, _ in profiles]
+        print(f"import {module:<20} p50={percentile(samples, 50):8.1f}ms  max={max(samples):8.1f}ms")
+        if module == "app.main":
+            app_children = [children for _, children in profiles]
+            app_median = statistics.median(samples)
+    
+    print("\nheaviest direct imports of app.main")
+    names = {name for children in app_children for name in children}
+    medians = {name: statistics.median(children.get(name, 0.0) for children in app_children) for name in names}
+    for name, elapsed in sorted(medians.items(), key=lambda item: item[1], reverse=True)[:TOP_PACKAGES]:
+        print(f"  {name:<32} {elapsed:8.1f}ms")
+    
+    if IMPORT_BUDGET_MS and app_median > IMPORT_BUDGET_MS:
+        print(f"\nFAIL: app.main imports in {app_median:.1f}ms, budget is {IMPORT_BUDGET_MS:.1f}ms")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
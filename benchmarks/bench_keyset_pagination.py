@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark: OFFSET vs. keyset (cursor) pagination of the members list
+
+Seeds MEMBERS members, three per created_at second so the id tie-breaker
+matters, then times fetching page 1 and page DEEP_PAGE with OFFSET and with
+the cursor handed out by the page before it, unfiltered and filtered by
+status. Deep pages from both methods are checked for equality.
+
+Run: python -m benchmarks.bench_keyset_pagination
+"""
+from benchmarks.common import report
+from datetime import datetime, timedelta
+from sqlalchemy import select, func
+import asyncio
+import os
+import time
+
+MEMBERS = int(os.getenv("BENCH_MEMBERS", "250000"))
+ITERATIONS = int(os.getenv("BENCH_ITERATIONS", "20"))
+PAGE_SIZE = int(os.getenv("BENCH_PAGE_SIZE", "20"))
+DEEP_PAGE = int(os.getenv("BENCH_DEEP_PAGE", "10000"))
+BATCH_SIZE = 50000
+
+def seed():
+    from app.database import engine
+    from app.migrations import upgrade
+    from app.models import Member
+    
+    upgrade(engine)
+    now = datetime.now()
+    statuses = ["pending", "approved", "rejected"]
+    started_at = time.perf_counter()
+    with engine.begin() as conn:
+        for offset in range(0, MEMBERS, BATCH_SIZE):
+            conn.execute(Member.__table__.insert(), [
+                {
+                    "membership_id": f"MEM{i:08d}", "name": f"Member {i}", "phone": f"9{i:09d}",
+                    "email": f"member{i}@example.com", "aadhaar": f"{i:012d}", "state": "Telangana",
+                    "district": f"District {i % 40}", "mandal": f"Mandal {i % 600}", "status": statuses[i % 3],
+                    "is_active": True, "id_card_generated": False, "created_at": now - timedelta(seconds=i // 3)
+                }
+                for i in range(offset, min(offset + BATCH_SIZE, MEMBERS))
+            ])
+    print(f"seeded {MEMBERS} members in {time.perf_counter() - started_at:.1f}s")
+
+async def measure(label, fn):
+    samples = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    report(label, samples)
+
+async def run():
+    from app.database import AsyncSessionLocal
+    from app.models import Member
+    from app.pagination import paginate
+    
+    async with AsyncSessionLocal() as db:
+        for label, conditions in [("all", []), ("status=approved", [Member.status == "approved"])]:
+            rows = await db.scalar(select(func.count()).select_from(Member).where(*conditions))
+            deep_page = min(DEEP_PAGE, rows // PAGE_SIZE)
+            before = await paginate(db, Member, conditions, deep_page - 1, PAGE_SIZE)
+            by_offset = await paginate(db, Member, conditions, deep_page, PAGE_SIZE)
+            by_cursor = await paginate(db, Member, conditions, 1, PAGE_SIZE, before.next_cursor)
+            assert [member.id for member in by_offset.items] == [member.id for member in by_cursor.items], label
+            
+            await measure(f"{label}, page 1", lambda: paginate(db, Member, conditions, 1, PAGE_SIZE))
+            await measure(f"{label}, page {deep_page}, OFFSET",
+                          lambda: paginate(db, Member, conditions, deep_page, PAGE_SIZE))
+            await measure(f"{label}, page {deep_page}, cursor",
+                          lambda: paginate(db, Member, conditions, 1, PAGE_SIZE, before.next_cursor))
+
+def main():
+    seed()
+    asyncio.run(run())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark: members list total in each count mode
+
+Seeds MEMBERS members and times count_rows for an unfiltered list, a status
+filter and a free-text search, in exact, cached, estimated and capped mode
+(after ANALYZE, so SQLite has table statistics to estimate from).
+
+Run: python -m benchmarks.bench_list_counts
+"""
+from benchmarks.common import report
+from datetime import datetime, timedelta
+from sqlalchemy import text
+import asyncio
+import os
+import time
+
+MEMBERS = int(os.getenv("BENCH_MEMBERS", "500000"))
+ITERATIONS = int(os.getenv("BENCH_ITERATIONS", "20"))
+BATCH_SIZE = 50000
+
+def seed():
+    from app.database import engine
+    from app.migrations import upgrade
+    from app.models import Member
+    
+    upgrade(engine)
+    now = datetime.now()
+    statuses = ["pending", "approved", "rejected"]
+    started_at = time.perf_counter()
+    with engine.begin() as conn:
+        for offset in range(0, MEMBERS, BATCH_SIZE):
+            conn.execute(Member.__table__.insert(), [
+                {
+                    "membership_id": f"MEM{i:08d}", "name": f"Member {i}", "phone": f"9{i:09d}",
+                    "email": f"member{i}@example.com", "aadhaar": f"{i:012d}", "state": "Telangana",
+                    "district": f"District {i % 40}", "mandal": f"Mandal {i % 600}", "status": statuses[i % 3],
+                    "is_active": True, "id_card_generated": False, "created_at": now - timedelta(minutes=i)
+                }
+                for i in range(offset, min(offset + BATCH_SIZE, MEMBERS))
+            ])
+        conn.execute(text("ANALYZE"))
+    print(f"seeded {MEMBERS} members in {time.perf_counter() - started_at:.1f}s")
+
+async def measure(label, fn):
+    samples = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        result = await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    report(f"{label} -> {result.total}{'' if result.exact else ' (approx)'}", samples)
+
+async def run():
+    from app.database import AsyncSessionLocal
+    from app.counts import count_rows, COUNT_MODES
+    from app.members import get_member_conditions
+    from app.models import Member
+    from app.schemas import MemberFilters
+    
+    async with AsyncSessionLocal() as db:
+        dialect = db.get_bind().dialect.name
+        for label, filters in [
+            ("all", MemberFilters()),
+            ("status=approved", MemberFilters(status="approved")),
+            ("search 'Member 1'", MemberFilters(search="Member 1"))
+        ]:
+            conditions, _ = get_member_conditions(filters, dialect)
+            for mode in COUNT_MODES:
+                await measure(
+                    f"{label}, {mode}",
+                    lambda: count_rows(db, "members", Member, conditions, filters.model_dump(), mode)
+                )
+
+def main():
+    seed()
+    asyncio.run(run())
+
+if __name__ == "__main__":
+    main()
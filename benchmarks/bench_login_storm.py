@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Load test: authenticated latency while a login storm is in progress
+
+Starts uvicorn on a throwaway database, measures GET /admin/dashboard/summary
+latency (with a token issued beforehand) on its own, then again while
+LOGIN_CLIENTS threads hammer /admin/login. With bcrypt on the event loop the
+p99 during the storm jumps by hundreds of milliseconds. With the password pool
+it should stay within MAX_P99_RATIO of the quiet p99; the benchmark exits with
+status 1 when it does not.
+
+On a machine with few cores the hashing threads still compete with the event
+loop for CPU, which is what PASSWORD_HASH_WORKERS (half the cores) and
+PASSWORD_HASH_NICE are for. The load generator shares the machine too, so
+some of the remaining spread is the client's own.
+
+Run: python -m benchmarks.bench_login_storm
+Requires httpx.
+"""
+from benchmarks.common import BENCH_DIR, create_admin, report, percentile, ADMIN_EMAIL, ADMIN_PASSWORD
+from concurrent.futures import ThreadPoolExecutor
+import httpx
+import os
+import subprocess
+import sys
+import threading
+import time
+
+PORT = int(os.getenv("BENCH_PORT", "8765"))
+BASE_URL = f"http://127.0.0.1:{PORT}"
+LOGIN_CLIENTS = int(os.getenv("BENCH_LOGIN_CLIENTS", "16"))
+PROBE_REQUESTS = int(os.getenv("BENCH_PROBE_REQUESTS", "300"))
+MAX_P99_RATIO = float(os.getenv("BENCH_MAX_P99_RATIO", "2.5"))
+
+def start_server():
+    from app.database import SessionLocal, engine
+    from app.migrations import upgrade
+    
+    upgrade(engine)
+    db = SessionLocal()
+    create_admin(db)
+    db.close()
+    
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(PORT), "--log-level", "warning"],
+        env=os.environ.copy(),
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    for _ in range(100):
+        try:
+            httpx.get(f"{BASE_URL}/public/gallery")
+            return server
+        except httpx.TransportError:
+            time.sleep(0.1)
+    server.terminate()
+    raise RuntimeError("server did not start")
+
+def probe(client, headers):
+    samples = []
+    for _ in range(PROBE_REQUESTS):
+        start = time.perf_counter()
+        response = client.get(f"{BASE_URL}/admin/dashboard/summary", headers=headers)
+        samples.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200, response.status_code
+    return samples
+
+def login_storm(stop, counts):
+    with httpx.Client(timeout=30) as client:
+        while not stop.is_set():
+            response = client.post(f"{BASE_URL}/admin/login", json={"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD})
+            counts[response.status_code] = counts.get(response.status_code, 0) + 1
+
+def main():
+    server = start_server()
+    try:
+        with httpx.Client(timeout=30) as client:
+            response = client.post(f"{BASE_URL}/admin/login", json={"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD})
+            headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+            probe(client, headers)
+            quiet = probe(client, headers)
+            
+            stop = threading.Event()
+            counts = {}
+            with ThreadPoolExecutor(max_workers=LOGIN_CLIENTS) as pool:
+                for _ in range(LOGIN_CLIENTS):
+                    pool.submit(login_storm, stop, counts)
+                time.sleep(1)
+                storm = probe(client, headers)
+                stop.set()
+        
+        print(f"Database: {BENCH_DIR}, {LOGIN_CLIENTS} concurrent login clients")
+        report("GET dashboard summary (quiet)", quiet)
+        report("GET dashboard summary (storm)", storm)
+        ratio = percentile(storm, 99) / percentile(quiet, 99)
+        print(f"p99 ratio storm/quiet: {ratio:.2f}x (bound {MAX_P99_RATIO:.1f}x)")
+        print(f"Login responses during storm: {counts}")
+    finally:
+        server.terminate()
+        server.wait()
+    if ratio > MAX_P99_RATIO:
+        print(f"FAIL: authenticated p99 during the storm is {ratio:.2f}x the quiet p99 (bound {MAX_P99_RATIO:.1f}x)")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark: planned member search vs. the five-column ILIKE scan
+
+Seeds MEMBERS members (the search index is filled by its triggers), then for
+a few typical terms times the members list query (count plus first ranked
+page) with the old ILIKE condition and with plan_member_search. Identifiers
+are routed to an indexed lookup, free text to the trigram index. Match
+counts of free-text plans are checked against ILIKE; identifier lookups
+are exact, so they drop the substring hits ILIKE also returns.
+
+Run: python -m benchmarks.bench_member_search
+"""
+from benchmarks.common import report
+from datetime import datetime, timedelta
+from sqlalchemy import select, func
+import asyncio
+import os
+import time
+
+MEMBERS = int(os.getenv("BENCH_MEMBERS", "200000"))
+ITERATIONS = int(os.getenv("BENCH_ITERATIONS", "20"))
+BATCH_SIZE = 50000
+PAGE_SIZE = 20
+FIRST_NAMES = ["Ravi", "Lakshmi", "Srinivas", "Padma", "Venkat", "Anitha", "Suresh", "Kavya"]
+TERMS = [
+    ("name, common", "Lakshmi"),
+    ("name, rare", "Venkat Reddy 4242"),
+    ("phone fragment", "9000012"),
+    ("email", "member77777@example.com"),
+    ("membership id", "MEM00123456"),
+    ("aadhaar", "000000123456"),
+    ("phone", "9000123456")
+]
+
+def seed():
+    from app.database import engine
+    from app.migrations import upgrade
+    from app.models import Member
+    
+    upgrade(engine)
+    now = datetime.now()
+    started_at = time.perf_counter()
+    with engine.begin() as conn:
+        for offset in range(0, MEMBERS, BATCH_SIZE):
+            conn.execute(Member.__table__.insert(), [
+                {
+                    "membership_id": f"MEM{i:08d}", "name": f"{FIRST_NAMES[i % 8]} Reddy {i}", "phone": f"9{i:09d}",
+                    "email": f"member{i}@example.com", "aadhaar": f"{i:012d}", "state": "Telangana",
+                    "district": f"District {i % 40}", "mandal": f"Mandal {i % 600}", "status": "approved",
+                    "is_active": True, "id_card_generated": False, "created_at": now - timedelta(minutes=i)
+                }
+                for i in range(offset, min(offset + BATCH_SIZE, MEMBERS))
+            ])
+    print(f"seeded {MEMBERS} members in {time.perf_counter() - started_at:.1f}s")
+
+async def measure(label, fn):
+    samples = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    report(label, samples)
+
+async def run():
+    from app.database import AsyncSessionLocal
+    from app.models import Member
+    from app.search import plan_member_search, get_ilike_condition
+    
+    async with AsyncSessionLocal() as db:
+        dialect = db.get_bind().dialect.name
+        for label, term in TERMS:
+            plan = plan_member_search(term, dialect)
+            plans = [
+                ("ILIKE", get_ilike_condition(term), []),
+                (f"planned as {plan.route}", plan.condition, plan.order_by)
+            ]
+            totals = []
+            for method, condition, ranking in plans:
+                async def search():
+                    total = await db.scalar(select(func.count()).select_from(Member).where(condition))
+                    page = await db.scalars(
+                        select(Member).where(condition).order_by(*ranking, Member.created_at.desc()).limit(PAGE_SIZE)
+                    )
+                    page.all()
+                    return total
+                
+                totals.append(await search())
+                await measure(f"{label} ({totals[-1]} matches), {method}", search)
+            if plan.route == "text":
+                assert totals[0] == totals[1], label
+
+def main():
+    seed()
+    asyncio.run(run())
+
+if __name__ == "__main__":
+    main()
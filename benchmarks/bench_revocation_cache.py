@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark: authenticated request latency with and without the revocation cache
+
+Before timing, checks that a sync picks up revocations that commit out of
+order: a row with a lower id and an earlier created_at becoming visible after
+a later row has already been synced (two overlapping logouts on PostgreSQL).
+
+Run: python -m benchmarks.bench_revocation_cache
+Requires httpx (used by FastAPI's TestClient).
+"""
+from benchmarks.common import create_admin, timed, report, ADMIN_EMAIL, ADMIN_PASSWORD
+from fastapi.testclient import TestClient
+from datetime import datetime, timedelta, timezone
+import os
+import uuid
+
+REVOKED_TOKENS = int(os.getenv("BENCH_REVOKED_TOKENS", "50000"))
+ITERATIONS = int(os.getenv("BENCH_ITERATIONS", "2000"))
+
+def seed_blacklist(db, count):
+    from app.models import TokenBlacklist
+    
+    expires_at = datetime.now(timezone.utc) + timedelta(minutes=30)
+    db.bulk_save_objects([TokenBlacklist(jti=uuid.uuid4().hex, expires_at=expires_at) for _ in range(count)])
+    db.commit()
+
+def check_out_of_order_commits(session_factory):
+    """A revocation committed after a later one must still reach the cache"""
+    import asyncio
+    from app.database import AsyncSessionLocal
+    from app.models import TokenBlacklist
+    from app.revocation import RevocationCache
+    
+    cache = RevocationCache(sync_seconds=0)
+    expires_at = datetime.now(timezone.utc) + timedelta(minutes=30)
+    first, second = uuid.uuid4().hex, uuid.uuid4().hex
+    
+    async def sync():
+        async with AsyncSessionLocal() as db:
+            if cache.loaded:
+                await cache.sync(db)
+            else:
+                await cache.load(db)
+    
+    db = session_factory()
+    top_id = db.query(TokenBlacklist.id).order_by(TokenBlacklist.id.desc()).limit(1).scalar() or 0
+    # The second logout takes id N+1 and commits first...
+    db.add(TokenBlacklist(id=top_id + 2, jti=second, expires_at=expires_at))
+    db.commit()
+    asyncio.run(sync())
+    # ...then the first one, holding id N from a transaction that started earlier
+    db.add(TokenBlacklist(
+        id=top_id + 1, jti=first, expires_at=expires_at,
+        created_at=datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(seconds=2)
+    ))
+    db.commit()
+    db.close()
+    asyncio.run(sync())
+    assert cache.revoked(second) and cache.revoked(first), "revocation committed out of order was missed"
+    print("out-of-order revocations synced")
+
+def main():
+    from app.main import app
+    from app.database import SessionLocal
+    from app.revocation import revocation_cache
+    
+    with TestClient(app) as client:
+        db = SessionLocal()
+        create_admin(db)
+        seed_blacklist(db, REVOKED_TOKENS)
+        db.close()
+        check_out_of_order_commits(SessionLocal)
+        
+        response = client.post("/admin/login", json={"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD})
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        
+        def request():
+            assert client.get("/admin/dashboard", headers=headers).status_code == 200
+        
+        print(f"{REVOKED_TOKENS} revoked tokens, {ITERATIONS} requests per run")
+        
+        revocation_cache.enabled = False
+        timed(request, 100)
+        report("GET /admin/dashboard (no cache)", timed(request, ITERATIONS))
+        
+        revocation_cache.enabled = True
+        revocation_cache.loaded = False
+        timed(request, 100)
+        report("GET /admin/dashboard (cache)", timed(request, ITERATIONS))
+        print(revocation_cache.stats())
+
+if __name__ == "__main__":
+    main()
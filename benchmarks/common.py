@@ -0,0 +1,51 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Benchmarks run against a throwaway SQLite database unless BENCH_DATABASE_URL
+points somewhere else. Import this module before anything from app.* so the
+database URL is in place when app.database creates its engine.
+"""
+import os
+import statistics
+import tempfile
+import time
+
+BENCH_DIR = tempfile.mkdtemp(prefix="malamahanadu-bench-")
+os.environ["DATABASE_URL"] = os.getenv("BENCH_DATABASE_URL", f"sqlite:///{BENCH_DIR}/bench.db")
+
+ADMIN_EMAIL = "admin@example.com"
+ADMIN_PASSWORD = "admin123"
+
+def create_admin(db):
+    """Create the benchmark admin if it does not exist yet"""
+    from app.models import Admin
+    from app.auth import get_password_hash
+
+    admin = db.query(Admin).filter(Admin.email == ADMIN_EMAIL).first()
+    if not admin:
+        admin = Admin(email=ADMIN_EMAIL, hashed_password=get_password_hash(ADMIN_PASSWORD))
+        db.add(admin)
+        db.commit()
+    return admin
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+def timed(fn, iterations):
+    """Call fn repeatedly and return per-call latencies in milliseconds"""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+def report(label, samples):
+    print(
+        f"{label:<32} n={len(samples):<6} "
+        f"mean={statistics.mean(samples):8.3f}ms  "
+        f"p50={percentile(samples, 50):8.3f}ms  "
+        f"p99={percentile(samples, 99):8.3f}ms"
+    )
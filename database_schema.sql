@@ -1,6 +1,8 @@
 -- ============================================
 -- SQL QUERIES TO CREATE ALL TABLES
 -- Database: PostgreSQL / SQLite Compatible
+-- Snapshot of the schema after all migrations in app/migrations/.
+-- To create or upgrade a database run: python -m app.migrations upgrade
 -- ============================================
 
 -- 1. ADMINS TABLE
@@ -16,11 +18,14 @@ CREATE INDEX idx_admins_email ON admins(email);
 -- 2. TOKEN BLACKLIST TABLE
 CREATE TABLE token_blacklist (
     id SERIAL PRIMARY KEY,
-    token VARCHAR(500) UNIQUE NOT NULL,
+    jti VARCHAR(64) UNIQUE NOT NULL,
+    expires_at TIMESTAMP WITH TIME ZONE NOT NULL,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
 
-CREATE INDEX idx_token_blacklist_token ON token_blacklist(token);
+CREATE INDEX idx_token_blacklist_jti ON token_blacklist(jti);
+CREATE INDEX idx_token_blacklist_expires_at ON token_blacklist(expires_at);
+CREATE INDEX idx_token_blacklist_created_at ON token_blacklist(created_at);
 
 -- 3. MEMBERS TABLE
 CREATE TABLE members (
@@ -33,7 +38,7 @@ CREATE TABLE members (
     state VARCHAR(100) NOT NULL,
     district VARCHAR(100) NOT NULL,
     mandal VARCHAR(100) NOT NULL,
-    status VARCHAR(20) DEFAULT 'pending' CHECK (status IN ('pending', 'approved', 'rejected')),
+    status VARCHAR(20) DEFAULT 'pending',
     is_active BOOLEAN DEFAULT TRUE,
     id_card_generated BOOLEAN DEFAULT FALSE,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
@@ -54,7 +59,7 @@ CREATE TABLE member_applications (
     id SERIAL PRIMARY KEY,
     full_name VARCHAR(255) NOT NULL,
     father_husband_name VARCHAR(255) NOT NULL,
-    gender VARCHAR(10) NOT NULL CHECK (gender IN ('male', 'female', 'other')),
+    gender VARCHAR(10) NOT NULL,
     date_of_birth DATE NOT NULL,
     caste VARCHAR(100) NOT NULL,
     aadhaar_number VARCHAR(12) NOT NULL,
@@ -66,7 +71,7 @@ CREATE TABLE member_applications (
     village VARCHAR(100) NOT NULL,
     full_address TEXT NOT NULL,
     photo_path VARCHAR(500),
-    status VARCHAR(20) DEFAULT 'pending' CHECK (status IN ('pending', 'approved', 'rejected')),
+    status VARCHAR(20) DEFAULT 'pending',
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
 
@@ -82,10 +87,10 @@ CREATE TABLE donations (
     donor_email VARCHAR(255) NOT NULL,
     phone_number VARCHAR(20) NOT NULL,
     amount DECIMAL(10, 2) NOT NULL,
-    payment_method VARCHAR(50) NOT NULL CHECK (payment_method IN ('bank_transfer', 'upi', 'cash', 'cheque', 'online_payment')),
+    payment_method VARCHAR(50) NOT NULL,
     transaction_id VARCHAR(100) NOT NULL,
     notes TEXT,
-    status VARCHAR(20) DEFAULT 'pending' CHECK (status IN ('pending', 'verified', 'acknowledged', 'failed')),
+    status VARCHAR(20) DEFAULT 'pending',
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
 
@@ -101,12 +106,12 @@ CREATE TABLE complaints (
     email VARCHAR(255),
     phone VARCHAR(20) NOT NULL,
     address TEXT NOT NULL,
-    type VARCHAR(50) NOT NULL CHECK (type IN ('Healthcare', 'Education', 'Employment', 'Infrastructure', 'Social Welfare', 'Other')),
+    type VARCHAR(50) NOT NULL,
     subject VARCHAR(500) NOT NULL,
     description TEXT NOT NULL,
     reference_id VARCHAR(50) UNIQUE NOT NULL,
     supporting_document_path VARCHAR(500),
-    status VARCHAR(20) DEFAULT 'pending' CHECK (status IN ('pending', 'in_progress', 'resolved', 'closed')),
+    status VARCHAR(20) DEFAULT 'pending',
     admin_notes TEXT,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
@@ -125,13 +130,86 @@ CREATE TABLE gallery (
     title VARCHAR(255) NOT NULL,
     description TEXT,
     media_url VARCHAR(500) NOT NULL,
-    media_type VARCHAR(10) NOT NULL CHECK (media_type IN ('image', 'video')),
+    media_type VARCHAR(10) NOT NULL,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
 
 CREATE INDEX idx_gallery_title ON gallery(title);
 CREATE INDEX idx_gallery_media_type ON gallery(media_type);
 
+-- 8. DAILY ROLLUPS (maintained by the API write paths)
+CREATE TABLE member_daily_stats (
+    day DATE NOT NULL,
+    state VARCHAR(100) NOT NULL,
+    district VARCHAR(100) NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    member_count INTEGER NOT NULL DEFAULT 0,
+    active_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, state, district, status)
+);
+
+CREATE TABLE donation_daily_stats (
+    day DATE NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    donation_count INTEGER NOT NULL DEFAULT 0,
+    amount_total DECIMAL(14, 2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, status)
+);
+
+CREATE TABLE complaint_daily_stats (
+    day DATE NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    complaint_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, status)
+);
+
+-- 9. MEMBER SEARCH (trigram indexes, see app/search.py)
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX idx_members_name_trgm ON members USING GIN (name gin_trgm_ops);
+CREATE INDEX idx_members_membership_id_trgm ON members USING GIN (membership_id gin_trgm_ops);
+CREATE INDEX idx_members_phone_trgm ON members USING GIN (phone gin_trgm_ops);
+CREATE INDEX idx_members_email_trgm ON members USING GIN (email gin_trgm_ops);
+CREATE INDEX idx_members_aadhaar_trgm ON members USING GIN (aadhaar gin_trgm_ops);
+
+-- 10. LIST PAGINATION INDEXES (keyset on created_at, id, see app/pagination.py)
+CREATE INDEX idx_members_created_at_id ON members(created_at, id);
+CREATE INDEX idx_members_status_created_at_id ON members(status, created_at, id);
+CREATE INDEX idx_member_applications_created_at_id ON member_applications(created_at, id);
+CREATE INDEX idx_member_applications_status_created_at_id ON member_applications(status, created_at, id);
+CREATE INDEX idx_donations_created_at_id ON donations(created_at, id);
+CREATE INDEX idx_donations_status_created_at_id ON donations(status, created_at, id);
+CREATE INDEX idx_complaints_created_at_id ON complaints(created_at, id);
+CREATE INDEX idx_complaints_status_created_at_id ON complaints(status, created_at, id);
+CREATE INDEX idx_gallery_created_at_id ON gallery(created_at, id);
+CREATE INDEX idx_gallery_media_type_created_at_id ON gallery(media_type, created_at, id);
+
+-- 11. EXPORT JOBS (background CSV exports, see app/export_jobs.py)
+CREATE TABLE export_jobs (
+    id VARCHAR(32) PRIMARY KEY,
+    kind VARCHAR(20) NOT NULL,
+    format VARCHAR(20) NOT NULL DEFAULT 'csv',
+    filters TEXT NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'queued',
+    rows_written INTEGER NOT NULL DEFAULT 0,
+    total_rows INTEGER,
+    size BIGINT,
+    location VARCHAR(500),
+    error TEXT,
+    created_by INTEGER,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    started_at TIMESTAMP WITH TIME ZONE,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    finished_at TIMESTAMP WITH TIME ZONE
+);
+
+CREATE INDEX idx_export_jobs_status ON export_jobs(status);
+
+-- 12. EMAIL LOOKUP INDEXES (case-insensitive, see app/search.py)
+CREATE INDEX idx_members_email_lower ON members(lower(email));
+CREATE INDEX idx_donations_donor_email_lower ON donations(lower(donor_email));
+CREATE INDEX idx_complaints_email_lower ON complaints(lower(email));
+
 -- ============================================
 -- INSERT DEFAULT ADMIN USER
 -- Password: admin123 (bcrypt hashed)
@@ -142,7 +220,6 @@ INSERT INTO admins (email, hashed_password) VALUES
 -- ============================================
 -- NOTES:
 -- 1. For SQLite, replace SERIAL with INTEGER PRIMARY KEY AUTOINCREMENT
--- 2. For SQLite, remove CHECK constraints or use triggers
--- 3. For SQLite, TIMESTAMP WITH TIME ZONE becomes DATETIME
--- 4. Default admin password is: admin123
+-- 2. For SQLite, TIMESTAMP WITH TIME ZONE becomes DATETIME
+-- 3. Default admin password is: admin123
 -- ============================================
\ No newline at end of file
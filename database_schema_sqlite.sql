@@ -1,5 +1,7 @@
 -- ============================================
 -- SQL QUERIES FOR SQLite DATABASE
+-- Snapshot of the schema after all migrations in app/migrations/.
+-- To create or upgrade a database run: python -m app.migrations upgrade
 -- ============================================
 
 -- 1. ADMINS TABLE
@@ -15,11 +17,14 @@ CREATE INDEX idx_admins_email ON admins(email);
 -- 2. TOKEN BLACKLIST TABLE
 CREATE TABLE token_blacklist (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
-    token TEXT UNIQUE NOT NULL,
+    jti TEXT UNIQUE NOT NULL,
+    expires_at DATETIME NOT NULL,
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
 
-CREATE INDEX idx_token_blacklist_token ON token_blacklist(token);
+CREATE INDEX idx_token_blacklist_jti ON token_blacklist(jti);
+CREATE INDEX idx_token_blacklist_expires_at ON token_blacklist(expires_at);
+CREATE INDEX idx_token_blacklist_created_at ON token_blacklist(created_at);
 
 -- 3. MEMBERS TABLE
 CREATE TABLE members (
@@ -131,6 +136,94 @@ CREATE TABLE gallery (
 CREATE INDEX idx_gallery_title ON gallery(title);
 CREATE INDEX idx_gallery_media_type ON gallery(media_type);
 
+-- 8. DAILY ROLLUPS (maintained by the API write paths)
+CREATE TABLE member_daily_stats (
+    day DATE NOT NULL,
+    state TEXT NOT NULL,
+    district TEXT NOT NULL,
+    status TEXT NOT NULL,
+    member_count INTEGER NOT NULL DEFAULT 0,
+    active_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, state, district, status)
+);
+
+CREATE TABLE donation_daily_stats (
+    day DATE NOT NULL,
+    status TEXT NOT NULL,
+    donation_count INTEGER NOT NULL DEFAULT 0,
+    amount_total REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, status)
+);
+
+CREATE TABLE complaint_daily_stats (
+    day DATE NOT NULL,
+    status TEXT NOT NULL,
+    complaint_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, status)
+);
+
+-- 9. MEMBER SEARCH (FTS5 trigram index, see app/search.py)
+CREATE VIRTUAL TABLE members_fts USING fts5(
+    name, membership_id, phone, email, aadhaar,
+    content='members', content_rowid='id', tokenize='trigram'
+);
+
+CREATE TRIGGER members_fts_insert AFTER INSERT ON members BEGIN
+    INSERT INTO members_fts (rowid, name, membership_id, phone, email, aadhaar)
+    VALUES (new.id, new.name, new.membership_id, new.phone, new.email, new.aadhaar);
+END;
+
+CREATE TRIGGER members_fts_delete AFTER DELETE ON members BEGIN
+    INSERT INTO members_fts (members_fts, rowid, name, membership_id, phone, email, aadhaar)
+    VALUES ('delete', old.id, old.name, old.membership_id, old.phone, old.email, old.aadhaar);
+END;
+
+-- Status changes do not touch the index
+CREATE TRIGGER members_fts_update AFTER UPDATE OF name, membership_id, phone, email, aadhaar ON members BEGIN
+    INSERT INTO members_fts (members_fts, rowid, name, membership_id, phone, email, aadhaar)
+    VALUES ('delete', old.id, old.name, old.membership_id, old.phone, old.email, old.aadhaar);
+    INSERT INTO members_fts (rowid, name, membership_id, phone, email, aadhaar)
+    VALUES (new.id, new.name, new.membership_id, new.phone, new.email, new.aadhaar);
+END;
+
+-- 10. LIST PAGINATION INDEXES (keyset on created_at, id, see app/pagination.py)
+CREATE INDEX idx_members_created_at_id ON members(created_at, id);
+CREATE INDEX idx_members_status_created_at_id ON members(status, created_at, id);
+CREATE INDEX idx_member_applications_created_at_id ON member_applications(created_at, id);
+CREATE INDEX idx_member_applications_status_created_at_id ON member_applications(status, created_at, id);
+CREATE INDEX idx_donations_created_at_id ON donations(created_at, id);
+CREATE INDEX idx_donations_status_created_at_id ON donations(status, created_at, id);
+CREATE INDEX idx_complaints_created_at_id ON complaints(created_at, id);
+CREATE INDEX idx_complaints_status_created_at_id ON complaints(status, created_at, id);
+CREATE INDEX idx_gallery_created_at_id ON gallery(created_at, id);
+CREATE INDEX idx_gallery_media_type_created_at_id ON gallery(media_type, created_at, id);
+
+-- 11. EXPORT JOBS (background CSV exports, see app/export_jobs.py)
+CREATE TABLE export_jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    format TEXT NOT NULL DEFAULT 'csv',
+    filters TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    rows_written INTEGER NOT NULL DEFAULT 0,
+    total_rows INTEGER,
+    size INTEGER,
+    location TEXT,
+    error TEXT,
+    created_by INTEGER,
+    created_at DATETIME NOT NULL,
+    started_at DATETIME,
+    updated_at DATETIME NOT NULL,
+    finished_at DATETIME
+);
+
+CREATE INDEX idx_export_jobs_status ON export_jobs(status);
+
+-- 12. EMAIL LOOKUP INDEXES (case-insensitive, see app/search.py)
+CREATE INDEX idx_members_email_lower ON members(lower(email));
+CREATE INDEX idx_donations_donor_email_lower ON donations(lower(donor_email));
+CREATE INDEX idx_complaints_email_lower ON complaints(lower(email));
+
 -- ============================================
 -- INSERT DEFAULT ADMIN USER
 -- Email: admin@example.com
@@ -4,12 +4,13 @@
 Initialize database tables and create admin user
 """
 from app.database import SessionLocal, engine
-from app.models import Base, Admin
+from app.migrations import upgrade
+from app.models import Admin
 from app.auth import get_password_hash
 
 def init_database():
     print("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
+    upgrade(engine)
     print("[OK] Tables created successfully!")
     
     db = SessionLocal()